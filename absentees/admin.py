@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from workshop_manager.paginators import EstimatedCountPaginator
+
+from .models import Absence, Employee
+
+
+@admin.register(Employee)
+class EmployeeAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['^name']
+
+
+@admin.register(Absence)
+class AbsenceAdmin(admin.ModelAdmin):
+    list_display = ['employee', 'date', 'notes']
+    list_filter = ['date']
+    list_select_related = ['employee']
+    search_fields = ['^employee__name']
+    raw_id_fields = ['employee']
+    ordering = ['-date', '-id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -5,7 +5,7 @@ from .models import Employee, Absence
 class EmployeeForm(forms.ModelForm):
     class Meta:
         model = Employee
-        fields = ['name']
+        fields = ['name', 'is_technician']
 
 
 class AbsenceForm(forms.ModelForm):
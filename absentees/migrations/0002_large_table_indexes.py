@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('absentees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='absence',
+            index=models.Index(fields=['date'], name='absentees_absence_date_idx'),
+        ),
+    ]
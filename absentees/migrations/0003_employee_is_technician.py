@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('absentees', '0002_large_table_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='is_technician',
+            field=models.BooleanField(default=True),
+        ),
+    ]
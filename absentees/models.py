@@ -5,6 +5,8 @@ class Employee(models.Model):
     """An employee who can be marked absent."""
 
     name = models.CharField(max_length=200)
+    # Technicians can be assigned jobs and bookings (see assignments.planner)
+    is_technician = models.BooleanField(default=True)
     # Optional: later you can add role, phone, etc.
 
     class Meta:
@@ -24,6 +26,9 @@ class Absence(models.Model):
     class Meta:
         ordering = ['-date']
         unique_together = ('employee', 'date')
+        indexes = [
+            models.Index(fields=['date'], name='absentees_absence_date_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.employee.name} absent on {self.date}"
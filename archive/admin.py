@@ -0,0 +1,16 @@
+from django.contrib import admin
+from .models import ArchivedJob, ArchivedRadiator
+
+
+@admin.register(ArchivedJob)
+class ArchivedJobAdmin(admin.ModelAdmin):
+    list_display = ['customer_name', 'vehicle_registration', 'work_type', 'date_received', 'date_completed', 'archived_at']
+    search_fields = ['customer_name', 'vehicle_registration']
+    ordering = ['-created_at']
+
+
+@admin.register(ArchivedRadiator)
+class ArchivedRadiatorAdmin(admin.ModelAdmin):
+    list_display = ['name', 'part_type', 'customer_name', 'date_received', 'date_completed', 'archived_at']
+    search_fields = ['name', 'customer_name']
+    ordering = ['-created_at']
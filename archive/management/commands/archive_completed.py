@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from archive.services import ARCHIVES, archivable, archive_completed
+
+
+class Command(BaseCommand):
+    help = 'Move completed jobs and parts orders older than a given age into the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.ARCHIVE_AFTER_DAYS,
+            help='Archive records completed more than this many days ago (default: ARCHIVE_AFTER_DAYS)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Records moved per transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many records would move')
+
+    def handle(self, *args, **options):
+        for model in ARCHIVES:
+            name = model._meta.verbose_name_plural
+            if options['dry_run']:
+                count = archivable(model, options['days']).count()
+                self.stdout.write(f'{count} {name} would be archived')
+                continue
+            moved = archive_completed(model, options['days'], options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Archived {moved} {name}'))
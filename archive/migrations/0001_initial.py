@@ -0,0 +1,59 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJob',
+            fields=[
+                ('customer_name', models.CharField(max_length=200)),
+                ('contact_number', models.CharField(max_length=20)),
+                ('vehicle_registration', models.CharField(max_length=50)),
+                ('vehicle_make', models.CharField(max_length=100)),
+                ('vehicle_model', models.CharField(max_length=100)),
+                ('work_type', models.CharField(choices=[('repair', 'Repair'), ('service', 'Service'), ('radiator_replacement', 'Radiator Replacement'), ('other', 'Other')], max_length=50)),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('In Progress', 'In Progress'), ('Completed', 'Completed')], default='Pending', max_length=20)),
+                ('invoice_number', models.CharField(blank=True, max_length=100, null=True)),
+                ('date_completed', models.DateField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date_received', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedRadiator',
+            fields=[
+                ('name', models.CharField(help_text='Radiator Name/Model', max_length=200)),
+                ('part_type', models.CharField(choices=[('Radiator', 'Radiator'), ('Oil Cooler', 'Oil Cooler'), ('Intercooler', 'Intercooler'), ('Fuel Tank', 'Fuel Tank'), ('Other', 'Other')], default='Radiator', max_length=50)),
+                ('customer_name', models.CharField(blank=True, max_length=200, null=True)),
+                ('contact_number', models.CharField(blank=True, max_length=20, null=True)),
+                ('invoice_number', models.CharField(blank=True, max_length=100, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('In Progress', 'In Progress'), ('Completed', 'Completed')], default='Pending', max_length=20)),
+                ('date_completed', models.DateField(blank=True, null=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date_received', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
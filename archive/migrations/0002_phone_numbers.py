@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:24
+
+import customers.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedjob',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='archivedradiator',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(blank=True, max_length=20, null=True),
+        ),
+    ]
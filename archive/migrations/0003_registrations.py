@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:31
+
+import vehicles.fields
+from django.db import migrations, models
+
+from vehicles.fields import normalize_registration
+
+BATCH_SIZE = 1000
+# Written by booking_create for vehicle checkins created from a booking
+PLACEHOLDERS = {'TBD'}
+
+
+def normalize_registrations(apps, schema_editor):
+    """Store registrations uppercase without separators, and drop the "TBD" placeholder"""
+    model = apps.get_model('archive', 'ArchivedJob')
+    last_pk = None
+    while True:
+        page = model.objects.exclude(vehicle_registration__isnull=True).order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        batch = list(page.only('pk', 'vehicle_registration')[:BATCH_SIZE])
+        if not batch:
+            return
+        changed = []
+        for obj in batch:
+            registration = normalize_registration(obj.vehicle_registration)
+            if registration in PLACEHOLDERS:
+                registration = ''
+            if registration != obj.vehicle_registration:
+                obj.vehicle_registration = registration
+                changed.append(obj)
+        model.objects.bulk_update(changed, ['vehicle_registration'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0002_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedjob',
+            name='vehicle_registration',
+            field=vehicles.fields.RegistrationField(max_length=50),
+        ),
+        migrations.RunPython(normalize_registrations, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='archivedjob',
+            index=models.Index(fields=['vehicle_registration', 'date_received'], name='archive_job_registration_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import models
+from django.utils import timezone
+
+from jobs.models import JobBase
+from inventory.models import RadiatorBase
+
+
+class ArchivedJob(JobBase):
+    """A completed job moved out of the live table. Keeps the original id and timestamps."""
+
+    id = models.BigIntegerField(primary_key=True)
+    date_received = models.DateField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['vehicle_registration', 'date_received'], name='archive_job_registration_idx'),
+        ]
+
+
+class ArchivedRadiator(RadiatorBase):
+    """A completed parts order moved out of the live table. Keeps the original id and timestamps."""
+
+    id = models.BigIntegerField(primary_key=True)
+    date_received = models.DateField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from audit import recorder
+from bookings.models import Booking
+from reports import rollups
+from inventory.models import Radiator
+from jobs.models import Job
+
+from .models import ArchivedJob, ArchivedRadiator
+
+# live model -> archive model
+ARCHIVES = {
+    Job: ArchivedJob,
+    Radiator: ArchivedRadiator,
+}
+
+# live model -> (booking link to it, booking link to its archived copy)
+BOOKING_LINKS = {
+    Job: ('linked_job', 'archived_job'),
+    Radiator: ('linked_radiator', 'archived_radiator'),
+}
+
+
+def archivable(model, older_than_days):
+    """Completed records whose completion date is older than the cutoff"""
+    cutoff = timezone.now().date() - timedelta(days=older_than_days)
+    return model.objects.filter(status='Completed', date_completed__lt=cutoff)
+
+
+def archive_completed(model, older_than_days, batch_size=500):
+    """
+    Move completed records older than ``older_than_days`` into the archive table.
+
+    Each batch is copied and deleted in its own transaction, so an interrupted
+    run leaves every record in exactly one of the two tables. Returns the number
+    of records moved.
+    """
+    archive_model = ARCHIVES[model]
+    fields = [field.attname for field in archive_model._meta.concrete_fields if field.name != 'archived_at']
+    moved = 0
+    while True:
+        with transaction.atomic():
+            rows = list(archivable(model, older_than_days).order_by('pk').values(*fields)[:batch_size])
+            if not rows:
+                break
+            archived_at = timezone.now()
+            archive_model.objects.bulk_create(
+                [archive_model(archived_at=archived_at, **row) for row in rows]
+            )
+            pks = [row['id'] for row in rows]
+            # The delete clears the bookings' live links, so point them at the archived copies first
+            linked, archived = BOOKING_LINKS[model]
+            Booking.objects.filter(**{f'{linked}__in': pks}).update(**{archived: F(linked)})
+            # Archiving is not an edit, so it is not recorded as a deletion in the audit log,
+            # and the records still count on the days they were received and completed
+            with recorder.paused(), rollups.paused():
+                model.objects.filter(pk__in=pks).delete()
+        moved += len(rows)
+    return moved
@@ -0,0 +1,260 @@
+"""
+Propose which technician works on each pending job, and on which day, for a week.
+
+The workshop has ``WORKSHOP_BAYS`` bays and each technician takes on up to
+``TECHNICIAN_DAILY_JOBS`` jobs and bookings a day. A job or vehicle booking
+holds one bay and one technician on its day; technicians who are absent that day
+(``absentees.Absence``) get nothing.
+
+Assignments already made are kept while their technician can work that day; a
+job planned for a day this week the workshop is closed is placed again like a
+pending one. Bookings are fixed to their date, so a vehicle booking's bay is
+counted before anything is placed and any without a technician are staffed next,
+then the pending jobs are placed oldest first on the earliest open day with a
+free bay. On each day the next job goes to the technician with the lightest week
+so far, popped from a heap, so the whole week is planned greedily in
+O(jobs x log technicians) after five queries: hundreds of jobs take a
+millisecond or two (see benchmarks/assignment_plan.py).
+"""
+
+import hashlib
+import heapq
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .signals import assignments_changed
+
+PLAN_DAYS = 7
+
+# Bookings that still need someone on the day
+OPEN_BOOKING_STATUSES = ['pending', 'confirmed']
+
+# Columns the plan page shows, so the rest of each record is not loaded
+JOB_FIELDS = [
+    'customer_name', 'vehicle_registration', 'vehicle_make', 'vehicle_model', 'work_type',
+    'status', 'date_received', 'assigned_to', 'scheduled_date',
+]
+BOOKING_FIELDS = [
+    'booking_type', 'customer_name', 'booking_date', 'booking_time', 'all_day', 'status',
+    'vehicle_make', 'vehicle_model', 'description', 'assigned_to',
+]
+
+
+def allocate(days, technicians, absent, bookings, scheduled, queue, bays, daily_jobs):
+    """
+    The allocation itself, on plain ids.
+
+    ``technicians`` are ids in tie-break order and ``absent`` is a set of
+    (technician, day). ``bookings`` are (pk, day, technician or None, holds a bay)
+    and ``scheduled`` jobs are (pk, day, technician or None); both keep their
+    technician while that technician can work that day. ``queue`` is the other
+    jobs to place, most urgent first.
+
+    Returns ({job: (technician, day)}, {booking: technician or None},
+    [jobs that did not fit], {day: bays used}).
+    """
+    order = {technician: rank for rank, technician in enumerate(technicians)}
+    free = {
+        (technician, day): 0 if (technician, day) in absent else daily_jobs
+        for technician in technicians for day in days
+    }
+    week_load = dict.fromkeys(technicians, 0)
+    # A vehicle booking holds its bay on its date whether or not anyone is free to staff it
+    bays_used = Counter(day for _, day, _, bay in bookings if bay)
+
+    def can_work(technician, day):
+        return (technician, day) in free and (technician, day) not in absent
+
+    def take(technician, day, bay):
+        free[technician, day] -= 1
+        week_load[technician] += 1
+        if bay:
+            bays_used[day] += 1
+
+    placed_jobs = {}
+    placed_bookings = {}
+    unstaffed = []
+    for pk, day, technician, bay in bookings:
+        if can_work(technician, day):
+            take(technician, day, False)
+            placed_bookings[pk] = technician
+        else:
+            unstaffed.append((pk, day, bay))
+    displaced = []
+    for pk, day, technician in scheduled:
+        if can_work(technician, day):
+            take(technician, day, True)
+            placed_jobs[pk] = (technician, day)
+        else:
+            displaced.append(pk)
+
+    # A booking's day is fixed, so it may take a bay the jobs below would have had
+    for pk, day, bay in unstaffed:
+        available = [technician for technician in technicians if free[technician, day] > 0]
+        technician = min(available, key=lambda technician: (week_load[technician], order[technician]), default=None)
+        if technician is not None:
+            take(technician, day, False)
+        placed_bookings[pk] = technician
+
+    waiting = deque(displaced)
+    waiting.extend(queue)
+    for day in days:
+        heap = [(week_load[technician], order[technician], technician)
+                for technician in technicians if free[technician, day] > 0]
+        heapq.heapify(heap)
+        # Only the technician just popped changes load, so the other heap entries stay current
+        while waiting and heap and bays_used[day] < bays:
+            load, rank, technician = heapq.heappop(heap)
+            placed_jobs[waiting.popleft()] = (technician, day)
+            take(technician, day, True)
+            if free[technician, day] > 0:
+                heapq.heappush(heap, (week_load[technician], rank, technician))
+    return placed_jobs, placed_bookings, list(waiting), dict(bays_used)
+
+
+@dataclass
+class Plan:
+    start: object
+    days: list
+    technicians: list
+    absent: set
+    jobs: list  # [(job, technician, day)] for every job with a place in the week
+    bookings: list  # [(booking, technician or None)]
+    unscheduled: list  # pending jobs that did not fit, oldest first
+    backlog: int  # further pending jobs not considered, as the week was already full
+    bays_used: dict  # day -> bays taken
+
+    @property
+    def job_changes(self):
+        return [
+            (job, technician, day) for job, technician, day in self.jobs
+            if (job.assigned_to_id, job.scheduled_date) != (technician.pk, day)
+        ]
+
+    @property
+    def booking_changes(self):
+        return [
+            (booking, technician) for booking, technician in self.bookings
+            if technician is not None and booking.assigned_to_id != technician.pk
+        ]
+
+    @property
+    def fingerprint(self):
+        """Identifies the proposed changes, so applying can check they are still the ones previewed"""
+        changes = sorted(
+            [('job', job.pk, technician.pk, day.isoformat()) for job, technician, day in self.job_changes]
+            + [('booking', booking.pk, technician.pk, '') for booking, technician in self.booking_changes]
+        )
+        return hashlib.sha256(repr(changes).encode()).hexdigest()[:16]
+
+
+def plan_week(start, bays=None, daily_jobs=None):
+    """The proposed assignments for the open days from ``start`` to a week later"""
+    from absentees.models import Absence, Employee
+    from bookings.models import Booking
+    from jobs.models import Job
+
+    bays = settings.WORKSHOP_BAYS if bays is None else bays
+    daily_jobs = settings.TECHNICIAN_DAILY_JOBS if daily_jobs is None else daily_jobs
+    week = [start + timedelta(days=offset) for offset in range(PLAN_DAYS)]
+    days = [day for day in week if day.weekday() in settings.WORKSHOP_WEEKDAYS]
+    closed_days = [day for day in week if day not in days]
+    end = start + timedelta(days=PLAN_DAYS)
+
+    technicians = {employee.pk: employee for employee in Employee.objects.filter(is_technician=True).order_by('name', 'pk')}
+    absent = set(
+        Absence.objects.filter(employee__in=list(technicians), date__gte=start, date__lt=end)
+        .values_list('employee_id', 'date')
+    )
+    bookings = list(
+        Booking.objects.filter(booking_date__in=days, status__in=OPEN_BOOKING_STATUSES)
+        .only(*BOOKING_FIELDS).order_by('booking_date', 'booking_time', 'pk')
+    )
+    scheduled = list(
+        Job.objects.filter(scheduled_date__in=days).exclude(status='Completed')
+        .only(*JOB_FIELDS).order_by('date_received', 'pk')
+    )
+    # Jobs never planned, planned for a day that has passed without being started, or planned for a day
+    # this week the workshop is closed
+    pending = (
+        Job.objects.filter(
+            Q(status='Pending', scheduled_date__isnull=True)
+            | Q(status='Pending', scheduled_date__lt=start)
+            | Q(scheduled_date__in=closed_days)
+        )
+        .exclude(status='Completed')
+        .only(*JOB_FIELDS).order_by('date_received', 'pk')
+    )
+    capacity = len(days) * bays
+    queue = list(pending[:capacity])
+    backlog = pending.count() - len(queue) if len(queue) == capacity else 0
+
+    placed_jobs, placed_bookings, unplaced, bays_used = allocate(
+        days, list(technicians), absent,
+        [(booking.pk, booking.booking_date, booking.assigned_to_id, booking.booking_type == 'vehicle')
+         for booking in bookings],
+        [(job.pk, job.scheduled_date, job.assigned_to_id) for job in scheduled],
+        [job.pk for job in queue],
+        bays, daily_jobs,
+    )
+    jobs = {job.pk: job for job in scheduled + queue}
+    unplaced = set(unplaced)
+    return Plan(
+        start=start,
+        days=days,
+        technicians=list(technicians.values()),
+        absent=absent,
+        jobs=[
+            (jobs[pk], technicians[technician], day)
+            for pk, (technician, day) in sorted(placed_jobs.items(), key=lambda item: (item[1][1], item[0]))
+        ],
+        bookings=[
+            (booking, technicians.get(placed_bookings[booking.pk])) for booking in bookings
+        ],
+        unscheduled=[jobs[pk] for pk in jobs if pk in unplaced],
+        backlog=backlog,
+        bays_used=bays_used,
+    )
+
+
+def apply_plan(plan):
+    """Save the plan's new and changed assignments. Returns (jobs changed, bookings changed)."""
+    from bookings.models import Booking
+    from jobs.models import Job
+
+    now = timezone.now()
+    job_changes = {}
+    jobs = []
+    for job, technician, day in plan.job_changes:
+        changes = {}
+        if job.assigned_to_id != technician.pk:
+            changes['assigned_to_id'] = [job.assigned_to_id, technician.pk]
+        if job.scheduled_date != day:
+            changes['scheduled_date'] = [job.scheduled_date, day]
+        job.assigned_to = technician
+        job.scheduled_date = day
+        job.updated_at = now
+        job_changes[job.pk] = changes
+        jobs.append(job)
+    booking_changes = {}
+    bookings = []
+    for booking, technician in plan.booking_changes:
+        booking_changes[booking.pk] = {'assigned_to_id': [booking.assigned_to_id, technician.pk]}
+        booking.assigned_to = technician
+        booking.updated_at = now
+        bookings.append(booking)
+
+    with transaction.atomic():
+        Job.objects.bulk_update(jobs, ['assigned_to', 'scheduled_date', 'updated_at'], batch_size=500)
+        Booking.objects.bulk_update(bookings, ['assigned_to', 'updated_at'], batch_size=500)
+        # bulk_update sends no post_save, so the audit log hears about the whole plan at once
+        for model, changes in [(Job, job_changes), (Booking, booking_changes)]:
+            if changes:
+                assignments_changed.send(sender=model, changes=changes)
+    return len(jobs), len(bookings)
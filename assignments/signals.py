@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent once per model by planner.apply_plan, inside its transaction, with
+# sender=model and changes={pk: {field: [old, new]}}
+assignments_changed = Signal()
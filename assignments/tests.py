@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from absentees.models import Employee
+from bookings.models import Booking
+from jobs.models import Job
+
+from .planner import allocate, plan_week
+
+MONDAY = date(2026, 10, 19)
+TUESDAY = MONDAY + timedelta(days=1)
+
+
+class AllocateTests(SimpleTestCase):
+    """Bays and technicians are never given out beyond what a day has"""
+
+    def test_bookings_and_scheduled_jobs_fill_bays_first(self):
+        placed, bookings, unplaced, bays_used = allocate(
+            [MONDAY], [1, 2], set(), [(10, MONDAY, 1, True)], [(20, MONDAY, 2)], [30, 31], bays=3, daily_jobs=3,
+        )
+        self.assertEqual(placed, {20: (2, MONDAY), 30: (1, MONDAY)})
+        self.assertEqual(bookings, {10: 1})
+        self.assertEqual(unplaced, [31])
+        self.assertEqual(bays_used, {MONDAY: 3})
+
+    def test_unstaffed_vehicle_booking_holds_its_bay(self):
+        placed, bookings, unplaced, bays_used = allocate(
+            [MONDAY, TUESDAY], [1], {(1, MONDAY)}, [(10, MONDAY, None, True)], [], [30], bays=1, daily_jobs=3,
+        )
+        self.assertEqual(bookings, {10: None})
+        self.assertEqual(placed, {30: (1, TUESDAY)})
+        self.assertEqual(bays_used, {MONDAY: 1, TUESDAY: 1})
+
+    def test_radiator_booking_takes_a_technician_but_no_bay(self):
+        placed, bookings, unplaced, bays_used = allocate(
+            [MONDAY], [1], set(), [(10, MONDAY, None, False)], [], [30, 31], bays=1, daily_jobs=2,
+        )
+        self.assertEqual(bookings, {10: 1})
+        self.assertEqual(placed, {30: (1, MONDAY)})
+        self.assertEqual(unplaced, [31])
+
+
+@override_settings(WORKSHOP_WEEKDAYS=[0, 1, 2, 3, 4], WORKSHOP_BAYS=1, TECHNICIAN_DAILY_JOBS=3)
+class PlanWeekTests(TestCase):
+    def setUp(self):
+        self.technician = Employee.objects.create(name='Sam')
+
+    def create_job(self, **fields):
+        return Job.objects.create(
+            customer_name='Plan Customer', contact_number='0820000000', vehicle_registration='PLN001',
+            date_received=MONDAY - timedelta(days=7), **fields,
+        )
+
+    def test_job_scheduled_on_a_closed_day_is_planned_again(self):
+        job = self.create_job(scheduled_date=MONDAY + timedelta(days=5))  # Saturday
+        plan = plan_week(MONDAY)
+        self.assertEqual(plan.jobs, [(job, self.technician, MONDAY)])
+        self.assertEqual(plan.job_changes, [(job, self.technician, MONDAY)])
+
+    def test_vehicle_booking_takes_the_only_bay(self):
+        Booking.objects.create(
+            booking_type='vehicle', customer_name='Booked Customer', contact_number='0820000001',
+            booking_date=MONDAY, all_day=True,
+        )
+        job = self.create_job()
+        plan = plan_week(MONDAY)
+        self.assertEqual(plan.jobs, [(job, self.technician, TUESDAY)])
+        self.assertEqual(plan.bays_used[MONDAY], 1)
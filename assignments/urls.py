@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+app_name = 'assignments'
+
+urlpatterns = [
+    path('', views.assignment_plan, name='assignment_plan'),
+]
@@ -0,0 +1,70 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import redirect, render
+from django.urls import reverse
+
+from . import planner
+
+
+def _start(value):
+    """The first day to plan from ?start=YYYY-MM-DD, defaulting to today"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return date.today()
+
+
+def _grid(plan):
+    """One row per technician with their jobs and bookings on each day of the plan"""
+    changed_jobs = {job.pk for job, technician, day in plan.job_changes}
+    cells = defaultdict(list)
+    for job, technician, day in plan.jobs:
+        cells[technician.pk, day].append({'kind': 'job', 'record': job, 'new': job.pk in changed_jobs})
+    for booking, technician in plan.bookings:
+        if technician is not None:
+            cells[technician.pk, booking.booking_date].append({
+                'kind': 'booking', 'record': booking, 'new': booking.assigned_to_id != technician.pk,
+            })
+    return [
+        {
+            'technician': technician,
+            'days': [
+                {'date': day, 'absent': (technician.pk, day) in plan.absent, 'items': cells[technician.pk, day]}
+                for day in plan.days
+            ],
+            'total': sum(len(cells[technician.pk, day]) for day in plan.days),
+        }
+        for technician in plan.technicians
+    ]
+
+
+@login_required
+def assignment_plan(request):
+    """Preview the proposed technician assignments for a week, and save them on POST"""
+    start = _start(request.POST.get('start') or request.GET.get('start'))
+    plan = planner.plan_week(start)
+    if request.method == 'POST':
+        if request.POST.get('plan') != plan.fingerprint:
+            messages.warning(
+                request,
+                'Jobs, bookings or absences changed since the plan was shown. Check the updated plan and apply it again.',
+            )
+        else:
+            jobs, bookings = planner.apply_plan(plan)
+            messages.success(request, f'Assigned {jobs} job(s) and {bookings} booking(s).')
+        return redirect(f"{reverse('assignments:assignment_plan')}?start={start.isoformat()}")
+
+    return render(request, 'assignments/assignment_plan.html', {
+        'plan': plan,
+        'grid': _grid(plan),
+        'days': [{'date': day, 'bays_used': plan.bays_used.get(day, 0)} for day in plan.days],
+        'bays': settings.WORKSHOP_BAYS,
+        'unstaffed': [booking for booking, technician in plan.bookings if technician is None],
+        'changes': len(plan.job_changes) + len(plan.booking_changes),
+        'previous_week': start - timedelta(days=planner.PLAN_DAYS),
+        'next_week': start + timedelta(days=planner.PLAN_DAYS),
+    })
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from .models import AuditEntry
+
+
+@admin.register(AuditEntry)
+class AuditEntryAdmin(admin.ModelAdmin):
+    list_display = ['ts', 'model', 'object_id', 'action', 'object_repr', 'user']
+    list_filter = ['model', 'action']
+    list_select_related = ['user']
+    ordering = ['-ts']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AuditConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'audit'
+
+    def ready(self):
+        from . import recorder
+        recorder.connect_signals()
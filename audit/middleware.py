@@ -0,0 +1,40 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from . import recorder
+
+
+class AuditMiddleware:
+    """Buffer audit entries for the request and write them in one batch when it finishes"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with recorder.buffered(lambda: self.get_user_id(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        entries, token = recorder.start_buffer()
+        try:
+            return await self.get_response(request)
+        finally:
+            recorder.stop_buffer(token)
+            if entries:
+                await sync_to_async(self.flush)(entries, request)
+
+    def flush(self, entries, request):
+        recorder.flush(entries, self.get_user_id(request))
+
+    @staticmethod
+    def get_user_id(request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return user.pk
+        return None
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class AuditEntry(models.Model):
+    """Append-only record of one change to an audited model"""
+
+    ACTION_CHOICES = [
+        ('create', 'Created'),
+        ('update', 'Updated'),
+        ('delete', 'Deleted'),
+    ]
+
+    model = models.CharField(max_length=100)  # app_label.model_name, e.g. "jobs.job"
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)  # {field: [old, new]}
+    object_repr = models.CharField(max_length=200, blank=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, blank=True, null=True, related_name='+')
+    ts = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-ts', '-id']
+        indexes = [
+            models.Index(fields=['model', 'object_id', 'ts'], name='audit_model_object_ts_idx'),
+        ]
+        verbose_name_plural = 'audit entries'
+
+    def __str__(self):
+        return f"{self.get_action_display()} {self.model} #{self.object_id} at {self.ts:%Y-%m-%d %H:%M}"
+
+    def save(self, *args, **kwargs):
+        """Audit entries are never edited once written"""
+        if not self._state.adding:
+            raise ValueError('Audit entries are append-only')
+        super().save(*args, **kwargs)
@@ -0,0 +1,157 @@
+"""
+Field-level change capture for audited models.
+
+Each audited instance keeps a snapshot of the values it was loaded with
+(``workshop_manager.snapshots``), so a diff costs no extra query. Entries are
+collected per request and written with a single ``bulk_create`` when the
+request finishes. They are added to the buffer through ``transaction.on_commit``,
+so changes rolled back never get an entry.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from workshop_manager import snapshots
+
+AUDITED_MODELS = [
+    'jobs.Job',
+    'inventory.Radiator',
+    'bookings.Booking',
+    'absentees.Absence',
+]
+
+# Bookkeeping columns that change on every save and say nothing about what was edited
+IGNORED_FIELDS = {'created_at', 'updated_at'}
+
+_buffer = ContextVar('audit_buffer', default=None)
+_paused = ContextVar('audit_paused', default=False)
+
+
+def _tracked_fields(model):
+    return [
+        field.attname for field in model._meta.concrete_fields
+        if not field.primary_key and field.name not in IGNORED_FIELDS
+    ]
+
+
+def _record(instance, action, changes):
+    from .models import AuditEntry
+
+    if _paused.get():
+        return
+
+    entry = AuditEntry(
+        model=instance._meta.label_lower,
+        object_id=instance.pk,
+        action=action,
+        changes=changes,
+        object_repr=str(instance)[:200],
+    )
+
+    def append():
+        buffer = _buffer.get()
+        if buffer is None:
+            # Outside a request (shell, management commands): write straight away
+            entry.save()
+        else:
+            buffer.append(entry)
+
+    transaction.on_commit(append)
+
+
+def record_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    current = snapshots.current(instance, 'audit')
+    if created:
+        changes = {attname: [None, value] for attname, value in current.items()}
+    else:
+        previous = snapshots.loaded(instance, 'audit')
+        changes = {
+            attname: [previous[attname], value]
+            for attname, value in current.items()
+            if attname in previous and previous[attname] != value
+        }
+        if not changes:
+            return
+    _record(instance, 'create' if created else 'update', changes)
+    snapshots.remember(instance, 'audit', current)
+
+
+def record_delete(sender, instance, **kwargs):
+    changes = {attname: [value, None] for attname, value in snapshots.current(instance, 'audit').items()}
+    _record(instance, 'delete', changes)
+
+
+def record_bulk_transition(sender, changes, **kwargs):
+    # queryset.update() and bulk_update() send no post_save, so bulk status changes and
+    # applied assignment plans arrive as one signal
+    if _paused.get() or sender._meta.label not in AUDITED_MODELS:
+        return
+    for instance in sender._base_manager.filter(pk__in=list(changes)).iterator():
+        _record(instance, 'update', changes[instance.pk])
+
+
+def connect_signals():
+    from assignments.signals import assignments_changed
+    from board.signals import statuses_changed
+
+    for label in AUDITED_MODELS:
+        model = apps.get_model(label)
+        snapshots.track(model, 'audit', _tracked_fields(model))
+        post_save.connect(record_save, sender=model, dispatch_uid=f'audit_save_{label}')
+        post_delete.connect(record_delete, sender=model, dispatch_uid=f'audit_delete_{label}')
+    statuses_changed.connect(record_bulk_transition, dispatch_uid='audit_bulk_transition')
+    assignments_changed.connect(record_bulk_transition, dispatch_uid='audit_assignments')
+
+
+def flush(entries, user_id=None):
+    """Write buffered entries in one INSERT"""
+    from .models import AuditEntry
+
+    if not entries:
+        return
+    for entry in entries:
+        entry.user_id = user_id
+    AuditEntry.objects.bulk_create(entries)
+
+
+@contextmanager
+def paused():
+    """Do not record changes made inside the block (e.g. archiving, bulk restores)"""
+    token = _paused.set(True)
+    try:
+        yield
+    finally:
+        _paused.reset(token)
+
+
+def start_buffer():
+    """Start collecting entries in the current context. Returns (entries, token)."""
+    entries = []
+    return entries, _buffer.set(entries)
+
+
+def stop_buffer(token):
+    _buffer.reset(token)
+
+
+@contextmanager
+def buffered(get_user_id=None):
+    """
+    Collect audit entries for the duration of the block and write them together at the end.
+
+    ``get_user_id`` is only called when there is something to write, so read-only
+    requests never resolve the user just for auditing.
+    """
+    entries, token = start_buffer()
+    try:
+        yield entries
+    finally:
+        stop_buffer(token)
+        if entries:
+            flush(entries, get_user_id() if get_user_id else None)
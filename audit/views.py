@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from django.contrib.auth.decorators import login_required
+from django.db.models import Q
+from django.http import Http404
+from django.shortcuts import render
+
+from .models import AuditEntry
+from .recorder import AUDITED_MODELS
+
+PAGE_SIZE = 50
+
+
+def _parse_cursor(cursor):
+    """Split a "<iso timestamp>|<id>" cursor, returning None if it is malformed"""
+    try:
+        ts, pk = cursor.rsplit('|', 1)
+        return datetime.fromisoformat(ts), int(pk)
+    except (ValueError, AttributeError):
+        return None
+
+
+@login_required
+def object_history(request, model, object_id):
+    """Change history for one record, newest first, paged by (ts, id) keyset"""
+    if model not in {label.lower() for label in AUDITED_MODELS}:
+        raise Http404('Unknown audited model')
+
+    entries = AuditEntry.objects.filter(model=model, object_id=object_id).select_related('user')
+
+    cursor = _parse_cursor(request.GET.get('before'))
+    if cursor:
+        ts, pk = cursor
+        entries = entries.filter(Q(ts__lt=ts) | Q(ts=ts, id__lt=pk))
+
+    page = list(entries.order_by('-ts', '-id')[:PAGE_SIZE + 1])
+    next_cursor = None
+    if len(page) > PAGE_SIZE:
+        page = page[:PAGE_SIZE]
+        last = page[-1]
+        next_cursor = f'{last.ts.isoformat()}|{last.pk}'
+
+    return render(request, 'audit/object_history.html', {
+        'entries': page,
+        'model': model,
+        'object_id': object_id,
+        'object_repr': page[0].object_repr if page else f'{model} #{object_id}',
+        'next_cursor': next_cursor,
+    })
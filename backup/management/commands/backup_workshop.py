@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from backup.ndjson import backup
+
+
+class Command(BaseCommand):
+    help = 'Stream every workshop model to a gzip-compressed NDJSON backup file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output', nargs='?',
+            help='Backup file to write (default: workshop-backup-YYYYMMDD-HHMMSS.ndjson.gz)',
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        output = options['output'] or f"workshop-backup-{timezone.now():%Y%m%d-%H%M%S}.ndjson.gz"
+        started = time.perf_counter()
+        counts = backup(output, using=options['database'])
+        elapsed = time.perf_counter() - started
+        for label, count in counts.items():
+            self.stdout.write(f'{label}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Backed up {sum(counts.values())} records to {output} in {elapsed:.1f}s'
+        ))
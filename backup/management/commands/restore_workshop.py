@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, IntegrityError
+
+from backup.ndjson import restore
+
+
+class Command(BaseCommand):
+    help = 'Restore a backup written by backup_workshop using batched bulk inserts in one transaction'
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='Backup file (.ndjson.gz) to restore')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows per INSERT')
+        parser.add_argument(
+            '--flush', action='store_true',
+            help='Delete existing rows in the backed-up tables before restoring',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            counts = restore(
+                options['input'],
+                using=options['database'],
+                batch_size=options['batch_size'],
+                flush=options['flush'],
+            )
+        except IntegrityError as exc:
+            raise CommandError(f'Restore failed and was rolled back ({exc}). Use --flush to replace existing data.')
+        elapsed = time.perf_counter() - started
+        for label, count in counts.items():
+            self.stdout.write(f'{label}: {count}')
+        self.stdout.write(self.style.SUCCESS(f'Restored {sum(counts.values())} records in {elapsed:.1f}s'))
+        self.stdout.write(
+            'Restart the web workers so their in-process indexes (search, customer matching and vehicle '
+            'suggestions) are rebuilt from the restored data.'
+        )
@@ -0,0 +1,28 @@
+import sqlite3
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from workshop_manager.routers import REPLICA_DB_ALIAS, replica_configured
+
+
+class Command(BaseCommand):
+    help = 'Copy the SQLite primary into the SQLite file configured as the local read replica'
+
+    def handle(self, *args, **options):
+        if not replica_configured():
+            raise CommandError('No replica database is configured (set DATABASE_REPLICA_URL)')
+        primary = connections[DEFAULT_DB_ALIAS]
+        replica = connections[REPLICA_DB_ALIAS]
+        if primary.vendor != 'sqlite' or replica.vendor != 'sqlite':
+            raise CommandError('Only SQLite primaries and replicas can be synced this way')
+
+        replica.close()
+        primary.ensure_connection()
+        # The online backup API copies a consistent snapshot even while other processes write
+        target = sqlite3.connect(replica.settings_dict['NAME'])
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+        self.stdout.write(self.style.SUCCESS(f"Copied {primary.settings_dict['NAME']} to {replica.settings_dict['NAME']}"))
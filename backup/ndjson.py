@@ -0,0 +1,179 @@
+"""
+Streaming NDJSON backup and bulk restore.
+
+Backups use Django's ``jsonl`` serializer, one object per line, gzip-compressed, so
+``manage.py loaddata`` can also read them. Rows are read with ``iterator()`` and
+written as they are serialized, so memory use stays flat however large the shop is.
+Restore collects rows per model and writes them with ``bulk_create`` in one
+transaction. It keeps the stored timestamps and ``date_completed`` values instead of
+re-running ``save()`` (datetimes round-trip at millisecond precision, as with dumpdata).
+"""
+
+import gzip
+import json
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max
+
+from archive.services import ARCHIVES
+from audit import recorder
+from reports import comparison, rollups
+
+BACKUP_APPS = ['auth', 'customers', 'jobs', 'inventory', 'bookings', 'absentees', 'archive', 'audit']
+
+# Recreated by migrate (and referenced by natural key instead), so never backed up
+EXCLUDED_MODELS = {'auth.Permission'}
+
+
+def backup_models():
+    """Models to back up, ordered so every model comes after the models it references"""
+    app_list = [
+        (apps.get_app_config(label), [
+            model for model in apps.get_app_config(label).get_models()
+            if model._meta.label not in EXCLUDED_MODELS
+        ])
+        for label in BACKUP_APPS
+    ]
+    return serializers.sort_dependencies(app_list, allow_cycles=True)
+
+
+def backup(path, using=DEFAULT_DB_ALIAS, chunk_size=2000):
+    """Stream every backed-up model to a gzip NDJSON file. Returns {model label: row count}."""
+    counts = {}
+    serializer = serializers.get_serializer('jsonl')()
+    with gzip.open(path, 'wt', encoding='utf-8') as stream:
+        for model in backup_models():
+            queryset = model._base_manager.using(using).order_by(model._meta.pk.name)
+            m2m = [field.name for field in model._meta.many_to_many]
+            if m2m:
+                queryset = queryset.prefetch_related(*m2m)
+            counter = _Counter(queryset.iterator(chunk_size=chunk_size))
+            serializer.serialize(counter, stream=stream, use_natural_foreign_keys=True)
+            counts[model._meta.label] = counter.count
+    return counts
+
+
+class _Counter:
+    def __init__(self, iterable):
+        self.iterable = iterable
+        self.count = 0
+
+    def __iter__(self):
+        for item in self.iterable:
+            self.count += 1
+            yield item
+
+
+@contextmanager
+def _keep_stored_timestamps(models):
+    """bulk_create would overwrite auto_now/auto_now_add columns with the current time"""
+    changed = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                changed.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in changed:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def restore(path, using=DEFAULT_DB_ALIAS, batch_size=2000, flush=False):
+    """
+    Load a backup written by ``backup`` in one transaction. Returns {model label: row count}.
+
+    With ``flush`` the backed-up tables are emptied first; otherwise they must be empty.
+    """
+    models = backup_models()
+    counts = {}
+    with transaction.atomic(using=using), recorder.paused(), rollups.paused(), _keep_stored_timestamps(models):
+        if flush:
+            for model in reversed(models):
+                model._base_manager.using(using).all().delete()
+
+        # Lines are grouped into same-model batches before deserializing, so natural keys
+        # (e.g. a user's groups) resolve against batches that have already been written
+        batch = []
+        with gzip.open(path, 'rt', encoding='utf-8') as stream:
+            for line in stream:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if batch and (row['model'] != batch[0]['model'] or len(batch) >= batch_size):
+                    _write_batch(batch, using, counts)
+                batch.append(row)
+        _write_batch(batch, using, counts)
+
+        # Explicit primary keys were inserted, so move each sequence past the highest id
+        connection = connections[using]
+        sql_list = connection.ops.sequence_reset_sql(no_style(), models)
+        if sql_list:
+            with connection.cursor() as cursor:
+                for sql in sql_list:
+                    cursor.execute(sql)
+        _skip_archived_ids(connection, using)
+
+        # The daily rollups are derived data, so they are recounted instead of backed up
+        if using == DEFAULT_DB_ALIAS:
+            rollups.rebuild()
+            transaction.on_commit(comparison.bump_data_version, using=using)
+    return counts
+
+
+def _skip_archived_ids(connection, using):
+    """
+    Move the live tables' sequences past their archive tables' highest id as well.
+    Archived rows keep their live id, so a new job given the id of an archived one
+    could never be archived itself.
+    """
+    for model, archive_model in ARCHIVES.items():
+        highest = archive_model._base_manager.using(using).aggregate(highest=Max('pk'))['highest']
+        if highest is None:
+            continue
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                column = model._meta.pk.column
+                cursor.execute(
+                    f'SELECT setval(pg_get_serial_sequence(%s, %s), GREATEST(%s, '
+                    f'(SELECT COALESCE(MAX({connection.ops.quote_name(column)}), 1) '
+                    f'FROM {connection.ops.quote_name(table)})))',
+                    [table, column, highest],
+                )
+            elif connection.vendor == 'sqlite':
+                # Tables with an AUTOINCREMENT key keep their highest id in sqlite_sequence
+                cursor.execute('UPDATE sqlite_sequence SET seq = MAX(seq, %s) WHERE name = %s', [highest, table])
+                if not cursor.rowcount:
+                    cursor.execute('INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)', [table, highest])
+
+
+def _write_batch(batch, using, counts):
+    if not batch:
+        return
+    pending = []
+    pending_m2m = []
+    for deserialized in serializers.deserialize('python', batch, using=using):
+        pending.append(deserialized.object)
+        if deserialized.m2m_data:
+            pending_m2m.append((deserialized.object, deserialized.m2m_data))
+    model = type(pending[0])
+    model._base_manager.using(using).bulk_create(pending)
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+        rows = [
+            through(**{source: obj.pk, target: related_id})
+            for obj, m2m_data in pending_m2m
+            for related_id in m2m_data.get(field.name, ())
+        ]
+        if rows:
+            through._base_manager.using(using).bulk_create(rows)
+    counts[model._meta.label] = counts.get(model._meta.label, 0) + len(pending)
+    batch.clear()
@@ -0,0 +1,154 @@
+"""
+Measure Job admin changelist latency on a throwaway database of synthetic jobs.
+
+Each page is timed with the tuned JobAdmin and with the stock settings it replaced
+(full COUNT(*), date_hierarchy and leading-wildcard icontains search).
+
+Usage:
+    python benchmarks/admin_changelist.py                 # 100k jobs
+    python benchmarks/admin_changelist.py --jobs 500000 --runs 10
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib import admin  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.paginator import Paginator  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from jobs.models import Job  # noqa: E402
+
+FIRST_NAMES = ['John', 'Thabo', 'Sipho', 'Anele', 'Pieter', 'Ayesha', 'Lerato', 'Johan', 'Naledi', 'Ravi']
+LAST_NAMES = ['Smith', 'Nkosi', 'Botha', 'Naidoo', 'Dlamini', 'van Wyk', 'Pillay', 'Mokoena', 'Khumalo', 'Jacobs']
+VEHICLES = [('Toyota', 'Corolla'), ('Ford', 'Ranger'), ('VW', 'Polo'), ('Nissan', 'NP200'), ('Isuzu', 'KB')]
+
+PAGES = [
+    ('first page', ''),
+    ('page 50', '?p=49'),
+    ('status filter', '?status__exact=Pending'),
+    ('this month', '?date_received__gte={month_start}'),
+    ('search name', '?q=Naledi+Pil'),
+    ('search registration', '?q={registration}'),
+]
+
+STOCK_ADMIN = {
+    'paginator': Paginator,
+    'show_full_result_count': True,
+    'date_hierarchy': 'date_received',
+    'search_fields': ['customer_name', 'vehicle_registration', 'vehicle_make', 'vehicle_model', 'invoice_number'],
+    'ordering': ['-created_at'],
+}
+
+
+def create_jobs(count, rng):
+    today = date.today()
+    batch = []
+    registrations = []
+    for i in range(count):
+        make, model = rng.choice(VEHICLES)
+        registration = ''.join(rng.choices(string.ascii_uppercase, k=2)) + f' {i:06d}-GP'
+        registrations.append(registration)
+        status = rng.choice(['Pending', 'In Progress', 'Completed'])
+        received = today - timedelta(days=rng.randint(0, 5 * 365))
+        batch.append(Job(
+            customer_name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            contact_number='0' + ''.join(rng.choices(string.digits, k=9)),
+            vehicle_registration=registration,
+            vehicle_make=make,
+            vehicle_model=model,
+            work_type='repair',
+            status=status,
+            date_received=received,
+            date_completed=received if status == 'Completed' else None,
+            invoice_number=f'INV-{i}',
+        ))
+        if len(batch) == 5000:
+            Job.objects.bulk_create(batch)
+            batch = []
+    Job.objects.bulk_create(batch)
+    return registrations
+
+
+@contextmanager
+def stock_admin():
+    model_admin = admin.site._registry[Job]
+    saved = {name: getattr(model_admin, name) for name in STOCK_ADMIN}
+    for name, value in STOCK_ADMIN.items():
+        setattr(model_admin, name, value)
+    # Skip the in-process index so the stock search really hits the database
+    model_admin.get_search_results = lambda request, queryset, term: admin.ModelAdmin.get_search_results(
+        model_admin, request, queryset, term
+    )
+    try:
+        yield
+    finally:
+        del model_admin.get_search_results
+        for name, value in saved.items():
+            setattr(model_admin, name, value)
+
+
+def time_page(client, url, runs):
+    client.get(url)  # warm caches (and, for searches, the in-process index)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.status_code
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=100_000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    settings.ALLOWED_HOSTS = ['testserver']
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        rng = random.Random(42)
+        started = time.perf_counter()
+        registrations = create_jobs(args.jobs, rng)
+        print(f'created {args.jobs} jobs in {time.perf_counter() - started:.1f} s')
+
+        client = Client()
+        client.force_login(User.objects.create_superuser('bench', 'bench@example.com', 'bench'))
+        values = {
+            'month_start': date.today().replace(day=1).isoformat(),
+            'registration': registrations[len(registrations) // 2].split()[1],
+        }
+
+        print(f"{'page':<22}{'stock':>12}{'tuned':>12}")
+        for name, query in PAGES:
+            url = '/admin/jobs/job/' + query.format(**values)
+            with stock_admin():
+                stock = time_page(client, url, args.runs)
+            tuned = time_page(client, url, args.runs)
+            print(f'{name:<22}{stock:>9.1f} ms{tuned:>9.1f} ms')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
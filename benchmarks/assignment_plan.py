@@ -0,0 +1,104 @@
+"""
+Measure a week's technician assignment plan on a throwaway database.
+
+Creates technicians (some absent on some days), a week of bookings and a backlog
+of pending jobs, then reports the median time to plan the week from the database
+(queries included) and for the allocation alone.
+
+Usage:
+    python benchmarks/assignment_plan.py                      # 40 technicians, 60 bays, 600 pending jobs
+    python benchmarks/assignment_plan.py --technicians 60 --jobs 2000 --bays 40
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from absentees.models import Absence, Employee  # noqa: E402
+from assignments import planner  # noqa: E402
+from bookings.models import Booking  # noqa: E402
+from jobs.models import Job  # noqa: E402
+
+
+def create_records(args, rng, start):
+    technicians = Employee.objects.bulk_create([Employee(name=f'Technician {i:03}') for i in range(args.technicians)])
+    days = [start + timedelta(days=offset) for offset in range(planner.PLAN_DAYS)]
+    Absence.objects.bulk_create([
+        Absence(employee=rng.choice(technicians), date=rng.choice(days)) for _ in range(args.technicians // 2)
+    ], ignore_conflicts=True)
+    Booking.objects.bulk_create([
+        Booking(
+            booking_type='vehicle', customer_name=f'Booking {i}', contact_number='+27825550100',
+            booking_date=rng.choice(days), all_day=True, work_type='service',
+            vehicle_make='Toyota', vehicle_model='Hilux', status='confirmed',
+        )
+        for i in range(args.bookings)
+    ])
+    Job.objects.bulk_create([
+        Job(
+            customer_name=f'Customer {i}', contact_number='+27825550100', vehicle_registration=f'CA{i:06}',
+            vehicle_make='Toyota', vehicle_model='Hilux', work_type='repair', status='Pending',
+            date_received=start - timedelta(days=rng.randint(0, 30)),
+        )
+        for i in range(args.jobs)
+    ], batch_size=1000)
+
+
+def timed(function, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--technicians', type=int, default=40)
+    parser.add_argument('--jobs', type=int, default=600)
+    parser.add_argument('--bookings', type=int, default=60)
+    parser.add_argument('--bays', type=int, default=60)
+    parser.add_argument('--daily-jobs', type=int, default=4)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        rng = random.Random(42)
+        start = date.today()
+        create_records(args, rng, start)
+
+        plan, total = timed(lambda: planner.plan_week(start, args.bays, args.daily_jobs), args.runs)
+        technicians = [employee.pk for employee in plan.technicians]
+        bookings = [(booking.pk, booking.booking_date, booking.assigned_to_id, True) for booking, technician in plan.bookings]
+        queue = list(Job.objects.filter(status='Pending').order_by('date_received', 'pk').values_list('pk', flat=True))
+        _, allocation = timed(lambda: planner.allocate(
+            plan.days, technicians, plan.absent, bookings, [], queue, args.bays, args.daily_jobs,
+        ), args.runs)
+
+        print(f'{len(plan.technicians)} technicians, {len(plan.days)} open days, {len(plan.absent)} absences, '
+              f'{len(plan.bookings)} bookings, {args.jobs} pending jobs')
+        print(f'placed {len(plan.jobs)} jobs, {len(plan.unscheduled) + plan.backlog} left for later weeks')
+        print(f'plan_week (with queries): {total:.1f} ms median')
+        print(f'allocate alone:           {allocation:.1f} ms median')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
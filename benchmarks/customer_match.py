@@ -0,0 +1,120 @@
+"""
+Measure fuzzy customer matching on a throwaway database of synthetic customers.
+
+Reports the time and memory to build the trigram index, then the median and
+slowest lookup for booking auto-linking (best match for a typo'd name and number)
+and for autocomplete suggestions (partial names and numbers).
+
+Usage:
+    python benchmarks/customer_match.py                     # 100k customers
+    python benchmarks/customer_match.py --customers 20000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from customers import matcher  # noqa: E402
+from customers.models import Customer  # noqa: E402
+from customers.services import customer_keys  # noqa: E402
+from customers.views import SUGGESTIONS  # noqa: E402
+
+FIRST_NAMES = ['John', 'Thabo', 'Sipho', 'Anele', 'Pieter', 'Ayesha', 'Lerato', 'Johan', 'Naledi', 'Ravi',
+               'Fatima', 'Kagiso', 'Willem', 'Priya', 'Zanele', 'Themba', 'Marius', 'Nomsa', 'Deon', 'Busisiwe']
+LAST_NAMES = ['Smith', 'Nkosi', 'Botha', 'Naidoo', 'Dlamini', 'van Wyk', 'Pillay', 'Mokoena', 'Khumalo', 'Jacobs',
+              'Mahlangu', 'Pretorius', 'Govender', 'Ndlovu', 'Coetzee', 'Zulu', 'Venter', 'Moodley', 'Sithole', 'Nel']
+
+
+def create_customers(count, rng):
+    people = []
+    batch = []
+    for i in range(count):
+        name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+        if rng.random() < 0.5:
+            name += ' ' + ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 8))).title()
+        number = '0' + ''.join(rng.choices(string.digits, k=9))
+        name_key, phone_key = customer_keys(name, number)
+        people.append((name, number))
+        batch.append(Customer(name=name, contact_number=number, name_key=name_key, phone_key=phone_key))
+        if len(batch) == 5000:
+            Customer.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    Customer.objects.bulk_create(batch, ignore_conflicts=True)
+    return people
+
+
+def typo(text, rng):
+    position = rng.randrange(len(text))
+    return text[:position] + rng.choice(string.ascii_lowercase) + text[position + 1:]
+
+
+# label -> (query built from a customer's name and number, limit, prefix,
+#           key the top hit should share with that customer: 0 name, 1 number)
+QUERIES = {
+    'link: name typo': (lambda name, number, rng: {'name': typo(name, rng)}, 1, False, 0),
+    'link: name+number typos': (lambda name, number, rng: {
+        'name': typo(name, rng), 'contact_number': number[:-1] + rng.choice(string.digits),
+    }, 1, False, 1),
+    'suggest: 6 digits': (lambda name, number, rng: {'contact_number': number[:6]}, SUGGESTIONS, True, None),
+    'suggest: "joh"': (lambda name, number, rng: {'name': 'joh'}, SUGGESTIONS, True, None),
+    'suggest: partial name': (lambda name, number, rng: {
+        'name': name[:rng.randint(4, len(name))],
+    }, SUGGESTIONS, True, None),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--customers', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        rng = random.Random(42)
+        people = create_customers(args.customers, rng)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        matcher.customer_index.ensure_current()
+        built = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'indexed {len(matcher.customer_index.documents)} customers in {built:.2f} s, {memory / 2**20:.0f} MiB')
+
+        print(f"{'query':<26}{'median':>10}{'max':>10}{'top hit':>9}")
+        for label, (make_query, limit, prefix, expected) in QUERIES.items():
+            timings = []
+            hits = 0
+            for _ in range(args.queries):
+                name, number = rng.choice(people)
+                query = make_query(name, number, rng)
+                started = time.perf_counter()
+                scored = matcher.customer_index.scores(limit=limit, prefix=prefix, **query)
+                timings.append((time.perf_counter() - started) * 1000)
+                if scored and expected is not None:
+                    top = matcher.customer_index.documents[scored[0][0]]
+                    hits += top[expected] == customer_keys(name, number)[expected]
+            hit_rate = '-' if expected is None else f'{hits / args.queries:.0%}'
+            print(f'{label:<26}{statistics.median(timings):>7.2f} ms{max(timings):>7.2f} ms{hit_rate:>9}')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Measure bulk import throughput on a throwaway database.
+
+Writes a CSV (or .xlsx) file of synthetic jobs, with a few invalid rows mixed in,
+and times ``import_records`` reading, validating and inserting it.
+
+Usage:
+    python benchmarks/import_records.py                  # 100k rows from CSV
+    python benchmarks/import_records.py --rows 50000 --format xlsx
+"""
+
+import argparse
+import csv
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+# Production runs with DEBUG off; with it on every INSERT is also logged
+os.environ.setdefault('DEBUG', 'False')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from importer.services import import_rows, read_rows  # noqa: E402
+from jobs.models import Job  # noqa: E402
+
+HEADER = [
+    'Customer Name', 'Contact Number', 'Vehicle Registration', 'Vehicle Make', 'Vehicle Model',
+    'Work Type', 'Status', 'Date Received', 'Date Completed', 'Invoice Number', 'Notes',
+]
+NAMES = ['John Smith', 'Thabo Nkosi', 'Ayesha Naidoo', 'Pieter Botha', 'Lerato Mokoena']
+VEHICLES = [('Toyota', 'Corolla'), ('Ford', 'Ranger'), ('VW', 'Polo'), ('Nissan', 'NP200')]
+
+
+def fake_rows(count, rng):
+    today = date.today()
+    for i in range(count):
+        make, model = rng.choice(VEHICLES)
+        received = today - timedelta(days=rng.randint(30, 3000))
+        status = rng.choice(['Pending', 'In Progress', 'Completed', 'Completed'])
+        completed = received + timedelta(days=rng.randint(1, 20)) if status == 'Completed' and i % 5 else None
+        row = [
+            rng.choice(NAMES),
+            '0' + ''.join(rng.choices(string.digits, k=9)),
+            f'CA {i:06d}',
+            make,
+            model,
+            rng.choice(['Repair', 'service', 'Radiator Replacement']),
+            status,
+            received,
+            completed,
+            f'INV-{i}',
+            '',
+        ]
+        if i % 1000 == 999:
+            row[5] = 'paint job'  # not a work type: reported, not imported
+        yield row
+
+
+def write_file(path, rows, file_format):
+    if file_format == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(HEADER)
+            writer.writerows(rows)
+    else:
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Jobs')
+        sheet.append(HEADER)
+        for row in rows:
+            sheet.append(row)
+        workbook.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f'jobs.{args.format}')
+        write_file(path, fake_rows(args.rows, random.Random(42)), args.format)
+
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            started = time.perf_counter()
+            with open(path, 'rb') as stream:
+                result = import_rows('job', read_rows(stream, path, 'job'), batch_size=args.batch_size)
+            elapsed = time.perf_counter() - started
+            assert Job.objects.count() == result.created
+            assert not Job.objects.filter(status='Completed', date_completed__isnull=True).exists()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print(
+        f'{args.format}: {result.rows} rows in {elapsed:.2f} s ({result.rows / elapsed:,.0f} rows/s), '
+        f'{result.created} imported, {result.failed} rejected'
+    )
+
+
+if __name__ == '__main__':
+    main()
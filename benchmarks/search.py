@@ -0,0 +1,85 @@
+"""
+Measure global search lookups against an in-memory index of synthetic records.
+
+Usage:
+    python benchmarks/search.py                 # 100k records
+    python benchmarks/search.py --records 500000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from search.index import INDEXED_FIELDS, InvertedIndex  # noqa: E402
+
+FIRST_NAMES = ['John', 'Thabo', 'Sipho', 'Anele', 'Pieter', 'Ayesha', 'Lerato', 'Johan', 'Naledi', 'Ravi']
+LAST_NAMES = ['Smith', 'Nkosi', 'Botha', 'Naidoo', 'Dlamini', 'van Wyk', 'Pillay', 'Mokoena', 'Khumalo', 'Jacobs']
+MAKES = ['Toyota Corolla', 'Ford Ranger', 'VW Polo', 'Nissan NP200', 'Isuzu KB', 'Hyundai i20']
+
+
+def fake_values(rng, field):
+    if field == 'customer_name':
+        return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    if field == 'contact_number':
+        return '0' + ''.join(rng.choices(string.digits, k=9))
+    if field == 'vehicle_registration':
+        return ''.join(rng.choices(string.ascii_uppercase, k=2)) + ' ' + ''.join(rng.choices(string.digits, k=3)) + '-GP'
+    if field in ('vehicle_make', 'vehicle_model', 'name', 'description'):
+        return rng.choice(MAKES)
+    if field == 'invoice_number':
+        return f'INV-{rng.randint(1, 999999)}'
+    return 'Customer says ' + ' '.join(rng.choices(['leak', 'overheating', 'service', 'fan', 'noise', 'urgent'], k=3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    index = InvertedIndex()
+    labels = list(INDEXED_FIELDS)
+    phones = []
+
+    started = time.perf_counter()
+    for pk in range(1, args.records + 1):
+        label = labels[pk % len(labels)]
+        values = [fake_values(rng, field) for field in INDEXED_FIELDS[label]]
+        phones.append(values[INDEXED_FIELDS[label].index('contact_number')])
+        index.add(label, pk, values)
+    index.sort_tokens()
+    print(f'indexed {args.records} records in {time.perf_counter() - started:.2f} s')
+
+    queries = [rng.choice(FIRST_NAMES) for _ in range(args.queries // 4)]
+    queries += [f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)[:3]}' for _ in range(args.queries // 4)]
+    queries += [rng.choice(phones) for _ in range(args.queries // 4)]
+    queries += ['overheat urgent' for _ in range(args.queries // 4)]
+
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    print(
+        f'{len(timings)} queries: median {statistics.median(timings):.2f} ms, '
+        f'p95 {timings[int(len(timings) * 0.95) - 1]:.2f} ms, max {timings[-1]:.2f} ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure time from process start to the first HTTP response.
+
+Usage:
+    python benchmarks/startup.py                  # gunicorn with gunicorn.conf.py
+    python benchmarks/startup.py --server runserver
+    python benchmarks/startup.py --runs 10 --path /login/
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, port):
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}']
+    return [sys.executable, 'manage.py', 'runserver', '--noreload', f'127.0.0.1:{port}']
+
+
+def time_to_first_response(server, path, timeout):
+    port = free_port()
+    env = {**os.environ, 'PORT': str(port)}
+    url = f'http://127.0.0.1:{port}{path}'
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        server_command(server, port),
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                urllib.request.urlopen(url, timeout=1).read()
+                return time.perf_counter() - started
+            except urllib.error.HTTPError:
+                # Any HTTP status (e.g. a login redirect or 400) still counts as a response
+                return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                if process.poll() is not None:
+                    raise RuntimeError(f'{server} exited with code {process.returncode}')
+                time.sleep(0.01)
+        raise RuntimeError(f'No response from {url} within {timeout}s')
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=['gunicorn', 'runserver'], default='gunicorn')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/login/')
+    parser.add_argument('--timeout', type=float, default=60)
+    args = parser.parse_args()
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        elapsed = time_to_first_response(args.server, args.path, args.timeout)
+        timings.append(elapsed)
+        print(f'run {run}: {elapsed * 1000:.0f} ms')
+
+    print(
+        f'{args.server} time to first response over {args.runs} runs: '
+        f'min {min(timings) * 1000:.0f} ms, median {statistics.median(timings) * 1000:.0f} ms, '
+        f'max {max(timings) * 1000:.0f} ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Measure vehicle make/model suggestions on a throwaway database of synthetic jobs.
+
+Reports the time to build the prefix tries from the jobs table, then the median
+and slowest lookup for makes and models as they are typed one letter at a time,
+and for the incremental update a saved job triggers.
+
+Usage:
+    python benchmarks/vehicle_suggest.py                    # 100k jobs
+    python benchmarks/vehicle_suggest.py --jobs 20000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workshop_manager.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from jobs.models import Job  # noqa: E402
+from vehicles.index import vehicle_index  # noqa: E402
+from vehicles.views import SUGGESTIONS  # noqa: E402
+
+MAKES = ['Toyota', 'Volkswagen', 'Ford', 'Nissan', 'Hyundai', 'Isuzu', 'Mazda', 'Kia', 'Renault', 'Suzuki',
+         'Mercedes-Benz', 'BMW', 'Audi', 'Honda', 'Mahindra', 'Chevrolet', 'Opel', 'Haval', 'Tata', 'Land Rover']
+
+
+def create_jobs(count, rng):
+    """Jobs with a few popular makes and a long tail of models, some spelled inconsistently"""
+    models = {make: [''.join(rng.choices(string.ascii_uppercase + string.digits, k=rng.randint(2, 8))).title()
+                     for _ in range(rng.randint(20, 200))] for make in MAKES}
+    vehicles = []
+    batch = []
+    for _ in range(count):
+        make = MAKES[min(int(rng.paretovariate(1.2)) - 1, len(MAKES) - 1)]
+        model = rng.choice(models[make])
+        vehicles.append((make, model))
+        if rng.random() < 0.05:
+            make = make.upper()
+        batch.append(Job(customer_name='Customer', contact_number='0825550100', vehicle_registration='CA 1',
+                         vehicle_make=make, vehicle_model=model, work_type='repair'))
+        if len(batch) == 5000:
+            Job.objects.bulk_create(batch)
+            batch = []
+    Job.objects.bulk_create(batch)
+    return vehicles
+
+
+def report(label, timings):
+    print(f'{label:<24}{statistics.median(timings):>7.3f} ms{max(timings):>7.3f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        rng = random.Random(42)
+        vehicles = create_jobs(args.jobs, rng)
+
+        started = time.perf_counter()
+        vehicle_index.ensure_current()
+        built = time.perf_counter() - started
+        print(f'indexed {vehicle_index.makes.size} makes and {vehicle_index.models.size} models '
+              f'from {args.jobs} jobs in {built:.2f} s')
+
+        print(f"{'lookup':<24}{'median':>10}{'max':>10}")
+        makes, models = [], []
+        for _ in range(args.queries):
+            make, model = rng.choice(vehicles)
+            # Every keystroke of the make, then of the model under that make
+            for length in range(len(make) + 1):
+                started = time.perf_counter()
+                vehicle_index.suggest_makes(make[:length], SUGGESTIONS)
+                makes.append((time.perf_counter() - started) * 1000)
+            for length in range(len(model) + 1):
+                started = time.perf_counter()
+                vehicle_index.suggest_models(model[:length], make, SUGGESTIONS)
+                models.append((time.perf_counter() - started) * 1000)
+        report('make keystroke', makes)
+        report('model keystroke', models)
+
+        saves = []
+        for _ in range(args.queries):
+            (old_make, old_model), (make, model) = rng.choice(vehicles), rng.choice(vehicles)
+            started = time.perf_counter()
+            vehicle_index.add(old_make, old_model, delta=-1)
+            vehicle_index.add(make, model)
+            saves.append((time.perf_counter() - started) * 1000)
+        report('job saved', saves)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Bulk status transitions for jobs and parts orders.
+
+``Job.save`` and ``Radiator.save`` set ``date_completed`` in Python, so a plain
+``queryset.update(status=...)`` would skip that rule. ``bulk_transition`` applies
+the same rule in SQL instead, so any number of rows change in one ``UPDATE``.
+"""
+
+from django.db import transaction
+from django.db.models import Case, DateField, F, Value, When
+from django.utils import timezone
+
+from .signals import statuses_changed
+
+COMPLETED = 'Completed'
+
+
+def bulk_transition(model, pks, status):
+    """
+    Move the given records to ``status`` in a single UPDATE. Returns the number changed.
+
+    Records already in that status are left alone. Completing keeps an existing
+    completion date and otherwise stamps today; any other status clears it, exactly
+    like ``save()``. ``statuses_changed`` is sent once with every change.
+    """
+    if status not in dict(model.STATUS_CHOICES):
+        raise ValueError(f'Unknown status: {status}')
+    today = timezone.now().date()
+    if status == COMPLETED:
+        date_completed = Case(
+            When(date_completed__isnull=True, then=Value(today)),
+            default=F('date_completed'),
+            output_field=DateField(),
+        )
+    else:
+        date_completed = Value(None, output_field=DateField())
+
+    with transaction.atomic():
+        queryset = model.objects.filter(pk__in=pks).exclude(status=status)
+        previous = list(queryset.select_for_update().values_list('pk', 'status', 'date_completed'))
+        if not previous:
+            return 0
+        updated = queryset.update(status=status, date_completed=date_completed, updated_at=timezone.now())
+
+        changes = {}
+        for pk, old_status, old_date in previous:
+            new_date = (old_date or today) if status == COMPLETED else None
+            changes[pk] = {'status': [old_status, status]}
+            if new_date != old_date:
+                changes[pk]['date_completed'] = [old_date, new_date]
+        statuses_changed.send(sender=model, status=status, changes=changes)
+    return updated
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent once per bulk_transition call, inside its transaction, with
+# sender=model, status=new status and changes={pk: {field: [old, new]}}
+statuses_changed = Signal()
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = 'board'
+
+urlpatterns = [
+    path('', views.board, name='board'),
+    path('<str:kind>/<int:pk>/status/', views.update_status, name='update_status'),
+    path('<str:kind>/status/', views.bulk_update_status, name='bulk_update_status'),
+]
@@ -0,0 +1,125 @@
+import json
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views.decorators.http import require_http_methods, require_POST
+
+from inventory.models import Radiator
+from jobs.models import Job
+
+from .services import bulk_transition
+
+# Only the columns a card shows (and __str__ needs, for the audit log) are loaded
+BOARDS = {
+    'job': {
+        'model': Job,
+        'title': 'Vehicles',
+        'list_url': 'jobs:job_list',
+        'fields': ['customer_name', 'vehicle_registration', 'vehicle_make', 'vehicle_model', 'status', 'date_received', 'date_completed'],
+    },
+    'radiator': {
+        'model': Radiator,
+        'title': 'Radiators',
+        'list_url': 'inventory:radiator_list',
+        'fields': ['name', 'part_type', 'customer_name', 'status', 'date_received', 'date_completed'],
+    },
+}
+
+# Completed work piles up forever; the board only shows the most recent
+COMPLETED_LIMIT = 50
+
+
+@login_required
+def board(request):
+    """Kanban board of jobs or parts orders by status"""
+    kind = request.GET.get('kind')
+    if kind not in BOARDS:
+        kind = 'job'
+    config = BOARDS[kind]
+    model = config['model']
+    cards = model.objects.only(*config['fields'])
+    columns = []
+    for status, label in model.STATUS_CHOICES:
+        items = cards.filter(status=status)
+        if status == 'Completed':
+            items = items.order_by('-date_completed', '-id')[:COMPLETED_LIMIT]
+        columns.append({'status': status, 'label': label, 'items': list(items)})
+    return render(request, 'board/board.html', {
+        'kind': kind,
+        'title': config['title'],
+        'boards': {key: value['title'] for key, value in BOARDS.items()},
+        'columns': columns,
+        'completed_limit': COMPLETED_LIMIT,
+    })
+
+
+@login_required
+@require_http_methods(['PATCH'])
+def update_status(request, kind, pk):
+    """Set one record's status from a JSON body like {"status": "Completed"}; returns 204"""
+    config = BOARDS.get(kind)
+    if config is None:
+        raise Http404
+    model = config['model']
+    try:
+        status = json.loads(request.body)['status']
+    except (ValueError, TypeError, KeyError):
+        return JsonResponse({'error': 'Expected a JSON body like {"status": "Completed"}'}, status=400)
+    if not isinstance(status, str) or status not in dict(model.STATUS_CHOICES):
+        return JsonResponse({'error': f'Unknown status: {status}'}, status=400)
+
+    obj = get_object_or_404(model.objects.only(*config['fields']), pk=pk)
+    if obj.status != status:
+        obj.status = status
+        # save() still sets or clears date_completed; updated_at keeps the search and archive syncs current
+        obj.save(update_fields=['status', 'date_completed', 'updated_at'])
+    return HttpResponse(status=204)
+
+
+@login_required
+@require_POST
+def bulk_update_status(request, kind):
+    """
+    Move many records to one status in a single UPDATE.
+
+    Accepts the list pages' form (``ids`` checkboxes and ``status``), which redirects
+    back, or a JSON body like {"ids": [1, 2], "status": "Completed"}, which gets
+    {"updated": n} back.
+    """
+    config = BOARDS.get(kind)
+    if config is None:
+        raise Http404
+    model = config['model']
+    is_json = request.content_type == 'application/json'
+    try:
+        if is_json:
+            data = json.loads(request.body)
+            pks, status = data['ids'], data['status']
+            # int() would also accept "12", 1.9 (as 1) and True, and iterate over a string or an object
+            if not isinstance(pks, list) or not all(type(pk) is int for pk in pks):
+                raise ValueError('ids must be a list of integers')
+        else:
+            pks, status = [int(pk) for pk in request.POST.getlist('ids')], request.POST.get('status')
+        if not pks:
+            raise ValueError('No records selected')
+        updated = bulk_transition(model, pks, status)
+    except (ValueError, TypeError, KeyError):
+        if is_json:
+            return JsonResponse({'error': 'Expected {"ids": [1, 2, ...], "status": "..."} with a known status'}, status=400)
+        messages.error(request, 'Select at least one record and a status.')
+        return _redirect_back(request, config)
+
+    if is_json:
+        return JsonResponse({'updated': updated})
+    messages.success(request, f'{updated} {config["title"].lower()} moved to {status}.')
+    return _redirect_back(request, config)
+
+
+def _redirect_back(request, config):
+    next_url = request.POST.get('next')
+    if next_url and url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect(config['list_url'])
@@ -1,3 +1,17 @@
 from django.contrib import admin
+from search.admin import IndexedSearchMixin
+from workshop_manager.paginators import EstimatedCountPaginator
+from .models import Booking
 
-# Register your models here.
+
+@admin.register(Booking)
+class BookingAdmin(IndexedSearchMixin, admin.ModelAdmin):
+    list_display = ['customer_name', 'booking_type', 'booking_date', 'booking_time', 'status', 'linked_job', 'linked_radiator']
+    list_filter = ['status', 'booking_type', 'booking_date']
+    list_select_related = ['linked_job', 'linked_radiator']
+    search_fields = ['^customer_name', '^vehicle_registration']
+    # Plain id inputs instead of <select>s holding every job and parts order
+    raw_id_fields = ['linked_job', 'linked_radiator']
+    ordering = ['-booking_date', '-id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
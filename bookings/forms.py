@@ -1,4 +1,5 @@
 from django import forms
+from absentees.models import Employee
 from .models import Booking
 
 
@@ -18,9 +19,11 @@ class BookingForm(forms.ModelForm):
             'part_type',
             'vehicle_make',
             'vehicle_model',
+            'vehicle_registration',
             'description',
             'notes',
             'status',
+            'assigned_to',
         ]
         widgets = {
             'booking_type': forms.Select(attrs={
@@ -28,13 +31,16 @@ class BookingForm(forms.ModelForm):
                 'id': 'id_booking_type',
                 'onchange': 'toggleBookingFields()'
             }),
+            # Suggestions come from the customer matcher instead of the browser's form history
             'customer_name': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Enter customer name'
+                'placeholder': 'Enter customer name',
+                'autocomplete': 'off'
             }),
             'contact_number': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'Enter contact number'
+                'placeholder': 'Enter contact number',
+                'autocomplete': 'off'
             }),
             'booking_date': forms.DateInput(attrs={
                 'class': 'form-control',
@@ -61,12 +67,19 @@ class BookingForm(forms.ModelForm):
             'vehicle_make': forms.TextInput(attrs={
                 'class': 'form-control',
                 'id': 'id_vehicle_make',
-                'placeholder': 'Enter vehicle make (e.g., Toyota, Ford)'
+                'placeholder': 'Enter vehicle make (e.g., Toyota, Ford)',
+                'autocomplete': 'off'
             }),
             'vehicle_model': forms.TextInput(attrs={
                 'class': 'form-control',
                 'id': 'id_vehicle_model',
-                'placeholder': 'Enter vehicle model (e.g., Corolla, Focus)'
+                'placeholder': 'Enter vehicle model (e.g., Corolla, Focus)',
+                'autocomplete': 'off'
+            }),
+            'vehicle_registration': forms.TextInput(attrs={
+                'class': 'form-control',
+                'id': 'id_vehicle_registration',
+                'placeholder': 'Enter vehicle registration (if known)'
             }),
             'description': forms.TextInput(attrs={
                 'class': 'form-control',
@@ -81,10 +94,14 @@ class BookingForm(forms.ModelForm):
             'status': forms.Select(attrs={
                 'class': 'form-control'
             }),
+            'assigned_to': forms.Select(attrs={
+                'class': 'form-control'
+            }),
         }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fields['assigned_to'].queryset = Employee.objects.filter(is_technician=True)
         # Set initial visibility based on booking_type
         if self.instance and self.instance.pk:
             if self.instance.booking_type == 'vehicle':
@@ -144,6 +161,7 @@ class BookingForm(forms.ModelForm):
             cleaned_data['work_type'] = None
             cleaned_data['vehicle_make'] = None
             cleaned_data['vehicle_model'] = None
+            cleaned_data['vehicle_registration'] = None
         
         return cleaned_data
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_booking_vehicle_make_booking_vehicle_model_and_more'),
+        ('inventory', '0005_large_table_indexes'),
+        ('jobs', '0004_large_table_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['booking_date', 'booking_time'], name='bookings_booking_date_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_large_table_indexes'),
+        ('customers', '0001_initial'),
+        ('inventory', '0007_radiator_customer'),
+        ('jobs', '0005_job_customer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='customer',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='customers.customer'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['customer', 'booking_date'], name='bookings_booking_customer_idx'),
+        ),
+    ]
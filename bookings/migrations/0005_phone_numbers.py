@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:24
+
+import customers.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_booking_customer'),
+        ('customers', '0003_phone_numbers'),
+        ('inventory', '0008_phone_numbers'),
+        ('jobs', '0006_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['contact_number', 'booking_date'], name='bookings_booking_contact_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:31
+
+import vehicles.fields
+from django.db import migrations, models
+
+from vehicles.fields import normalize_registration
+
+BATCH_SIZE = 1000
+
+
+def normalize_registrations(apps, schema_editor):
+    """Store registrations uppercase without separators"""
+    model = apps.get_model('bookings', 'Booking')
+    last_pk = None
+    while True:
+        page = model.objects.exclude(vehicle_registration__isnull=True).order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        batch = list(page.only('pk', 'vehicle_registration')[:BATCH_SIZE])
+        if not batch:
+            return
+        changed = []
+        for obj in batch:
+            registration = normalize_registration(obj.vehicle_registration)
+            if registration != obj.vehicle_registration:
+                obj.vehicle_registration = registration
+                changed.append(obj)
+        model.objects.bulk_update(changed, ['vehicle_registration'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0005_phone_numbers'),
+        ('customers', '0004_e164_phone_numbers'),
+        ('inventory', '0008_phone_numbers'),
+        ('jobs', '0006_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='vehicle_registration',
+            field=vehicles.fields.RegistrationField(blank=True, help_text='Vehicle registration number', max_length=50, null=True),
+        ),
+        migrations.RunPython(normalize_registrations, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['vehicle_registration', 'booking_date'], name='bookings_booking_reg_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('absentees', '0003_employee_is_technician'),
+        ('bookings', '0006_registrations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='assigned_to',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='absentees.employee'),
+        ),
+    ]
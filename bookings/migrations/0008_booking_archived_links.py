@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-19 20:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0003_registrations'),
+        ('bookings', '0007_booking_assigned_to'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='archived_job',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='archive.archivedjob'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='archived_radiator',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='archive.archivedradiator'),
+        ),
+    ]
@@ -2,6 +2,9 @@ from django.db import models
 from django.urls import reverse
 from django.utils import timezone
 
+from customers.fields import PhoneNumberField
+from vehicles.fields import RegistrationField
+
 
 class Booking(models.Model):
     """Model for booking vehicles or radiators"""
@@ -41,7 +44,7 @@ class Booking(models.Model):
     # Basic booking information
     booking_type = models.CharField(max_length=20, choices=BOOKING_TYPE_CHOICES)
     customer_name = models.CharField(max_length=200)
-    contact_number = models.CharField(max_length=20)
+    contact_number = PhoneNumberField(max_length=20)
     
     # Date and time
     booking_date = models.DateField()
@@ -55,7 +58,7 @@ class Booking(models.Model):
     # Vehicle fields (for vehicle bookings)
     vehicle_make = models.CharField(max_length=100, blank=True, null=True, help_text="Vehicle make (e.g., Toyota, Ford)")
     vehicle_model = models.CharField(max_length=100, blank=True, null=True, help_text="Vehicle model (e.g., Corolla, Focus)")
-    vehicle_registration = models.CharField(max_length=50, blank=True, null=True, help_text="Vehicle registration number")
+    vehicle_registration = RegistrationField(max_length=50, blank=True, null=True, help_text="Vehicle registration number")
     
     # Description (for radiator bookings)
     description = models.CharField(max_length=500, blank=True, null=True, help_text="Radiator/Part description")
@@ -64,9 +67,28 @@ class Booking(models.Model):
     notes = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
-    # Links to existing records (optional, linked by customer name)
+    # Set from customer_name/contact_number on save (see customers.services)
+    customer = models.ForeignKey(
+        'customers.Customer', on_delete=models.SET_NULL, blank=True, null=True,
+        editable=False, db_index=False, related_name='bookings',
+    )
+    
+    # Technician for the booking's date (proposed by assignments.planner)
+    assigned_to = models.ForeignKey(
+        'absentees.Employee', on_delete=models.SET_NULL, blank=True, null=True, related_name='bookings',
+    )
+    
+    # Links to existing records (optional, linked through the customer)
     linked_job = models.ForeignKey('jobs.Job', on_delete=models.SET_NULL, blank=True, null=True, related_name='bookings')
     linked_radiator = models.ForeignKey('inventory.Radiator', on_delete=models.SET_NULL, blank=True, null=True, related_name='bookings')
+    # The same links once the record has been archived (see archive.services), which clears the live ones
+    archived_job = models.ForeignKey(
+        'archive.ArchivedJob', on_delete=models.SET_NULL, blank=True, null=True, editable=False, related_name='bookings',
+    )
+    archived_radiator = models.ForeignKey(
+        'archive.ArchivedRadiator', on_delete=models.SET_NULL, blank=True, null=True, editable=False,
+        related_name='bookings',
+    )
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -74,6 +96,12 @@ class Booking(models.Model):
     
     class Meta:
         ordering = ['booking_date', 'booking_time']
+        indexes = [
+            models.Index(fields=['booking_date', 'booking_time'], name='bookings_booking_date_idx'),
+            models.Index(fields=['customer', 'booking_date'], name='bookings_booking_customer_idx'),
+            models.Index(fields=['contact_number', 'booking_date'], name='bookings_booking_contact_idx'),
+            models.Index(fields=['vehicle_registration', 'booking_date'], name='bookings_booking_reg_idx'),
+        ]
     
     def __str__(self):
         booking_type_display = "Vehicle" if self.booking_type == 'vehicle' else "Radiator"
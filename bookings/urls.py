@@ -6,6 +6,7 @@ app_name = 'bookings'
 urlpatterns = [
     path('', views.booking_calendar, name='booking_calendar'),
     path('list/', views.booking_list, name='booking_list'),
+    path('list/rows/', views.booking_rows, name='booking_rows'),
     path('events/', views.booking_events_api, name='booking_events_api'),
     path('create/', views.booking_create, name='booking_create'),
     path('<int:pk>/', views.booking_detail, name='booking_detail'),
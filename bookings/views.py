@@ -3,18 +3,54 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from .models import Booking
 from .forms import BookingForm
 from jobs.models import Job
 from inventory.models import Radiator
+from customers.matcher import existing_customer
+from customers.services import assign_customers, set_customer
+from workshop_manager.listing import record_list
+from workshop_manager.routers import use_replica
+
+# Choice fields the booking list can be filtered on
+BOOKING_FILTERS = {'status': Booking.STATUS_CHOICES, 'booking_type': Booking.BOOKING_TYPE_CHOICES}
+
+# ?when= choices, relative to today
+BOOKING_PERIODS = [('upcoming', 'Upcoming'), ('past', 'Past')]
+
+# Sort key -> (label, ordering); the first is the default. Each ends in id so the keyset is unique.
+BOOKING_SORTS = {
+    'date': ('Date (earliest first)', ['booking_date', 'booking_time', 'id']),
+    'date_desc': ('Date (latest first)', ['-booking_date', '-booking_time', '-id']),
+}
+
+
+def _booking_list_context(request):
+    bookings = Booking.objects.all()
+    when = request.GET.get('when')
+    if when == 'upcoming':
+        bookings = bookings.filter(booking_date__gte=date.today())
+    elif when == 'past':
+        bookings = bookings.filter(booking_date__lt=date.today())
+    return record_list(request, bookings, BOOKING_FILTERS, BOOKING_SORTS)
 
 
 @login_required
 def booking_list(request):
-    """List all bookings"""
-    bookings = Booking.objects.all().order_by('booking_date', 'booking_time')
-    return render(request, 'bookings/booking_list.html', {'bookings': bookings})
+    """List bookings by date, filtered and sorted from the query string"""
+    return render(request, 'bookings/booking_list.html', {
+        **_booking_list_context(request),
+        'status_choices': Booking.STATUS_CHOICES,
+        'booking_type_choices': Booking.BOOKING_TYPE_CHOICES,
+        'periods': BOOKING_PERIODS,
+    })
+
+
+@login_required
+def booking_rows(request):
+    """Just the table rows of booking_list, swapped in by the list page when its filters, sort or page change"""
+    return render(request, 'bookings/booking_rows.html', _booking_list_context(request))
 
 
 @login_required
@@ -24,8 +60,9 @@ def booking_calendar(request):
 
 
 @login_required
-def booking_events_api(request):
-    """API endpoint to return bookings as JSON for FullCalendar"""
+@use_replica
+async def booking_events_api(request):
+    """API endpoint to return bookings as JSON for the booking calendar (async so feed refreshes don't hold a worker)"""
     start = request.GET.get('start')
     end = request.GET.get('end')
     
@@ -50,7 +87,7 @@ def booking_events_api(request):
             pass
     
     events = []
-    for booking in bookings:
+    async for booking in bookings.aiterator():
         # Determine start datetime
         if booking.all_day:
             start_datetime = datetime.combine(booking.booking_date, datetime.min.time())
@@ -59,7 +96,6 @@ def booking_events_api(request):
         else:
             start_datetime = datetime.combine(booking.booking_date, booking.booking_time)
             # Default to 1 hour duration if not all day
-            from datetime import timedelta
             end_datetime = start_datetime + timedelta(hours=1)
             all_day = False
         
@@ -112,32 +148,23 @@ def booking_create(request):
         if form.is_valid():
             booking = form.save(commit=False)
             
-            # Try to link to existing records by customer name
-            if booking.booking_type == 'vehicle':
-                # Try to find matching job
-                matching_job = Job.objects.filter(
-                    customer_name__iexact=booking.customer_name
-                ).order_by('-created_at').first()
-                if matching_job:
-                    booking.linked_job = matching_job
-            
-            elif booking.booking_type == 'radiator':
-                # Try to find matching radiator
-                matching_radiator = Radiator.objects.filter(
-                    customer_name__iexact=booking.customer_name
-                ).order_by('-created_at').first()
-                if matching_radiator:
-                    booking.linked_radiator = matching_radiator
-            
+            # Link to the customer with this number, else this name, else the closest name (tolerating typos),
+            # else a new one
+            customer = existing_customer(booking.customer_name, booking.contact_number)
+            if customer is not None:
+                set_customer(booking, customer)
+            else:
+                assign_customers([booking])
             booking.save()
             
             # Create Job or Radiator record
             if booking.booking_type == 'vehicle':
-                # Create Job record using vehicle fields (vehicle_registration will be "TBD" since it's not in booking)
+                # Create Job record using vehicle fields (the registration stays blank until it is known)
                 job = Job.objects.create(
+                    customer=booking.customer,
                     customer_name=booking.customer_name,
                     contact_number=booking.contact_number,
-                    vehicle_registration="TBD",  # Not collected in booking form
+                    vehicle_registration=booking.vehicle_registration or '',
                     vehicle_make=booking.vehicle_make,
                     vehicle_model=booking.vehicle_model,
                     work_type=booking.work_type,
@@ -153,6 +180,7 @@ def booking_create(request):
                 radiator = Radiator.objects.create(
                     name=booking.description,
                     part_type=booking.part_type,
+                    customer=booking.customer,
                     customer_name=booking.customer_name,
                     contact_number=booking.contact_number,
                     status='Pending',
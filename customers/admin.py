@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import Customer
+
+
+@admin.register(Customer)
+class CustomerAdmin(admin.ModelAdmin):
+    list_display = ['name', 'contact_number', 'created_at']
+    search_fields = ['^name', '^contact_number']
+    readonly_fields = ['name_key', 'phone_key']
+    ordering = ['name', 'id']
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class CustomersConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'customers'
+
+    def ready(self):
+        from . import services
+        services.connect_signals()
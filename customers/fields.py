@@ -0,0 +1,12 @@
+from django.db import models
+
+from .phones import to_e164
+
+
+class PhoneNumberField(models.CharField):
+    """A CharField stored in E.164 form. Normalized on every save, including bulk_create."""
+
+    def pre_save(self, model_instance, add):
+        value = to_e164(getattr(model_instance, self.attname))
+        setattr(model_instance, self.attname, value)
+        return value
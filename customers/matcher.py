@@ -0,0 +1,263 @@
+"""
+Fuzzy customer lookup over an in-process character-trigram index.
+
+Names and phone numbers are split into trigrams (names per word, padded like
+pg_trgm, so "smith" gives "  s", " sm", "smi", "mit", "ith", "th "). A candidate's
+score for a field is the trigram similarity shared / (query + candidate - shared),
+and the overall score is the mean over the fields given in the query. Typos cost
+a few trigrams instead of the whole match: "Jon Smith" scores 0.62 against
+"John Smith". For autocomplete the last word is matched as a prefix and scored by
+how much of the query the candidate contains.
+
+Like the search index, each worker builds the index on first use, keeps it current
+with post_save/post_delete and picks up other processes' changes with an
+``updated_at`` delta query at most once every ``SEARCH_SYNC_INTERVAL`` seconds
+(see workshop_manager.syncing).
+Postings are plain lists of ids (customers are rarely edited, so removal by
+``list.remove`` is cheap enough) to keep memory at a few tens of MB per 100k customers.
+"""
+
+import heapq
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+from workshop_manager.syncing import DeltaSyncedIndex
+
+from .models import Customer
+from .phones import is_phone_number
+from .services import customer_keys, find_customer
+
+# Lowest score returned as a suggestion
+MIN_SCORE = 0.3
+
+
+def name_trigrams(name_key, prefix=False):
+    """Trigrams of each word, padded with two spaces in front and one behind (not behind the last word for a prefix)"""
+    words = name_key.split()
+    grams = set()
+    for position, word in enumerate(words):
+        padded = f'  {word}' if prefix and position == len(words) - 1 else f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def phone_trigrams(phone_key):
+    return {phone_key[i:i + 3] for i in range(len(phone_key) - 2)}
+
+
+@dataclass
+class Match:
+    customer: Customer
+    score: float
+
+
+class _Field:
+    """Trigram postings for one field: trigram -> [customer id, ...]"""
+
+    def __init__(self, trigrams):
+        self.trigrams = trigrams
+        self.postings = defaultdict(list)
+
+    def add(self, pk, key):
+        grams = self.trigrams(key)
+        for gram in grams:
+            self.postings[gram].append(pk)
+        return len(grams)
+
+    def remove(self, pk, key):
+        for gram in self.trigrams(key):
+            postings = self.postings.get(gram)
+            if postings is None:
+                continue
+            try:
+                postings.remove(pk)
+            except ValueError:
+                pass
+            if not postings:
+                del self.postings[gram]
+
+    def shared_counts(self, grams):
+        """customer id -> number of the query trigrams it shares"""
+        counts = Counter()
+        for gram in grams:
+            postings = self.postings.get(gram)
+            if postings:
+                counts.update(postings)
+        return counts
+
+
+class TrigramIndex(DeltaSyncedIndex):
+    def __init__(self):
+        super().__init__()
+        self.names = _Field(name_trigrams)
+        self.phones = _Field(phone_trigrams)
+        self.documents = {}  # customer id -> (name_key, phone_key, name trigram count, phone trigram count)
+
+    def add(self, pk, name_key, phone_key):
+        with self.lock:
+            self.remove(pk)
+            self.documents[pk] = (
+                name_key, phone_key, self.names.add(pk, name_key), self.phones.add(pk, phone_key),
+            )
+
+    def remove(self, pk):
+        with self.lock:
+            document = self.documents.pop(pk, None)
+            if document is not None:
+                self.names.remove(pk, document[0])
+                self.phones.remove(pk, document[1])
+
+    def load(self, queryset):
+        for pk, name_key, phone_key in queryset.values_list('pk', 'name_key', 'phone_key').iterator(chunk_size=2000):
+            self.add(pk, name_key, phone_key)
+
+    def load_all(self):
+        self.load(Customer.objects.all())
+
+    def load_changed(self, since):
+        self.load(Customer.objects.filter(updated_at__gte=since))
+
+    def scores(self, name='', contact_number='', limit=10, prefix=False):
+        """The ``limit`` best (customer id, score) pairs scoring at least MIN_SCORE, best first"""
+        name_key, phone_key = customer_keys(name, contact_number)
+        # (field, query trigrams, position of the field's trigram count in a document)
+        queries = [
+            (field, grams, position)
+            for field, grams, position in [
+                (self.names, name_trigrams(name_key, prefix), 2),
+                (self.phones, phone_trigrams(phone_key), 3),
+            ]
+            if grams
+        ]
+        if not queries:
+            return []
+
+        with self.lock:
+            fields = []
+            for field, grams, position in queries:
+                # Rarest first: a candidate sharing ``level`` trigrams is in one of the first size - level + 1
+                postings = sorted((field.postings.get(gram, ()) for gram in grams), key=len)
+                fields.append((field.shared_counts(grams), len(grams), position, postings))
+            documents = self.documents
+
+            def score(pk):
+                document = documents[pk]
+                similarity = containment = 0.0
+                for shared, size, position, _ in fields:
+                    common = shared.get(pk, 0)
+                    similarity += common / (size + document[position] - common)
+                    containment += common / size
+                similarity /= len(fields)
+                containment /= len(fields)
+                # Autocomplete ranks by how much of what was typed matches, then by closeness
+                return (containment, similarity) if prefix else (similarity, similarity)
+
+            def best(levels):
+                candidates = set()
+                for (shared, size, _, postings), level in zip(fields, levels):
+                    for pks in postings[:size - level + 1]:
+                        candidates.update(pk for pk in pks if shared[pk] >= level)
+                return heapq.nlargest(limit, ((score(pk), pk) for pk in candidates))
+
+            # A field scores at most shared / size, so candidates sharing fewer than ``level`` trigrams in every
+            # field score below the mean of (level - 1) / size. Start from the levels that leave about ``limit``
+            # candidates per field, then lower them (cheapest field first) until nothing left out could beat
+            # the kth result, and score again if any level moved.
+            counts = [Counter(shared.values()) for shared, _, _, _ in fields]
+            sizes = [size for _, size, _, _ in fields]
+            floors = [max(math.ceil(MIN_SCORE * size), 1) for size in sizes]
+            levels = [max(floor, _level_for(count, limit)) for floor, count in zip(floors, counts)]
+            ranked = best(levels)
+            kth = max(ranked[-1][0][0], MIN_SCORE) if len(ranked) == limit else MIN_SCORE
+            lowered = False
+            while sum((level - 1) / size for level, size in zip(levels, sizes)) / len(fields) >= kth:
+                field = min(
+                    (i for i in range(len(fields)) if levels[i] > floors[i]),
+                    key=lambda i: counts[i][levels[i] - 1] * sizes[i],
+                )
+                levels[field] -= 1
+                lowered = True
+            if lowered:
+                ranked = best(levels)
+        return [(pk, primary) for (primary, _), pk in ranked if primary >= MIN_SCORE]
+
+
+def _level_for(counts, limit):
+    """The highest shared-trigram count reached by at least ``limit`` candidates, from {count: candidates}"""
+    reached = 0
+    for level, candidates in sorted(counts.items(), reverse=True):
+        reached += candidates
+        if reached >= limit:
+            return level
+    return 1
+
+
+customer_index = TrigramIndex()
+
+
+def match_customers(name='', contact_number='', limit=10, prefix=False):
+    """Best matching customers as Match(customer, score), best first, loaded with one query"""
+    customer_index.ensure_current()
+    scored = customer_index.scores(name, contact_number, limit, prefix)
+    customers = Customer.objects.in_bulk([pk for pk, _ in scored])
+    matches = []
+    for pk, score in scored:
+        if pk in customers:
+            matches.append(Match(customers[pk], score))
+        else:
+            # Deleted by another process since it was indexed
+            customer_index.remove(pk)
+    return matches
+
+
+def best_match(name, contact_number, limit=5):
+    """
+    The customer with the closest name if it scores at least CUSTOMER_MATCH_THRESHOLD,
+    else None. Only the name is scored; when ``contact_number`` is a full number, a
+    customer with a different number is never the match, however close the names are.
+    """
+    phone_key = customer_keys(name, contact_number)[1] if is_phone_number(contact_number) else ''
+    for match in match_customers(name, limit=limit):
+        if match.score < settings.CUSTOMER_MATCH_THRESHOLD:
+            break
+        if phone_key and match.customer.phone_key not in ('', phone_key):
+            continue
+        return match
+    return None
+
+
+def existing_customer(name, contact_number):
+    """
+    The customer a new record with this name and number belongs to, or None if it
+    is a new customer: the customer with this full phone number, else (without one)
+    the customer with this exact name, else the closest name among customers with
+    no number or this one.
+    """
+    customer = find_customer(name, contact_number)
+    if customer is not None:
+        return customer
+    match = best_match(name, contact_number)
+    return match.customer if match is not None else None
+
+
+def index_customer(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not customer_index.built:
+        return
+    if update_fields is not None and update_fields.isdisjoint({'name', 'contact_number'}):
+        return
+    customer_index.add(instance.pk, instance.name_key, instance.phone_key)
+
+
+def unindex_customer(sender, instance, **kwargs):
+    if customer_index.built:
+        customer_index.remove(instance.pk)
+
+
+def connect_signals():
+    # Customers created in bulk (imports, linking) are picked up by the delta sync
+    post_save.connect(index_customer, sender=Customer, dispatch_uid='customer_index')
+    post_delete.connect(unindex_customer, sender=Customer, dispatch_uid='customer_unindex')
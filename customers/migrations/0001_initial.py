@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Customer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('contact_number', models.CharField(blank=True, max_length=20)),
+                ('name_key', models.CharField(editable=False, max_length=200)),
+                ('phone_key', models.CharField(blank=True, editable=False, max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['name_key'], name='customers_name_key_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('phone_key', ''), _negated=True), fields=('phone_key',), name='customers_phone_key_uniq'), models.UniqueConstraint(condition=models.Q(('phone_key', '')), fields=('name_key',), name='customers_name_key_uniq')],
+            },
+        ),
+    ]
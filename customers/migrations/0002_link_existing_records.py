@@ -0,0 +1,39 @@
+from django.db import migrations
+
+from customers.services import assign_customers
+
+BATCH_SIZE = 1000
+
+LINKED_MODELS = [('jobs', 'Job'), ('inventory', 'Radiator'), ('bookings', 'Booking')]
+
+
+def link_existing_records(apps, schema_editor):
+    """Create one customer per distinct phone number (or name, with no number) and link every record to it"""
+    Customer = apps.get_model('customers', 'Customer')
+    for app_label, model_name in LINKED_MODELS:
+        model = apps.get_model(app_label, model_name)
+        last_pk = 0
+        while True:
+            batch = list(
+                model.objects.filter(pk__gt=last_pk).order_by('pk')
+                .only('pk', 'customer_name', 'contact_number')[:BATCH_SIZE]
+            )
+            if not batch:
+                break
+            assign_customers(batch, customer_model=Customer)
+            model.objects.bulk_update(batch, ['customer'])
+            last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0001_initial'),
+        ('jobs', '0005_job_customer'),
+        ('inventory', '0007_radiator_customer'),
+        ('bookings', '0004_booking_customer'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_existing_records, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:24
+
+import customers.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_link_existing_records'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customer',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(blank=True, max_length=20),
+        ),
+    ]
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+from customers.phones import international_digits, is_phone_number, to_e164
+
+BATCH_SIZE = 1000
+
+PHONE_MODELS = [
+    ('jobs', 'Job'), ('inventory', 'Radiator'), ('bookings', 'Booking'),
+    ('archive', 'ArchivedJob'), ('archive', 'ArchivedRadiator'),
+]
+LINKED_MODELS = [('jobs', 'Job'), ('inventory', 'Radiator'), ('bookings', 'Booking')]
+
+
+def batches(queryset):
+    last_pk = None
+    while True:
+        page = queryset.order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        batch = list(page[:BATCH_SIZE])
+        if not batch:
+            return
+        yield batch
+        last_pk = batch[-1].pk
+
+
+def normalize_numbers(apps, schema_editor):
+    """Rewrite stored numbers in E.164 form, then merge customers whose numbers turn out to be the same"""
+    for app_label, model_name in PHONE_MODELS:
+        model = apps.get_model(app_label, model_name)
+        for batch in batches(model.objects.exclude(contact_number__isnull=True).only('pk', 'contact_number')):
+            changed = []
+            for obj in batch:
+                number = to_e164(obj.contact_number)
+                if number != obj.contact_number:
+                    obj.contact_number = number
+                    changed.append(obj)
+            model.objects.bulk_update(changed, ['contact_number'])
+
+    # "082 555 0100" and "+27 82 555 0100" were two customers under the old digits-only key. Only full numbers
+    # are merged: "0" and "123" are not anyone's number, and 0005 gives those customers name keys instead.
+    Customer = apps.get_model('customers', 'Customer')
+    by_key = defaultdict(list)
+    for pk, contact_number in Customer.objects.exclude(phone_key='').order_by('pk').values_list('pk', 'contact_number').iterator():
+        if is_phone_number(contact_number):
+            by_key[international_digits(contact_number)].append(pk)
+    for pks in by_key.values():
+        keep, duplicates = pks[0], pks[1:]
+        if duplicates:
+            for app_label, model_name in LINKED_MODELS:
+                apps.get_model(app_label, model_name).objects.filter(customer__in=duplicates).update(customer=keep)
+            Customer.objects.filter(pk__in=duplicates).delete()
+
+    for batch in batches(Customer.objects.exclude(phone_key='')):
+        batch = [customer for customer in batch if is_phone_number(customer.contact_number)]
+        for customer in batch:
+            customer.contact_number = to_e164(customer.contact_number)
+            customer.phone_key = international_digits(customer.contact_number)
+        Customer.objects.bulk_update(batch, ['contact_number', 'phone_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_phone_numbers'),
+        ('jobs', '0006_phone_numbers'),
+        ('inventory', '0008_phone_numbers'),
+        ('bookings', '0005_phone_numbers'),
+        ('archive', '0002_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_numbers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+from customers.phones import is_phone_number
+from customers.services import assign_customers
+
+BATCH_SIZE = 1000
+
+LINKED_MODELS = [('jobs', 'Job'), ('inventory', 'Radiator'), ('bookings', 'Booking')]
+
+
+def split_invalid_numbers(apps, schema_editor):
+    """
+    Relink the records of customers keyed by something that is not a full phone number.
+
+    "0" and "123" used to be phone keys, so unrelated walk-ins typed with them were
+    one customer. Their records are linked again by the current keys (their own name,
+    unless the record has a full number) and the merged customers are removed.
+    """
+    Customer = apps.get_model('customers', 'Customer')
+    invalid = [
+        pk for pk, contact_number in Customer.objects.exclude(phone_key='').values_list('pk', 'contact_number').iterator()
+        if not is_phone_number(contact_number)
+    ]
+    for start in range(0, len(invalid), BATCH_SIZE):
+        pks = invalid[start:start + BATCH_SIZE]
+        records = []
+        for app_label, model_name in LINKED_MODELS:
+            model = apps.get_model(app_label, model_name)
+            records.append((model, list(model.objects.filter(customer__in=pks).only('pk', 'customer_name', 'contact_number'))))
+            model.objects.filter(customer__in=pks).update(customer=None)
+        # Deleted first, so a customer that now has a name key does not clash with the old row
+        Customer.objects.filter(pk__in=pks).delete()
+        for model, batch in records:
+            for offset in range(0, len(batch), BATCH_SIZE):
+                chunk = batch[offset:offset + BATCH_SIZE]
+                assign_customers(chunk, customer_model=Customer)
+                model.objects.bulk_update(chunk, ['customer'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0004_e164_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.RunPython(split_invalid_numbers, migrations.RunPython.noop),
+    ]
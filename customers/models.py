@@ -0,0 +1,40 @@
+from django.db import models
+from django.db.models import Q
+from django.urls import reverse
+
+from .fields import PhoneNumberField
+
+
+class Customer(models.Model):
+    """A customer shared by their jobs, parts orders and bookings"""
+
+    name = models.CharField(max_length=200)
+    contact_number = PhoneNumberField(max_length=20, blank=True)
+    # Matching keys, see customers.services.customer_keys
+    name_key = models.CharField(max_length=200, editable=False)
+    phone_key = models.CharField(max_length=20, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['name_key'], name='customers_name_key_idx'),
+        ]
+        constraints = [
+            # A customer is identified by their phone number, or by their name when no number is known
+            models.UniqueConstraint(fields=['phone_key'], condition=~Q(phone_key=''), name='customers_phone_key_uniq'),
+            models.UniqueConstraint(fields=['name_key'], condition=Q(phone_key=''), name='customers_name_key_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.contact_number})" if self.contact_number else self.name
+
+    def save(self, *args, **kwargs):
+        from .services import customer_keys
+
+        self.name_key, self.phone_key = customer_keys(self.name, self.contact_number)
+        super().save(*args, **kwargs)
+
+    def get_absolute_url(self):
+        return reverse('customers:customer_detail', kwargs={'pk': self.pk})
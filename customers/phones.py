@@ -0,0 +1,56 @@
+"""
+Phone numbers in E.164 form ("+27825550100").
+
+Numbers typed the local way ("082 555 0100") get the workshop's country code,
+``PHONE_COUNTRY_CODE``. Numbers that cannot be read as a phone number (too short,
+too long, "n/a") are kept as typed rather than lost.
+"""
+
+import re
+
+from django.conf import settings
+
+NON_DIGITS_RE = re.compile(r'\D+')
+
+# E.164 allows at most 15 digits; fewer than 8 is an extension or a typo
+MIN_DIGITS = 8
+MAX_DIGITS = 15
+
+
+def international_digits(value):
+    """
+    The digits of ``value`` with a country code: "+27 82..." and "0027 82..." keep
+    theirs, "082..." gets PHONE_COUNTRY_CODE in place of the trunk 0. Also works on a
+    partly typed number ("0825" -> "27825").
+    """
+    value = str(value or '').strip()
+    digits = NON_DIGITS_RE.sub('', value)
+    if value.startswith('+'):
+        return digits
+    if digits.startswith('00'):
+        return digits[2:]
+    if digits.startswith('0'):
+        return settings.PHONE_COUNTRY_CODE + digits[1:]
+    return digits
+
+
+def is_phone_number(value):
+    """Whether ``value`` reads as a full phone number, with MIN_DIGITS to MAX_DIGITS digits"""
+    return MIN_DIGITS <= len(international_digits(value)) <= MAX_DIGITS
+
+
+def to_e164(value):
+    """"+<digits>" for anything readable as a phone number, otherwise the value as typed (stripped)"""
+    if value is None:
+        return None
+    if is_phone_number(value):
+        return '+' + international_digits(value)
+    return str(value).strip()
+
+
+def national_digits(e164):
+    """The local way of writing a number in the workshop's country ("+27825550100" -> "0825550100")"""
+    digits = NON_DIGITS_RE.sub('', e164)
+    if digits.startswith(settings.PHONE_COUNTRY_CODE):
+        return '0' + digits[len(settings.PHONE_COUNTRY_CODE):]
+    return digits
@@ -0,0 +1,210 @@
+"""
+Link jobs, parts orders and bookings to a shared Customer.
+
+Records keep their own ``customer_name``/``contact_number``; the customer is found
+from normalized keys of those two values. A customer is identified by their phone
+number (in international form) when a full one is recorded ("J. Smith" and "John Smith"
+on the same number are one customer), otherwise by their name. Both keys are unique indexes, so a
+lookup is an index seek instead of a case-insensitive scan of every record.
+"""
+
+import re
+from datetime import date
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import CharField, DateField, F, Q, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+from django.db.models.signals import pre_save
+
+from workshop_manager import snapshots
+
+from .phones import international_digits, is_phone_number, to_e164
+
+# Models with a ``customer`` foreign key set from their customer_name/contact_number
+LINKED_MODELS = ['jobs.Job', 'inventory.Radiator', 'bookings.Booking']
+
+NAME_SEPARATORS_RE = re.compile(r'[\W_]+')
+
+
+def normalize_name(value):
+    """Casefolded words without punctuation, e.g. " Smith,  J. " -> "smith j" """
+    return ' '.join(NAME_SEPARATORS_RE.sub(' ', str(value or '').casefold()).split())
+
+
+def normalize_phone(value):
+    """
+    Digits with the country code, e.g. "(021) 555-0100" -> "27215550100" (see phones.international_digits),
+    or '' for anything that is not a full phone number ("0", "n/a"), so it falls back to the name key
+    """
+    return international_digits(value) if is_phone_number(value) else ''
+
+
+def customer_keys(name, contact_number):
+    return normalize_name(name)[:200], normalize_phone(contact_number)[:20]
+
+
+def _identity(name_key, phone_key):
+    return ('phone', phone_key) if phone_key else ('name', name_key)
+
+
+def find_customer(name, contact_number):
+    """The existing customer with the same keys as (name, contact_number), or None"""
+    from .models import Customer
+
+    name_key, phone_key = customer_keys(name, contact_number)
+    if phone_key:
+        return Customer.objects.filter(phone_key=phone_key).first()
+    if name_key:
+        return Customer.objects.filter(phone_key='', name_key=name_key).first()
+    return None
+
+
+def resolve_customers(pairs, customer_model=None):
+    """
+    The customer for each (name, contact_number) pair, created when missing; None
+    for a pair with neither.
+
+    Costs one indexed lookup for the whole list plus one insert for the new
+    customers. ``customer_model`` lets a data migration pass its historical model.
+    """
+    Customer = customer_model or apps.get_model('customers', 'Customer')
+    keyed = []
+    new = {}
+    for name, contact_number in pairs:
+        name_key, phone_key = customer_keys(name, contact_number)
+        if not name_key and not phone_key:
+            keyed.append(None)
+            continue
+        identity = _identity(name_key, phone_key)
+        keyed.append(identity)
+        new.setdefault(identity, (name, contact_number, name_key, phone_key))
+    if not new:
+        return [None] * len(keyed)
+
+    for attempt in range(2):
+        phone_keys = [value for kind, value in new if kind == 'phone']
+        name_keys = [value for kind, value in new if kind == 'name']
+        found = {
+            _identity(customer.name_key, customer.phone_key): customer
+            for customer in Customer.objects.filter(
+                Q(phone_key__in=phone_keys) | Q(phone_key='', name_key__in=name_keys)
+            )
+        }
+        missing = [identity for identity in new if identity not in found]
+        try:
+            with transaction.atomic():
+                created = Customer.objects.bulk_create([
+                    Customer(
+                        name=(name or '').strip() or contact_number.strip(),
+                        contact_number=(contact_number or '').strip(),
+                        name_key=name_key,
+                        phone_key=phone_key,
+                    )
+                    for name, contact_number, name_key, phone_key in (new[identity] for identity in missing)
+                ])
+        except IntegrityError:
+            # Another request created one of them first; the second lookup finds it
+            if attempt:
+                raise
+            continue
+        found.update(zip(missing, created))
+        break
+    return [found[identity] if identity else None for identity in keyed]
+
+
+def assign_customers(instances, customer_model=None):
+    """Set ``customer`` on each instance from its customer_name/contact_number"""
+    customers = resolve_customers(
+        [(instance.customer_name, instance.contact_number) for instance in instances], customer_model
+    )
+    for instance, customer in zip(instances, customers):
+        instance.customer = customer
+
+
+def set_customer(instance, customer):
+    """Link ``instance`` to ``customer`` and keep that link when it is saved with the same name and number"""
+    instance.customer = customer
+    snapshots.remember(instance, 'customer')
+
+
+def link_customer(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Restores and fixtures keep the stored link; partial saves (e.g. a status change) don't touch it
+    if raw or (update_fields is not None and 'customer' not in update_fields):
+        return
+    # A saved link (which may have been chosen by the fuzzy matcher) stands until the name or number is edited
+    fields = snapshots.current(instance, 'customer')
+    if instance.customer_id is not None and fields == snapshots.loaded(instance, 'customer'):
+        return
+    assign_customers([instance])
+    snapshots.remember(instance, 'customer', fields)
+
+
+def connect_signals():
+    from . import matcher
+
+    for label in LINKED_MODELS:
+        model = apps.get_model(label)
+        snapshots.track(model, 'customer', ['customer_name', 'contact_number'])
+        pre_save.connect(link_customer, sender=model, dispatch_uid=f'customer_link_{label}')
+    matcher.connect_signals()
+
+
+# Record kind in the caller summary query -> key of its list in the summary
+SUMMARY_KEYS = {
+    'job': 'open_jobs',
+    'radiator': 'open_parts_orders',
+    'booking': 'upcoming_bookings',
+}
+
+
+def caller_summary(number):
+    """
+    The customer, open jobs, open parts orders and upcoming bookings for one phone
+    number, read with a single UNION ALL query over the contact_number indexes.
+    """
+    from bookings.models import Booking
+    from inventory.models import Radiator
+    from jobs.models import Job
+
+    from .models import Customer
+
+    number = to_e164(number)
+    phone_key = normalize_phone(number)
+    text = CharField()
+    columns = ['kind', 'pk', 'title', 'detail', 'status', 'day']
+    customers = (Customer.objects.filter(phone_key=phone_key) if phone_key else Customer.objects.none()).annotate(
+        kind=Value('customer', text), title=F('name'), detail=F('contact_number'),
+        status=Value('', text), day=Cast('created_at', DateField()),
+    )
+    jobs = Job.objects.filter(contact_number=number).exclude(status='Completed').annotate(
+        kind=Value('job', text), title=F('customer_name'),
+        detail=Concat('vehicle_make', Value(' '), 'vehicle_model', Value(' ('), 'vehicle_registration', Value(')'),
+                      output_field=text),
+        day=F('date_received'),
+    )
+    radiators = Radiator.objects.filter(contact_number=number).exclude(status='Completed').annotate(
+        kind=Value('radiator', text), title=F('customer_name'), detail=F('name'), day=F('date_received'),
+    )
+    bookings = Booking.objects.filter(
+        contact_number=number, booking_date__gte=date.today(), status__in=['pending', 'confirmed'],
+    ).annotate(
+        kind=Value('booking', text), title=F('customer_name'),
+        detail=Coalesce('description', Concat('vehicle_make', Value(' '), 'vehicle_model', output_field=text)),
+        day=F('booking_date'),
+    )
+    rows = customers.order_by().values_list(*columns).union(
+        *(queryset.order_by().values_list(*columns) for queryset in (jobs, radiators, bookings)), all=True,
+    )
+
+    summary = {'number': number, 'customer': None, **{key: [] for key in SUMMARY_KEYS.values()}}
+    for kind, pk, title, detail, status, day in rows:
+        row = {'kind': kind, 'id': pk, 'title': title, 'detail': detail, 'status': status, 'date': day}
+        if kind == 'customer':
+            summary['customer'] = row
+        else:
+            summary[SUMMARY_KEYS[kind]].append(row)
+    summary['open_jobs'].sort(key=lambda row: row['date'], reverse=True)
+    summary['open_parts_orders'].sort(key=lambda row: row['date'], reverse=True)
+    summary['upcoming_bookings'].sort(key=lambda row: row['date'])
+    return summary
@@ -0,0 +1,30 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from . import matcher
+from .models import Customer
+
+
+class ExistingCustomerTests(TestCase):
+    """A new booking's name and number find the customer it belongs to, tolerating typos in the name"""
+
+    def setUp(self):
+        # A fresh index per test, built from this test's customers on first use
+        patcher = mock.patch.object(matcher, 'customer_index', matcher.TrigramIndex())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.john = Customer.objects.create(name='John Smith')
+        self.mary = Customer.objects.create(name='Mary Jones', contact_number='0825550100')
+
+    def test_typo_name_with_new_number(self):
+        self.assertEqual(matcher.existing_customer('Jon Smith', '0835550199'), self.john)
+
+    def test_typo_name_with_existing_number(self):
+        self.assertEqual(matcher.existing_customer('Mary Jone', '082 555 0100'), self.mary)
+
+    def test_close_name_on_a_different_number(self):
+        self.assertIsNone(matcher.existing_customer('Mary Jone', '0835550199'))
+
+    def test_unknown_name_with_new_number(self):
+        self.assertIsNone(matcher.existing_customer('Peter Brown', '0835550199'))
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = 'customers'
+
+urlpatterns = [
+    path('<int:pk>/', views.customer_detail, name='customer_detail'),
+    path('match/', views.customer_match, name='customer_match'),
+    path('lookup/', views.caller_lookup, name='caller_lookup'),
+]
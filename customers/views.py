@@ -0,0 +1,61 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+
+from . import matcher
+from .models import Customer
+from .services import SUMMARY_KEYS, caller_summary
+
+SUGGESTIONS = 8
+
+
+@login_required
+def customer_detail(request, pk):
+    """A customer's jobs, parts orders and bookings, each read through its customer index"""
+    customer = get_object_or_404(Customer, pk=pk)
+    return render(request, 'customers/customer_detail.html', {
+        'customer': customer,
+        'jobs': customer.jobs.order_by('-created_at'),
+        'radiators': customer.radiators.order_by('-created_at'),
+        'bookings': customer.bookings.order_by('-booking_date'),
+    })
+
+
+@login_required
+def customer_match(request):
+    """Autocomplete: customers whose name and/or number are closest to what has been typed so far"""
+    matches = matcher.match_customers(
+        request.GET.get('name', ''), request.GET.get('contact_number', ''), limit=SUGGESTIONS, prefix=True,
+    )
+    return JsonResponse({'results': [
+        {
+            'id': match.customer.pk,
+            'name': match.customer.name,
+            'contact_number': match.customer.contact_number,
+            'score': round(match.score, 3),
+        }
+        for match in matches
+    ]})
+
+
+# Page a summary row links to
+SUMMARY_URLS = {
+    'customer': 'customers:customer_detail',
+    'job': 'jobs:job_detail',
+    'radiator': 'inventory:radiator_update',
+    'booking': 'bookings:booking_detail',
+}
+
+
+@login_required
+def caller_lookup(request):
+    """Caller ID: the customer, open jobs, open parts orders and upcoming bookings for a phone number"""
+    number = request.GET.get('number', '').strip()
+    if not number:
+        return JsonResponse({'error': 'Pass the phone number as ?number='}, status=400)
+    summary = caller_summary(number)
+    for row in [summary['customer'], *(row for key in SUMMARY_KEYS.values() for row in summary[key])]:
+        if row is not None:
+            row['url'] = reverse(SUMMARY_URLS[row.pop('kind')], args=[row['id']])
+    return JsonResponse(summary)
@@ -0,0 +1,43 @@
+"""
+Gunicorn configuration for workshop_manager.
+
+The app is loaded once in the master (``preload_app``) and workers are forked
+from it, so imports, URL resolution and template compilation happen once per
+deploy instead of once per worker.
+"""
+
+import os
+
+import decouple
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = decouple.config('WEB_CONCURRENCY', default=2, cast=int)
+worker_class = decouple.config('GUNICORN_WORKER_CLASS', default='sync')
+# ASGI workers (uvicorn_worker.UvicornWorker) serve the async calendar feeds concurrently in one process
+if 'uvicorn' in worker_class.lower():
+    wsgi_app = 'workshop_manager.asgi:application'
+else:
+    wsgi_app = 'workshop_manager.wsgi:application'
+timeout = decouple.config('GUNICORN_TIMEOUT', default=30, cast=int)
+preload_app = True
+
+
+def on_starting(server):
+    """Apply pending migrations (if any) and warm shared caches in the master"""
+    from workshop_manager import startup
+
+    if decouple.config('MIGRATE_ON_BOOT', default=True, cast=bool):
+        if startup.migrate_if_needed():
+            server.log.info('Applied pending migrations')
+        else:
+            server.log.info('No pending migrations')
+    startup.warm_up()
+    # Connections opened here must not leak into the forked workers
+    startup.close_connections()
+
+
+def post_worker_init(worker):
+    """Open the worker's database connection before it accepts requests"""
+    from workshop_manager import startup
+
+    startup.open_connections()
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from importer.services import IMPORT_FORMS, import_rows, read_rows, write_error_report
+
+
+class Command(BaseCommand):
+    help = 'Bulk import jobs or parts orders from a .csv or .xlsx file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORT_FORMS))
+        parser.add_argument('file', help='CSV or Excel (.xlsx) file with a header row')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Validate every row without writing anything')
+        parser.add_argument('--errors', help='Write the per-row error report to this CSV file')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            with open(options['file'], 'rb') as stream:
+                rows = read_rows(stream, options['file'], options['kind'])
+                result = import_rows(
+                    options['kind'], rows,
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run'],
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
+        elapsed = time.perf_counter() - started
+
+        if options['errors']:
+            with open(options['errors'], 'w', newline='', encoding='utf-8') as report:
+                write_error_report(result, report)
+        else:
+            for line, field, message in result.errors[:50]:
+                self.stdout.write(f'line {line}: {field}: {message}')
+            if len(result.errors) > 50:
+                self.stdout.write(f'... and {len(result.errors) - 50} more (use --errors to save them all)')
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        rate = result.rows / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {result.created} of {result.rows} rows ({result.failed} rejected) '
+            f'in {elapsed:.1f}s, {rate:,.0f} rows/s'
+        ))
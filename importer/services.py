@@ -0,0 +1,245 @@
+"""
+Streaming bulk import of jobs and parts orders from CSV or Excel files.
+
+Rows are read one at a time (``csv`` or openpyxl in ``read_only`` mode), so a large
+file never sits in memory. Each row is cleaned by the fields of the import model
+form, the same validation the edit pages use, and valid rows are written with
+``bulk_create`` in batches. Building a whole ModelForm per row would cap the import
+at a few thousand rows per second, so one form is built and reused: its fields clean
+each value, then its ``clean_<field>`` hooks and ``clean()`` run on the row.
+Rows that fail validation are skipped and reported with their line number.
+"""
+
+import csv
+import io
+import re
+
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import transaction
+from django.forms.utils import ErrorDict
+
+from customers.services import assign_customers
+from inventory.forms import RadiatorImportForm
+from jobs.forms import JobImportForm
+from reports import comparison, rollups
+
+IMPORT_FORMS = {
+    'job': JobImportForm,
+    'radiator': RadiatorImportForm,
+}
+
+# Sheet read from a workbook that has one (e.g. a downloaded report); otherwise the first sheet
+SHEET_NAMES = {
+    'job': 'Jobs',
+    'radiator': 'Radiators',
+}
+
+# Normalized column headings that differ from the field names (e.g. the report's "Radiator Name/Model")
+HEADER_ALIASES = {
+    'radiator_name_model': 'name',
+    'radiator_name': 'name',
+    'customer': 'customer_name',
+    'phone': 'contact_number',
+    'registration': 'vehicle_registration',
+    'make': 'vehicle_make',
+    'model': 'vehicle_model',
+    'invoice': 'invoice_number',
+    'invoice_no': 'invoice_number',
+}
+
+EMPTY_VALUES = (None, '')
+
+# Cleaned values remembered per field; status, work type, make and dates repeat on most rows
+CLEAN_CACHE_SIZE = 10_000
+
+
+def normalize_header(value):
+    key = re.sub(r'[^a-z0-9]+', '_', str(value or '').strip().lower()).strip('_')
+    return HEADER_ALIASES.get(key, key)
+
+
+class ImportResult:
+    def __init__(self):
+        self.rows = 0
+        self.created = 0
+        self.errors = []  # (line number, field, message)
+
+    @property
+    def failed(self):
+        return len({line for line, _, _ in self.errors})
+
+
+def read_rows(stream, filename, kind):
+    """Yield (line number, {field: value}) for each non-empty row of a .csv or .xlsx file"""
+    name = filename.lower()
+    if name.endswith('.xlsx'):
+        rows = _xlsx_rows(stream, kind)
+    elif name.endswith('.csv'):
+        rows = _csv_rows(stream)
+    else:
+        raise ValueError('Only .csv and .xlsx files can be imported')
+
+    header = next(rows, None)
+    if header is None:
+        return
+    keys = [normalize_header(value) for value in header]
+    for number, values in enumerate(rows, start=2):
+        if all(value in EMPTY_VALUES for value in values):
+            continue
+        yield number, dict(zip(keys, values))
+
+
+def _csv_rows(stream):
+    if isinstance(stream, io.TextIOBase):
+        text = stream
+    else:
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    yield from csv.reader(text)
+
+
+def _xlsx_rows(stream, kind):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        sheet_name = SHEET_NAMES[kind]
+        sheet = workbook[sheet_name] if sheet_name in workbook.sheetnames else workbook.worksheets[0]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+class RowCleaner:
+    """Clean row dicts with the fields and clean hooks of one model form instance"""
+
+    def __init__(self, form_class):
+        self.model = form_class._meta.model
+        self.form = form_class()
+        self.fields = self.form.fields
+        # e.g. JobForm.clean_vehicle_registration, which rejects a registration with no letters or digits
+        self.field_hooks = [
+            (name, getattr(self.form, f'clean_{name}')) for name in self.fields if hasattr(self.form, f'clean_{name}')
+        ]
+        # Lets a spreadsheet use the labels shown in the app ("Radiator Replacement") as well as the stored values
+        self.choice_labels = {
+            name: {str(label).lower(): value for value, label in field.choices if value not in EMPTY_VALUES}
+            for name, field in self.fields.items()
+            if hasattr(field, 'choices')
+        }
+        self.defaults = {field.name for field in self.model._meta.concrete_fields if field.has_default()}
+        self.cache = {name: {} for name in self.fields}
+
+    def clean(self, row):
+        """Return (cleaned data, errors) where errors is a list of (field, message)"""
+        cleaned = {}
+        errors = []
+        for name, field in self.fields.items():
+            value = row.get(name)
+            if isinstance(value, str):
+                value = value.strip()
+            if value in EMPTY_VALUES and name in self.defaults:
+                continue  # the model default applies, e.g. date_received = today
+            cache = self.cache[name]
+            try:
+                outcome = cache[value]
+            except (KeyError, TypeError):
+                outcome = self.clean_value(name, field, value)
+                if len(cache) < CLEAN_CACHE_SIZE:
+                    try:
+                        cache[value] = outcome
+                    except TypeError:
+                        pass
+            if isinstance(outcome, ValidationError):
+                errors.extend((name, message) for message in outcome.messages)
+            else:
+                cleaned[name] = outcome
+        cleaned, hook_errors = self.clean_form(cleaned)
+        errors.extend(hook_errors)
+        # Saving would stamp today, which is not when a historical record was completed
+        if cleaned.get('status') == 'Completed' and 'date_completed' not in dict(errors) and not cleaned.get('date_completed'):
+            errors.append(('date_completed', 'A completed record needs the date it was completed.'))
+        return cleaned, errors
+
+    def clean_form(self, cleaned):
+        """Run the form's ``clean_<field>`` hooks and ``clean()`` on a row's cleaned values, as ``full_clean`` does"""
+        form = self.form
+        form.cleaned_data = cleaned
+        form._errors = ErrorDict()
+        for name, hook in self.field_hooks:
+            if name in cleaned:
+                try:
+                    cleaned[name] = hook()
+                except ValidationError as error:
+                    form.add_error(name, error)
+        try:
+            cleaned_data = form.clean()
+        except ValidationError as error:
+            form.add_error(None, error)
+        else:
+            if cleaned_data is not None:
+                form.cleaned_data = cleaned_data
+        errors = [
+            ('' if name == NON_FIELD_ERRORS else name, message)
+            for name, messages in form._errors.items()
+            for message in messages
+        ]
+        return form.cleaned_data, errors
+
+    def build(self, cleaned):
+        instance = self.model(**cleaned)
+        # bulk_create skips save(), so apply its rule that only completed records keep a completion date
+        instance.set_date_completed()
+        return instance
+
+    def clean_value(self, name, field, value):
+        """The cleaned value, or the ValidationError raised while cleaning it"""
+        if name in self.choice_labels and value not in EMPTY_VALUES:
+            value = self.choice_labels[name].get(str(value).lower(), value)
+        try:
+            return field.clean(value)
+        except ValidationError as error:
+            return error
+
+
+def import_rows(kind, rows, batch_size=1000, dry_run=False):
+    """
+    Validate and insert rows from ``read_rows``. Returns an ImportResult.
+
+    Each batch is inserted in its own transaction, so a failure part-way keeps the
+    batches already written. With ``dry_run`` nothing is written.
+    """
+    cleaner = RowCleaner(IMPORT_FORMS[kind])
+    manager = cleaner.model.objects
+    result = ImportResult()
+    batch = []
+
+    def write():
+        if not dry_run:
+            with transaction.atomic():
+                # bulk_create skips the pre_save hook, so link the whole batch with one lookup
+                assign_customers(batch)
+                manager.bulk_create(batch)
+                rollups.count_records(batch)
+                transaction.on_commit(comparison.bump_data_version)
+        result.created += len(batch)
+        batch.clear()
+
+    for number, row in rows:
+        result.rows += 1
+        cleaned, errors = cleaner.clean(row)
+        if errors:
+            result.errors.extend((number, field, message) for field, message in errors)
+            continue
+        batch.append(cleaner.build(cleaned))
+        if len(batch) >= batch_size:
+            write()
+    if batch:
+        write()
+    return result
+
+
+def write_error_report(result, stream):
+    """Write the per-row errors as CSV (line, field, error)"""
+    writer = csv.writer(stream)
+    writer.writerow(['line', 'field', 'error'])
+    writer.writerows(result.errors)
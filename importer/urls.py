@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+app_name = 'importer'
+
+urlpatterns = [
+    path('', views.import_records, name='import_records'),
+]
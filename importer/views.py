@@ -0,0 +1,44 @@
+import io
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from .services import IMPORT_FORMS, import_rows, read_rows, write_error_report
+
+KIND_TITLES = {
+    'job': 'Vehicle checkins',
+    'radiator': 'Radiator orders',
+}
+
+# Errors listed on the page; the full report is offered as a CSV download
+ERRORS_SHOWN = 200
+
+
+@login_required
+def import_records(request):
+    """Upload a CSV or Excel file of historical jobs or parts orders"""
+    context = {'kinds': KIND_TITLES, 'kind': request.POST.get('kind') or request.GET.get('kind', 'job')}
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        kind = context['kind']
+        if kind not in IMPORT_FORMS or upload is None:
+            messages.error(request, 'Choose what to import and a .csv or .xlsx file.')
+        else:
+            try:
+                result = import_rows(
+                    kind, read_rows(upload, upload.name, kind),
+                    dry_run=request.POST.get('dry_run') == '1',
+                )
+            except ValueError as error:
+                messages.error(request, str(error))
+            else:
+                report = io.StringIO()
+                write_error_report(result, report)
+                context.update({
+                    'result': result,
+                    'dry_run': request.POST.get('dry_run') == '1',
+                    'errors': result.errors[:ERRORS_SHOWN],
+                    'error_report': report.getvalue(),
+                })
+    return render(request, 'importer/import_records.html', context)
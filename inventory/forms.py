@@ -45,3 +45,10 @@ class RadiatorForm(forms.ModelForm):
                 'placeholder': 'Additional notes (optional)'
             }),
         }
+
+
+class RadiatorImportForm(RadiatorForm):
+    """RadiatorForm plus the dates a historical record carries, used to validate imported rows"""
+    
+    class Meta(RadiatorForm.Meta):
+        fields = RadiatorForm.Meta.fields + ['date_received', 'date_completed']
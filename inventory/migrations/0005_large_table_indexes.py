@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_radiator_invoice_number_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='radiator',
+            index=models.Index(fields=['created_at', 'id'], name='inv_radiator_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='radiator',
+            index=models.Index(fields=['date_received'], name='inv_radiator_received_idx'),
+        ),
+    ]
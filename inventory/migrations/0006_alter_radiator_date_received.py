@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:02
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_large_table_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='radiator',
+            name='date_received',
+            field=models.DateField(default=datetime.date.today),
+        ),
+    ]
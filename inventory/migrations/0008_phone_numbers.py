@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:24
+
+import customers.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_phone_numbers'),
+        ('inventory', '0007_radiator_customer'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='radiator',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(blank=True, max_length=20, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='radiator',
+            index=models.Index(fields=['contact_number'], name='inv_radiator_contact_idx'),
+        ),
+    ]
@@ -1,10 +1,13 @@
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
+from datetime import date
 
+from customers.fields import PhoneNumberField
 
-class Radiator(models.Model):
-    """Model for tracking parts orders (Radiators, Oil Coolers, Intercoolers, Fuel Tanks and Others)"""
+
+class RadiatorBase(models.Model):
+    """Fields shared by live parts orders and archived parts orders"""
     
     PART_TYPE_CHOICES = [
         ('Radiator', 'Radiator'),
@@ -23,32 +26,21 @@ class Radiator(models.Model):
     name = models.CharField(max_length=200, help_text="Radiator Name/Model")
     part_type = models.CharField(max_length=50, choices=PART_TYPE_CHOICES, default='Radiator')
     customer_name = models.CharField(max_length=200, blank=True, null=True)
-    contact_number = models.CharField(max_length=20, blank=True, null=True)
+    contact_number = PhoneNumberField(max_length=20, blank=True, null=True)
     invoice_number = models.CharField(max_length=100, blank=True, null=True)
     notes = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
-    date_received = models.DateField(auto_now_add=True)
+    date_received = models.DateField(default=date.today)
     date_completed = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        ordering = ['-created_at']
+        abstract = True
     
     def __str__(self):
         return f"{self.name} - {self.customer_name} ({self.status})"
     
-    def get_absolute_url(self):
-        return reverse('inventory:radiator_list')
-    
-    def save(self, *args, **kwargs):
-        """Override save to automatically set date_completed when status changes to Completed"""
-        if self.status == 'Completed' and not self.date_completed:
-            self.date_completed = timezone.now().date()
-        elif self.status != 'Completed':
-            self.date_completed = None
-        super().save(*args, **kwargs)
-    
     def get_status_color(self):
         """Return color class for status"""
         colors = {
@@ -57,3 +49,37 @@ class Radiator(models.Model):
             'Completed': 'status-green',
         }
         return colors.get(str(self.status), 'status-default')
+
+
+class Radiator(RadiatorBase):
+    """Model for tracking parts orders (Radiators, Oil Coolers, Intercoolers, Fuel Tanks and Others)"""
+    
+    # Set from customer_name/contact_number on save (see customers.services)
+    customer = models.ForeignKey(
+        'customers.Customer', on_delete=models.SET_NULL, blank=True, null=True,
+        editable=False, db_index=False, related_name='radiators',
+    )
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='inv_radiator_created_idx'),
+            models.Index(fields=['date_received'], name='inv_radiator_received_idx'),
+            models.Index(fields=['customer', 'created_at'], name='inv_radiator_customer_idx'),
+            models.Index(fields=['contact_number'], name='inv_radiator_contact_idx'),
+        ]
+    
+    def get_absolute_url(self):
+        return reverse('inventory:radiator_list')
+    
+    def set_date_completed(self):
+        """Set date_completed when the status is Completed, clear it otherwise"""
+        if self.status == 'Completed' and not self.date_completed:
+            self.date_completed = timezone.now().date()
+        elif self.status != 'Completed':
+            self.date_completed = None
+    
+    def save(self, *args, **kwargs):
+        """Override save to automatically set date_completed when status changes to Completed"""
+        self.set_date_completed()
+        super().save(*args, **kwargs)
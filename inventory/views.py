@@ -1,15 +1,39 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from workshop_manager.listing import record_list
 from .models import Radiator
 from .forms import RadiatorForm
 
+# Choice fields the parts order list can be filtered on
+RADIATOR_FILTERS = {'status': Radiator.STATUS_CHOICES, 'part_type': Radiator.PART_TYPE_CHOICES}
+
+# Sort key -> (label, ordering); the first is the default. Each ends in id so the keyset is unique.
+RADIATOR_SORTS = {
+    'newest': ('Newest first', ['-created_at', '-id']),
+    'oldest': ('Oldest first', ['created_at', 'id']),
+    'received': ('Date received (latest)', ['-date_received', '-id']),
+    'received_oldest': ('Date received (earliest)', ['date_received', 'id']),
+}
+
 
 @login_required
 def radiator_list(request):
-    """List all parts orders"""
-    radiators = Radiator.objects.all()
-    return render(request, 'inventory/radiator_list.html', {'radiators': radiators})
+    """List parts orders, most recent first, filtered and sorted from the query string"""
+    context = record_list(request, Radiator.objects.all(), RADIATOR_FILTERS, RADIATOR_SORTS)
+    return render(request, 'inventory/radiator_list.html', {
+        **context,
+        'status_choices': Radiator.STATUS_CHOICES,
+        'part_type_choices': Radiator.PART_TYPE_CHOICES,
+    })
+
+
+@login_required
+def radiator_rows(request):
+    """Just the table rows of radiator_list, swapped in by the list page when its filters, sort or page change"""
+    return render(request, 'inventory/radiator_rows.html', record_list(
+        request, Radiator.objects.all(), RADIATOR_FILTERS, RADIATOR_SORTS,
+    ))
 
 
 @login_required
@@ -1,11 +1,15 @@
 from django.contrib import admin
+from search.admin import IndexedSearchMixin
+from workshop_manager.paginators import EstimatedCountPaginator
 from .models import Job
 
 
 @admin.register(Job)
-class JobAdmin(admin.ModelAdmin):
+class JobAdmin(IndexedSearchMixin, admin.ModelAdmin):
     list_display = ['customer_name', 'vehicle_registration', 'vehicle_make', 'vehicle_model', 'work_type', 'status', 'invoice_number', 'date_received', 'date_completed']
+    # The date filter offers fixed ranges; date_hierarchy would run DISTINCT date queries over the whole table
     list_filter = ['status', 'work_type', 'date_received']
-    search_fields = ['customer_name', 'vehicle_registration', 'vehicle_make', 'vehicle_model', 'invoice_number']
-    date_hierarchy = 'date_received'
-    ordering = ['-created_at']
+    search_fields = ['^customer_name', '^vehicle_registration', '=invoice_number']
+    ordering = ['-created_at', '-id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
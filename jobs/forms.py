@@ -1,10 +1,16 @@
 from django import forms
+from absentees.models import Employee
 from .models import Job
+from vehicles.fields import normalize_registration
+from vehicles.services import open_job
 
 
 class JobForm(forms.ModelForm):
     """Form for creating and updating jobs"""
     
+    # Look up an open job for the same registration (``open_job``) so the view can warn about it
+    warn_open_jobs = True
+    
     class Meta:
         model = Job
         fields = [
@@ -16,6 +22,8 @@ class JobForm(forms.ModelForm):
             'work_type',
             'status',
             'invoice_number',
+            'assigned_to',
+            'scheduled_date',
             'notes',
         ]
         widgets = {
@@ -31,13 +39,16 @@ class JobForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'Enter vehicle registration'
             }),
+            # Suggestions come from the makes and models already on record (see vehicles.index)
             'vehicle_make': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Toyota, Ford'
+                'placeholder': 'e.g., Toyota, Ford',
+                'autocomplete': 'off'
             }),
             'vehicle_model': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'e.g., Corolla, Focus'
+                'placeholder': 'e.g., Corolla, Focus',
+                'autocomplete': 'off'
             }),
             'work_type': forms.Select(attrs={
                 'class': 'form-control'
@@ -45,6 +56,13 @@ class JobForm(forms.ModelForm):
             'status': forms.Select(attrs={
                 'class': 'form-control'
             }),
+            'assigned_to': forms.Select(attrs={
+                'class': 'form-control'
+            }),
+            'scheduled_date': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date'
+            }),
             'invoice_number': forms.TextInput(attrs={
                 'class': 'form-control',
                 'placeholder': 'Enter invoice number (optional)'
@@ -55,4 +73,35 @@ class JobForm(forms.ModelForm):
                 'placeholder': 'Additional notes (optional)'
             }),
         }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.open_job = None
+        if 'assigned_to' in self.fields:
+            self.fields['assigned_to'].queryset = Employee.objects.filter(is_technician=True)
+    
+    def clean_vehicle_registration(self):
+        registration = normalize_registration(self.cleaned_data['vehicle_registration'])
+        if not registration:
+            raise forms.ValidationError('Enter the vehicle registration.')
+        return registration
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.warn_open_jobs and cleaned_data.get('vehicle_registration'):
+            self.open_job = open_job(cleaned_data['vehicle_registration'], exclude_pk=self.instance.pk)
+        return cleaned_data
+
+
 
+class JobImportForm(JobForm):
+    """JobForm plus the dates a historical record carries, used to validate imported rows"""
+    
+    # One more query per row would slow imports down; duplicates are expected in historical data
+    warn_open_jobs = False
+    
+    class Meta(JobForm.Meta):
+        # Historical records are not assigned; the planner schedules what is still pending
+        fields = [
+            name for name in JobForm.Meta.fields if name not in ('assigned_to', 'scheduled_date')
+        ] + ['date_received', 'date_completed']
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_alter_job_date_received'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['created_at', 'id'], name='jobs_job_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['date_received'], name='jobs_job_received_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0001_initial'),
+        ('jobs', '0004_large_table_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='customer',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='customers.customer'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['customer', 'created_at'], name='jobs_job_customer_idx'),
+        ),
+    ]
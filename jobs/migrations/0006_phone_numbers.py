@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:24
+
+import customers.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_phone_numbers'),
+        ('jobs', '0005_job_customer'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='contact_number',
+            field=customers.fields.PhoneNumberField(max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['contact_number'], name='jobs_job_contact_idx'),
+        ),
+    ]
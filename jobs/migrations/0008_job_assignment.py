@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('absentees', '0003_employee_is_technician'),
+        ('customers', '0004_e164_phone_numbers'),
+        ('jobs', '0007_registrations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='assigned_to',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='absentees.employee'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='scheduled_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['scheduled_date'], name='jobs_job_scheduled_idx'),
+        ),
+    ]
@@ -3,9 +3,12 @@ from django.urls import reverse
 from django.utils import timezone
 from datetime import date
 
+from customers.fields import PhoneNumberField
+from vehicles.fields import RegistrationField
 
-class Job(models.Model):
-    """Model for tracking workshop jobs (cars coming in)"""
+
+class JobBase(models.Model):
+    """Fields shared by live jobs and archived jobs"""
     
     WORK_TYPE_CHOICES = [
         ('repair', 'Repair'),
@@ -21,8 +24,8 @@ class Job(models.Model):
     ]
     
     customer_name = models.CharField(max_length=200)
-    contact_number = models.CharField(max_length=20)
-    vehicle_registration = models.CharField(max_length=50)
+    contact_number = PhoneNumberField(max_length=20)
+    vehicle_registration = RegistrationField(max_length=50)
     vehicle_make = models.CharField(max_length=100)
     vehicle_model = models.CharField(max_length=100)
     work_type = models.CharField(max_length=50, choices=WORK_TYPE_CHOICES)
@@ -35,22 +38,11 @@ class Job(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        ordering = ['-created_at']  # Most recent first
-    
-    def save(self, *args, **kwargs):
-        """Override save to automatically set date_completed when status changes to Completed"""
-        if self.status == 'Completed' and not self.date_completed:
-            self.date_completed = timezone.now().date()
-        elif self.status != 'Completed':
-            self.date_completed = None
-        super().save(*args, **kwargs)
+        abstract = True
     
     def __str__(self):
         return f"{self.customer_name} - {self.vehicle_registration} ({self.status})"
     
-    def get_absolute_url(self):
-        return reverse('jobs:job_detail', kwargs={'pk': self.pk})
-    
     def get_status_color(self):
         """Return color class for status"""
         colors = {
@@ -59,3 +51,52 @@ class Job(models.Model):
             'Completed': 'status-green',
         }
         return colors.get(str(self.status), 'status-default')
+
+
+class Job(JobBase):
+    """Model for tracking workshop jobs (cars coming in)"""
+    
+    # Set from customer_name/contact_number on save (see customers.services)
+    customer = models.ForeignKey(
+        'customers.Customer', on_delete=models.SET_NULL, blank=True, null=True,
+        editable=False, db_index=False, related_name='jobs',
+    )
+    
+    # Who works on the job and on which day (proposed for pending jobs by assignments.planner)
+    assigned_to = models.ForeignKey(
+        'absentees.Employee', on_delete=models.SET_NULL, blank=True, null=True, related_name='jobs',
+    )
+    scheduled_date = models.DateField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ['-created_at']  # Most recent first
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='jobs_job_created_idx'),
+            models.Index(fields=['date_received'], name='jobs_job_received_idx'),
+            # Serves both the foreign key and a customer's history, newest first
+            models.Index(fields=['customer', 'created_at'], name='jobs_job_customer_idx'),
+            models.Index(fields=['contact_number'], name='jobs_job_contact_idx'),
+            # A vehicle's history, and (partial, so it stays small) whether it already has an open job
+            models.Index(fields=['vehicle_registration', 'date_received'], name='jobs_job_registration_idx'),
+            models.Index(
+                fields=['vehicle_registration'], name='jobs_job_open_reg_idx',
+                condition=~models.Q(status='Completed'),
+            ),
+            # The jobs already planned for a week
+            models.Index(fields=['scheduled_date'], name='jobs_job_scheduled_idx'),
+        ]
+    
+    def set_date_completed(self):
+        """Set date_completed when the status is Completed, clear it otherwise"""
+        if self.status == 'Completed' and not self.date_completed:
+            self.date_completed = timezone.now().date()
+        elif self.status != 'Completed':
+            self.date_completed = None
+    
+    def save(self, *args, **kwargs):
+        """Override save to automatically set date_completed when status changes to Completed"""
+        self.set_date_completed()
+        super().save(*args, **kwargs)
+    
+    def get_absolute_url(self):
+        return reverse('jobs:job_detail', kwargs={'pk': self.pk})
@@ -1,3 +1,86 @@
-from django.test import TestCase
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase
+
+MANAGE_PY = Path(settings.BASE_DIR) / 'manage.py'
+
+HAMMER_SCRIPT = """
+from django.contrib.auth.models import User
+from django.test import Client
+
+client = Client()
+client.force_login(User.objects.get(username='hammer'))
+for i in range({count}):
+    response = client.post('/jobs/create/', {{
+        'customer_name': 'Worker {worker} Customer %d' % i,
+        'contact_number': '0820000000',
+        'vehicle_registration': 'HAM%03d' % i,
+        'vehicle_make': 'Toyota',
+        'vehicle_model': 'Corolla',
+        'work_type': 'repair',
+        'status': 'Completed' if i % 2 else 'Pending',
+    }})
+    assert response.status_code == 302, response.status_code
+"""
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite production profile only')
+class SQLiteConcurrencyTests(SimpleTestCase):
+    """Hammer job_create from several processes against one SQLite file"""
+
+    workers = 4
+    jobs_per_worker = 25
+
+    def run_manage(self, env, *args):
+        return subprocess.Popen(
+            [sys.executable, str(MANAGE_PY), *args],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    def test_concurrent_job_create(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'concurrency.sqlite3')
+            env = {
+                **os.environ,
+                'DATABASE_URL': '',
+                'SQLITE_PATH': db_path,
+                'SQLITE_PRODUCTION': 'True',
+                'ALLOWED_HOSTS': 'testserver',
+            }
+            for args in (
+                ('migrate', '--noinput'),
+                ('shell', '-c', "from django.contrib.auth.models import User; User.objects.create_user('hammer')"),
+            ):
+                process = self.run_manage(env, *args)
+                _, stderr = process.communicate()
+                self.assertEqual(process.returncode, 0, stderr)
+
+            processes = [
+                self.run_manage(env, 'shell', '-c', HAMMER_SCRIPT.format(count=self.jobs_per_worker, worker=worker))
+                for worker in range(self.workers)
+            ]
+            for process in processes:
+                _, stderr = process.communicate()
+                self.assertEqual(process.returncode, 0, stderr)
+
+            with sqlite3.connect(db_path) as db:
+                journal_mode = db.execute('PRAGMA journal_mode').fetchone()[0]
+                created = db.execute('SELECT COUNT(*) FROM jobs_job').fetchone()[0]
+                completed_without_date = db.execute(
+                    "SELECT COUNT(*) FROM jobs_job WHERE status = 'Completed' AND date_completed IS NULL"
+                ).fetchone()[0]
+
+        self.assertEqual(journal_mode, 'wal')
+        self.assertEqual(created, self.workers * self.jobs_per_worker)
+        self.assertEqual(completed_without_date, 0)
@@ -5,6 +5,7 @@ app_name = 'jobs'
 
 urlpatterns = [
     path('', views.job_list, name='job_list'),
+    path('rows/', views.job_rows, name='job_rows'),
     path('<int:pk>/', views.job_detail, name='job_detail'),
     path('create/', views.job_create, name='job_create'),
     path('<int:pk>/edit/', views.job_update, name='job_update'),
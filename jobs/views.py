@@ -1,15 +1,48 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from workshop_manager.listing import record_list
 from .models import Job
 from .forms import JobForm
 
+# Choice fields the job list can be filtered on
+JOB_FILTERS = {'status': Job.STATUS_CHOICES, 'work_type': Job.WORK_TYPE_CHOICES}
+
+# Sort key -> (label, ordering); the first is the default. Each ends in id so the keyset is unique.
+JOB_SORTS = {
+    'newest': ('Newest first', ['-created_at', '-id']),
+    'oldest': ('Oldest first', ['created_at', 'id']),
+    'received': ('Date received (latest)', ['-date_received', '-id']),
+    'received_oldest': ('Date received (earliest)', ['date_received', 'id']),
+}
+
+
+def warn_open_job(request, form):
+    """Tell the user if the vehicle they just saved a job for already had an open one"""
+    if form.open_job is not None:
+        messages.warning(
+            request,
+            f'{form.cleaned_data["vehicle_registration"]} already has an open job for {form.open_job.customer_name} '
+            f'({form.open_job.status}, received {form.open_job.date_received:%b %d, %Y}). '
+            f'See its Vehicle History.',
+        )
+
 
 @login_required
 def job_list(request):
-    """List all jobs, most recent first"""
-    jobs = Job.objects.all()
-    return render(request, 'jobs/job_list.html', {'jobs': jobs})
+    """List jobs, most recent first, filtered and sorted from the query string"""
+    context = record_list(request, Job.objects.all(), JOB_FILTERS, JOB_SORTS)
+    return render(request, 'jobs/job_list.html', {
+        **context,
+        'status_choices': Job.STATUS_CHOICES,
+        'work_type_choices': Job.WORK_TYPE_CHOICES,
+    })
+
+
+@login_required
+def job_rows(request):
+    """Just the table rows of job_list, swapped in by the list page when its filters, sort or page change"""
+    return render(request, 'jobs/job_rows.html', record_list(request, Job.objects.all(), JOB_FILTERS, JOB_SORTS))
 
 
 @login_required
@@ -27,6 +60,7 @@ def job_create(request):
         if form.is_valid():
             job = form.save()
             messages.success(request, f'Job for {job.customer_name} has been created successfully!')
+            warn_open_job(request, form)
             return redirect('jobs:job_detail', pk=job.pk)
     else:
         form = JobForm()
@@ -42,6 +76,7 @@ def job_update(request, pk):
         if form.is_valid():
             job = form.save()
             messages.success(request, f'Job for {job.customer_name} has been updated successfully!')
+            warn_open_job(request, form)
             return redirect('jobs:job_detail', pk=job.pk)
     else:
         form = JobForm(instance=job)
@@ -0,0 +1,181 @@
+"""
+Month-over-month figures for the comparison report.
+
+Each figure comes from one grouped query over TruncMonth groups:
+
+- jobs by month received: volume
+- jobs by month completed: completions and average turnaround
+- parts orders by month received and part type: volume per type
+
+Where the database has window functions the same query also returns the previous
+month's values with ``Lag()``; otherwise the grouped rows are read as they are and
+a single pass looks up each month's predecessor. Completions are counted in the
+month they happened (not the month the job came in), so a closed month's figures
+only change when records are edited, imported, reopened or archived. Each one is
+cached under a key holding a data version that those writes replace, and for at
+most ``COMPARISON_CACHE_TIMEOUT`` seconds, which bounds how long another worker's
+memory cache or a write that sends no signal can leave it stale. Only the current
+month, and the month before the oldest uncached one, are queried again.
+"""
+
+import uuid
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Avg, Count, F, Window
+from django.db.models.functions import Lag, TruncMonth
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from inventory.models import Radiator
+from jobs.models import Job
+
+# Bump when the shape of a cached month changes
+CACHE_VERSION = 1
+
+PART_TYPES = Radiator.PART_TYPE_CHOICES
+
+
+def _month_before(month):
+    return date(month.year - 1, 12, 1) if month.month == 1 else date(month.year, month.month - 1, 1)
+
+
+DATA_VERSION_KEY = 'reports:month_over_month:data-version'
+
+# Saves that only touch other columns (notes, assignments, ...) leave the figures as they are
+COUNTED_FIELDS = {'date_received', 'date_completed', 'status', 'part_type'}
+
+
+def data_version():
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        cache.add(DATA_VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(DATA_VERSION_KEY)
+    return version
+
+
+def bump_data_version():
+    """Start a fresh cache after jobs or parts orders were written in a way that can change closed months"""
+    cache.set(DATA_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _cache_key(month, version):
+    return f'reports:month_over_month:{CACHE_VERSION}:{version}:{month:%Y-%m}'
+
+
+def records_saved(sender, update_fields=None, **kwargs):
+    if update_fields is None or not update_fields.isdisjoint(COUNTED_FIELDS):
+        records_changed(sender)
+
+
+def records_changed(sender, **kwargs):
+    # After the commit, so a page read before it cannot cache the old figures under the new version
+    transaction.on_commit(bump_data_version)
+
+
+def connect_signals():
+    from board.signals import statuses_changed
+
+    for model in (Job, Radiator):
+        post_save.connect(records_saved, sender=model, dispatch_uid=f'comparison_saved_{model._meta.label}')
+        post_delete.connect(records_changed, sender=model, dispatch_uid=f'comparison_deleted_{model._meta.label}')
+    statuses_changed.connect(records_changed, dispatch_uid='comparison_transition')
+
+
+def monthly(queryset, date_field, since, aggregates, partition=None):
+    """
+    {(month, partition value or None): row} for months from ``since``. Each row has the
+    ``aggregates`` and, as ``previous_<name>``, the same figures for the month before
+    (None when that month has no records).
+    """
+    groups = {'month': TruncMonth(date_field)}
+    if partition:
+        groups['partition'] = F(partition)
+    rows = queryset.order_by().filter(**{f'{date_field}__gte': since}).values(**groups).annotate(**aggregates)
+
+    if connections[rows.db].features.supports_over_clause:
+        window = {'partition_by': [F('partition')] if partition else None, 'order_by': F('month').asc()}
+        rows = rows.annotate(
+            previous_month=Window(Lag('month'), **window),
+            **{f'previous_{name}': Window(Lag(name), **window) for name in aggregates},
+        )
+        result = {}
+        for row in rows:
+            # Lag returns the previous row, which is not last month's if last month had no records
+            if row.pop('previous_month') != _month_before(row['month']):
+                row.update({f'previous_{name}': None for name in aggregates})
+            result[row['month'], row.get('partition')] = row
+        return result
+
+    result = {(row['month'], row.get('partition')): row for row in rows}
+    for (month, partition_value), row in result.items():
+        previous = result.get((_month_before(month), partition_value), {})
+        row.update({f'previous_{name}': previous.get(name) for name in aggregates})
+    return result
+
+
+def _days(duration):
+    return None if duration is None else round(duration.total_seconds() / 86400, 1)
+
+
+def _pair(result, month, name, partition=None):
+    """(this month's, last month's) ``name`` from a ``monthly`` result"""
+    row = result.get((month, partition))
+    if row is not None:
+        return row[name], row[f'previous_{name}']
+    # No records this month, so there is no row to carry the lagged value
+    return None, result.get((_month_before(month), partition), {}).get(name)
+
+
+def _figures(month, received, completed, parts):
+    """The cached/displayed figures for one month from the three grouped results"""
+    jobs_received, previous_jobs_received = _pair(received, month, 'count')
+    jobs_completed, previous_jobs_completed = _pair(completed, month, 'count')
+    turnaround, previous_turnaround = _pair(completed, month, 'turnaround')
+    parts_orders = []
+    for value, label in PART_TYPES:
+        count, previous_count = _pair(parts, month, 'count', value)
+        parts_orders.append({'part_type': label, 'count': count or 0, 'previous_count': previous_count or 0})
+    return {
+        'month': month,
+        'jobs_received': jobs_received or 0,
+        'previous_jobs_received': previous_jobs_received or 0,
+        'jobs_completed': jobs_completed or 0,
+        'previous_jobs_completed': previous_jobs_completed or 0,
+        'turnaround_days': _days(turnaround),
+        'previous_turnaround_days': _days(previous_turnaround),
+        'parts_orders': parts_orders,
+    }
+
+
+def month_over_month(months=12):
+    """Figures for the last ``months`` months, oldest first, each with the month before's for comparison"""
+    current = timezone.localdate().replace(day=1)
+    window = [current]
+    while len(window) < months:
+        window.insert(0, _month_before(window[0]))
+
+    closed = window[:-1]
+    version = data_version()
+    keys = {month: _cache_key(month, version) for month in closed}
+    cached = cache.get_many(list(keys.values()))
+    figures = {month: cached[key] for month, key in keys.items() if key in cached}
+    missing = [month for month in window if month not in figures]
+
+    # Start a month early so Lag() can see the predecessor of the oldest month that is queried
+    since = _month_before(missing[0])
+    received = monthly(Job.objects.all(), 'date_received', since, {'count': Count('pk')})
+    completed = monthly(
+        Job.objects.all(), 'date_completed', since,
+        {'count': Count('pk'), 'turnaround': Avg(F('date_completed') - F('date_received'))},
+    )
+    parts = monthly(Radiator.objects.all(), 'date_received', since, {'count': Count('pk')}, partition='part_type')
+    for month in missing:
+        figures[month] = _figures(month, received, completed, parts)
+    cache.set_many(
+        {keys[month]: figures[month] for month in missing if month != current},
+        timeout=settings.COMPARISON_CACHE_TIMEOUT,
+    )
+    return [figures[month] for month in window]
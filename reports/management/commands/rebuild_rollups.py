@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from reports.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recount the daily rollups behind the dashboard chart from the job and parts order tables (run nightly)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None,
+            help='Only recount this many most recent days (default: every day)',
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options['days'] is not None:
+            since = timezone.localdate() - timedelta(days=options['days'] - 1)
+        days = rebuild(since)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt rollups for {days} days'))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True)),
+                ('jobs_received', models.IntegerField(default=0)),
+                ('jobs_completed', models.IntegerField(default=0)),
+                ('radiators_received', models.IntegerField(default=0)),
+                ('radiators_completed', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['day'],
+            },
+        ),
+    ]
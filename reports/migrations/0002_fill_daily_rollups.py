@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from reports.rollups import rebuild
+
+
+def fill_daily_rollups(apps, schema_editor):
+    """Count the days of every existing job and parts order, live and archived"""
+    rebuild(registry=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+        ('jobs', '0007_registrations'),
+        ('inventory', '0008_phone_numbers'),
+        ('archive', '0003_registrations'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_daily_rollups, migrations.RunPython.noop),
+    ]
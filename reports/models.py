@@ -1,3 +1,18 @@
 from django.db import models
 
-# Create your models here.
+
+class DailyRollup(models.Model):
+    """Jobs and parts orders received and completed on one day, kept current by reports.rollups"""
+
+    day = models.DateField(unique=True)
+    jobs_received = models.IntegerField(default=0)
+    jobs_completed = models.IntegerField(default=0)
+    radiators_received = models.IntegerField(default=0)
+    radiators_completed = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['day']
+
+    def __str__(self):
+        return f"{self.day}: {self.jobs_received}/{self.jobs_completed} jobs, " \
+               f"{self.radiators_received}/{self.radiators_completed} parts orders"
@@ -0,0 +1,96 @@
+"""
+Month-by-category breakdowns for the Excel report, counted by the database.
+
+Each count is one GROUP BY over (TruncMonth of a date column, category), so the
+work done in Python is proportional to the number of months times categories,
+not to the number of records, however many years of data the tables hold.
+"""
+
+from collections import Counter
+
+from django.db.models import Count, F
+from django.db.models.functions import TruncMonth
+
+from inventory.models import RadiatorBase
+from jobs.models import JobBase
+
+STATUSES = [value for value, _ in JobBase.STATUS_CHOICES]
+
+
+def count_by_month(querysets, date_field, category_field=None):
+    """
+    {(first day of month, category): records} summed over ``querysets`` (e.g. live
+    and archived tables). Without ``category_field`` the category is None.
+    """
+    counts = Counter()
+    groups = {'month': TruncMonth(date_field)}
+    if category_field:
+        groups['category'] = F(category_field)
+    for queryset in querysets:
+        rows = (
+            queryset.order_by().filter(**{f'{date_field}__isnull': False})
+            .values(**groups).annotate(count=Count('pk'))
+        )
+        for row in rows:
+            counts[row['month'], row.get('category')] += row['count']
+    return counts
+
+
+def pivot_rows(columns, row_totals=True):
+    """
+    Rows of [month, one count per column..., total] in month order, then a totals row.
+
+    ``columns`` is a list of (counts from count_by_month, category) pairs, one per
+    column. ``row_totals=False`` leaves out the last column, for columns that overlap.
+    """
+    months = sorted({month for counts, _ in columns for month, _ in counts})
+    rows = []
+    for month in months:
+        values = [counts.get((month, category), 0) for counts, category in columns]
+        rows.append([month.strftime('%Y-%m'), *values, *([sum(values)] if row_totals else [])])
+    width = len(columns) + row_totals
+    rows.append(['Total', *(sum(row[i] for row in rows) for i in range(1, width + 1))])
+    return rows
+
+
+def work_type_pivot(job_querysets):
+    """Header and rows of jobs received per work type per month"""
+    counts = count_by_month(job_querysets, 'date_received', 'work_type')
+    return (
+        ['Month', *(label for _, label in JobBase.WORK_TYPE_CHOICES), 'Total'],
+        pivot_rows([(counts, value) for value, _ in JobBase.WORK_TYPE_CHOICES]),
+    )
+
+
+def part_type_pivot(radiator_querysets):
+    """Header and rows of parts orders received per part type per month"""
+    counts = count_by_month(radiator_querysets, 'date_received', 'part_type')
+    return (
+        ['Month', *(label for _, label in RadiatorBase.PART_TYPE_CHOICES), 'Total'],
+        pivot_rows([(counts, value) for value, _ in RadiatorBase.PART_TYPE_CHOICES]),
+    )
+
+
+def status_pivot(job_querysets, radiator_querysets):
+    """
+    Header and rows of jobs and parts orders received each month by their current
+    status, plus how many of each were completed in that month.
+    """
+    jobs = count_by_month(job_querysets, 'date_received', 'status')
+    radiators = count_by_month(radiator_querysets, 'date_received', 'status')
+    jobs_completed = count_by_month(job_querysets, 'date_completed')
+    radiators_completed = count_by_month(radiator_querysets, 'date_completed')
+    return (
+        [
+            'Month',
+            *(f'Jobs {status}' for status in STATUSES),
+            *(f'Radiators {status}' for status in STATUSES),
+            'Jobs Completed In Month', 'Radiators Completed In Month',
+        ],
+        pivot_rows([
+            *((jobs, status) for status in STATUSES),
+            *((radiators, status) for status in STATUSES),
+            (jobs_completed, None),
+            (radiators_completed, None),
+        ], row_totals=False),
+    )
@@ -0,0 +1,188 @@
+"""
+Daily counts of jobs and parts orders received and completed, for the dashboard chart.
+
+``DailyRollup`` holds one row per day. Saving or deleting a job or parts order moves
+its counts with post_save/post_delete (the date_received and date_completed it was
+loaded with, see workshop_manager.snapshots, are compared with the saved ones), and
+bulk status transitions with ``statuses_changed``, each change being an
+``UPDATE ... SET n = n + 1`` on that day's row. Archiving pauses the signals, since
+an archived record was still received and completed when it was, and imports add
+their batches with ``count_records``. ``manage.py rebuild_rollups`` recounts from
+the live and archive tables (nightly, to repair anything written another way), so
+reading the chart never touches the raw tables.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from workshop_manager import snapshots
+
+from .models import DailyRollup
+
+# model label -> (received column, completed column)
+COLUMNS = {
+    'jobs.Job': ('jobs_received', 'jobs_completed'),
+    'inventory.Radiator': ('radiators_received', 'radiators_completed'),
+}
+# Archive tables are counted by rebuild() only; records reach them without signals
+ARCHIVE_COLUMNS = {
+    'archive.ArchivedJob': COLUMNS['jobs.Job'],
+    'archive.ArchivedRadiator': COLUMNS['inventory.Radiator'],
+}
+COUNTED_FIELDS = ['date_received', 'date_completed']
+
+_paused = ContextVar('rollups_paused', default=False)
+
+
+@contextmanager
+def paused():
+    """Do not count changes made inside the block (e.g. archiving, which moves records but changes no dates)"""
+    token = _paused.set(True)
+    try:
+        yield
+    finally:
+        _paused.reset(token)
+
+
+def apply(changes):
+    """Add {(day, column): delta} to the rollup rows, creating missing days"""
+    by_day = {}
+    for (day, column), delta in changes.items():
+        if day is not None and delta:
+            by_day.setdefault(day, {})[column] = delta
+    if not by_day:
+        return
+    with transaction.atomic():
+        missing = [
+            day for day in by_day
+            if not DailyRollup.objects.filter(day=day).update(
+                **{column: F(column) + delta for column, delta in by_day[day].items()}
+            )
+        ]
+        if missing:
+            # Another request may create the same day first; ignore_conflicts keeps its row
+            DailyRollup.objects.bulk_create([DailyRollup(day=day) for day in missing], ignore_conflicts=True)
+            for day in missing:
+                DailyRollup.objects.filter(day=day).update(
+                    **{column: F(column) + delta for column, delta in by_day[day].items()}
+                )
+
+
+def count_records(instances):
+    """Count newly created records that were written without signals (bulk_create)"""
+    changes = Counter()
+    for instance in instances:
+        received, completed = COLUMNS[instance._meta.label]
+        changes[instance.date_received, received] += 1
+        changes[instance.date_completed, completed] += 1
+    apply(changes)
+
+
+def _loaded_dates(instance):
+    values = snapshots.loaded(instance, 'rollups')
+    return tuple(values.get(field) for field in COUNTED_FIELDS)
+
+
+def count_saved(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw or _paused.get():
+        return
+    if update_fields is not None and update_fields.isdisjoint(COUNTED_FIELDS):
+        return
+    old = (None, None) if created else _loaded_dates(instance)
+    new = (instance.date_received, instance.date_completed)
+    changes = Counter()
+    for column, before, after in zip(COLUMNS[instance._meta.label], old, new):
+        if before != after:
+            changes[before, column] -= 1
+            changes[after, column] += 1
+    apply(changes)
+    snapshots.remember(instance, 'rollups')
+
+
+def count_deleted(sender, instance, **kwargs):
+    if _paused.get():
+        return
+    received, completed = _loaded_dates(instance)
+    received_column, completed_column = COLUMNS[instance._meta.label]
+    apply(Counter({(received, received_column): -1, (completed, completed_column): -1}))
+
+
+def count_transition(sender, changes, **kwargs):
+    """Move the completed counts for a bulk_transition, which saves with queryset.update() and so sends no post_save"""
+    if _paused.get() or sender._meta.label not in COLUMNS:
+        return
+    completed = COLUMNS[sender._meta.label][1]
+    counts = Counter()
+    for fields in changes.values():
+        if 'date_completed' in fields:
+            before, after = fields['date_completed']
+            counts[before, completed] -= 1
+            counts[after, completed] += 1
+    apply(counts)
+
+
+def connect_signals():
+    from board.signals import statuses_changed
+
+    statuses_changed.connect(count_transition, dispatch_uid='rollup_transition')
+    for label in COLUMNS:
+        model = apps.get_model(label)
+        snapshots.track(model, 'rollups', COUNTED_FIELDS)
+        post_save.connect(count_saved, sender=model, dispatch_uid=f'rollup_saved_{label}')
+        post_delete.connect(count_deleted, sender=model, dispatch_uid=f'rollup_deleted_{label}')
+
+
+def rebuild(since=None, registry=None):
+    """
+    Recount every day (or every day from ``since``) from the live and archive tables
+    with one GROUP BY per table and date column. Returns the number of days written.
+    ``registry`` lets a data migration pass its historical app registry.
+    """
+    registry = registry or apps
+    Rollup = registry.get_model('reports', 'DailyRollup')
+    counts = {}
+    for label, columns in {**COLUMNS, **ARCHIVE_COLUMNS}.items():
+        model = registry.get_model(label)
+        for date_field, column in zip(['date_received', 'date_completed'], columns):
+            rows = model.objects.order_by().filter(**{f'{date_field}__isnull': False})
+            if since is not None:
+                rows = rows.filter(**{f'{date_field}__gte': since})
+            for day, count in rows.values_list(date_field).annotate(count=Count('pk')):
+                counts.setdefault(day, Counter())[column] += count
+
+    with transaction.atomic():
+        stale = Rollup.objects.all()
+        if since is not None:
+            stale = stale.filter(day__gte=since)
+        stale.delete()
+        Rollup.objects.bulk_create(
+            [Rollup(day=day, **columns) for day, columns in sorted(counts.items())], batch_size=1000,
+        )
+    return len(counts)
+
+
+def daily_series(days=90):
+    """One dict per day of the last ``days`` days (oldest first), with zeros for days without a row"""
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    rows = {row.day: row for row in DailyRollup.objects.filter(day__gte=start, day__lte=today)}
+    series = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = rows.get(day) or DailyRollup(day=day)
+        series.append({
+            'day': day,
+            'jobs_received': row.jobs_received,
+            'jobs_completed': row.jobs_completed,
+            'radiators_received': row.radiators_received,
+            'radiators_completed': row.radiators_completed,
+        })
+    return series
@@ -1,3 +1,43 @@
+import json
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job
+
+from .models import DailyRollup
+
+
+class RollupTransitionTests(TestCase):
+    """The daily completed count follows board status changes, bulk or single"""
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_user('board'))
+        self.job = Job.objects.create(
+            customer_name='Rollup Customer',
+            contact_number='0820000000',
+            vehicle_registration='ROL001',
+            vehicle_make='Toyota',
+            vehicle_model='Corolla',
+            work_type='repair',
+            status='Pending',
+        )
+
+    def completed_today(self):
+        return DailyRollup.objects.get(day=timezone.now().date()).jobs_completed
+
+    def test_bulk_transition_then_revert(self):
+        response = self.client.post(
+            '/board/job/status/', json.dumps({'ids': [self.job.pk], 'status': 'Completed'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.json(), {'updated': 1})
+        self.assertEqual(self.completed_today(), 1)
 
-# Create your tests here.
+        response = self.client.patch(
+            f'/board/job/{self.job.pk}/status/', json.dumps({'status': 'Pending'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.completed_today(), 0)
@@ -6,5 +6,6 @@ app_name = 'reports'
 urlpatterns = [
     path('', views.reports_page, name='reports_page'),
     path('download/', views.download_report, name='download_report'),
+    path('comparison/', views.month_comparison, name='month_comparison'),
 ]
 
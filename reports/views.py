@@ -3,11 +3,15 @@ from django.contrib.auth.decorators import login_required
 from django.http import HttpResponse
 from django.utils import timezone
 from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 from jobs.models import Job
 from inventory.models import Radiator
+from archive.models import ArchivedJob, ArchivedRadiator
+from workshop_manager.routers import use_replica
+from .comparison import month_over_month
+from .pivots import part_type_pivot, status_pivot, work_type_pivot
+
+# Months shown in the month-over-month table
+COMPARISON_MONTHS = 12
 
 
 @login_required
@@ -16,9 +20,57 @@ def reports_page(request):
     return render(request, 'reports/reports_page.html')
 
 
+def _change(current, previous):
+    """A figure beside last month's, with the difference and (when last month was not zero) the percentage"""
+    change = {'value': current, 'previous': previous, 'difference': None, 'percent': None}
+    if current is not None and previous is not None:
+        change['difference'] = round(current - previous, 1)
+        if previous:
+            change['percent'] = round((current - previous) / previous * 100)
+    return change
+
+
+@login_required
+@use_replica
+def month_comparison(request):
+    """This month against last month: job volume, completions, average turnaround and parts orders by type"""
+    months = month_over_month(COMPARISON_MONTHS)
+    this_month = months[-1]
+    return render(request, 'reports/month_comparison.html', {
+        'this_month': this_month,
+        'headline': [
+            ('Vehicle checkins received', _change(this_month['jobs_received'], this_month['previous_jobs_received'])),
+            ('Vehicle checkins completed', _change(this_month['jobs_completed'], this_month['previous_jobs_completed'])),
+            ('Average turnaround (days)', _change(this_month['turnaround_days'], this_month['previous_turnaround_days'])),
+        ],
+        'parts_orders': [
+            (row['part_type'], _change(row['count'], row['previous_count'])) for row in this_month['parts_orders']
+        ],
+        # Newest first in the table
+        'months': [
+            {
+                'month': month['month'],
+                'jobs_received': _change(month['jobs_received'], month['previous_jobs_received']),
+                'jobs_completed': _change(month['jobs_completed'], month['previous_jobs_completed']),
+                'turnaround_days': _change(month['turnaround_days'], month['previous_turnaround_days']),
+                'parts_orders': _change(
+                    sum(row['count'] for row in month['parts_orders']),
+                    sum(row['previous_count'] for row in month['parts_orders']),
+                ),
+            }
+            for month in reversed(months)
+        ],
+    })
+
+
 @login_required
+@use_replica
 def download_report(request):
     """Generate and download Excel report with Jobs and Radiators"""
+    # openpyxl is imported here so workers that never build a report don't pay for it at boot
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
     # Create workbook
     wb = Workbook()
     
@@ -28,6 +80,16 @@ def download_report(request):
     # Get all data
     jobs = Job.objects.all().order_by('-created_at')
     radiators = Radiator.objects.all().order_by('-created_at')
+    # Tables the pivot sheets count from
+    job_tables = [Job.objects.all()]
+    radiator_tables = [Radiator.objects.all()]
+    
+    # Archived (old completed) records are only included when asked for
+    if request.GET.get('include_archived') == '1':
+        jobs = list(jobs) + list(ArchivedJob.objects.order_by('-created_at'))
+        radiators = list(radiators) + list(ArchivedRadiator.objects.order_by('-created_at'))
+        job_tables.append(ArchivedJob.objects.all())
+        radiator_tables.append(ArchivedRadiator.objects.all())
     
     # Define colors
     job_header_fill = PatternFill(start_color="4A90E2", end_color="4A90E2", fill_type="solid")  # Blue
@@ -286,6 +348,33 @@ def download_report(request):
         adjusted_width = min((max_length + 2), 50)
         radiators_sheet.column_dimensions[column].width = adjusted_width
     
+    # Pivot sheets, counted by the database with one GROUP BY per table
+    pivot_header_fill = PatternFill(start_color="6C757D", end_color="6C757D", fill_type="solid")  # Gray
+    pivots = [
+        ("Jobs by Work Type", work_type_pivot(job_tables)),
+        ("Radiators by Part Type", part_type_pivot(radiator_tables)),
+        ("Status by Month", status_pivot(job_tables, radiator_tables)),
+    ]
+    for title, (headers, rows) in pivots:
+        pivot_sheet = wb.create_sheet(title)
+        pivot_sheet.append(headers)
+        for cell in pivot_sheet[1]:
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.fill = pivot_header_fill
+            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+            cell.border = thin_border
+        for row in rows:
+            pivot_sheet.append(row)
+            for cell in pivot_sheet[pivot_sheet.max_row]:
+                cell.border = thin_border
+        # Totals row
+        for cell in pivot_sheet[pivot_sheet.max_row]:
+            cell.font = Font(bold=True)
+            cell.fill = summary_fill
+        pivot_sheet.freeze_panes = "B2"
+        for col in pivot_sheet.columns:
+            pivot_sheet.column_dimensions[col[0].column_letter].width = 14
+    
     # Create HTTP response with Excel file
     response = HttpResponse(
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
@@ -0,0 +1,37 @@
+from django.conf import settings
+
+from .index import recent_matches, search_index
+
+# Above this many hits a pk__in filter costs more than the prefix search it replaces
+MAX_INDEXED_HITS = 5000
+
+
+class IndexedSearchMixin:
+    """
+    Answer changelist searches from the in-process search index.
+
+    The index matches every word of the query as a prefix, like the global search
+    box, so the database only receives a primary key lookup. Rows changed since the
+    index's last sync (which may have been saved by another worker) are matched
+    against their current text as well. Very broad queries fall back to the
+    ModelAdmin's own (prefix) ``search_fields``.
+    """
+
+    @property
+    def search_help_text(self):
+        return (
+            'Finds records containing words that start with each word you type. A record another '
+            f'user edited in the last {settings.SEARCH_SYNC_INTERVAL:g} seconds may also be found '
+            'by its previous text.'
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        search_index.ensure_current()
+        label = self.model._meta.label
+        pks = [pk for hit_label, pk in search_index.search(search_term) if hit_label == label]
+        if len(pks) > MAX_INDEXED_HITS:
+            return super().get_search_results(request, queryset, search_term)
+        # Filtered by the database, so rows deleted by another worker drop out
+        return queryset.filter(pk__in={*pks, *recent_matches(label, search_term)}), False
@@ -0,0 +1,221 @@
+"""
+In-process inverted index over jobs, parts orders and bookings.
+
+Every worker builds its index from the database on the first search and keeps
+it current with post_save/post_delete signals. Changes made by *other*
+processes are picked up by a cheap ``updated_at`` delta query at most once every
+``SEARCH_SYNC_INTERVAL`` seconds (see workshop_manager.syncing). Deleted rows drop
+out when results are loaded.
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+from customers.phones import national_digits
+from workshop_manager.syncing import DeltaSyncedIndex
+
+# model label -> fields whose text is indexed
+INDEXED_FIELDS = {
+    'jobs.Job': [
+        'customer_name', 'contact_number', 'vehicle_registration',
+        'vehicle_make', 'vehicle_model', 'invoice_number', 'notes',
+    ],
+    'inventory.Radiator': [
+        'name', 'customer_name', 'contact_number', 'invoice_number', 'notes',
+    ],
+    'bookings.Booking': [
+        'customer_name', 'contact_number', 'vehicle_registration',
+        'vehicle_make', 'vehicle_model', 'description', 'notes',
+    ],
+}
+INDEXED_FIELDS['archive.ArchivedJob'] = INDEXED_FIELDS['jobs.Job']
+INDEXED_FIELDS['archive.ArchivedRadiator'] = INDEXED_FIELDS['inventory.Radiator']
+
+# Archived records are only returned when explicitly asked for
+ARCHIVE_LABELS = {'archive.ArchivedJob', 'archive.ArchivedRadiator'}
+
+# Column used to find rows changed since the last sync. Archive rows keep their original
+# updated_at, so they are found by when they were archived instead.
+SYNC_FIELDS = {
+    'archive.ArchivedJob': 'archived_at',
+    'archive.ArchivedRadiator': 'archived_at',
+}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+E164_RE = re.compile(r'\+\d{8,15}')
+
+
+def tokenize(text):
+    """Lowercase word tokens, plus the whole value with separators removed (e.g. "CA 123-456" -> "ca123456")"""
+    if not text:
+        return set()
+    text = str(text).lower()
+    tokens = set(TOKEN_RE.findall(text))
+    joined = ''.join(TOKEN_RE.findall(text))
+    if len(tokens) > 1 and len(joined) <= 32:
+        tokens.add(joined)
+    # Phone numbers are stored as +27825550100 but usually searched for as 082...
+    tokens.update(national_digits(number) for number in E164_RE.findall(text))
+    return tokens
+
+
+class InvertedIndex(DeltaSyncedIndex):
+    """token -> {(model label, pk)} postings with prefix lookup over a sorted token list"""
+
+    def __init__(self):
+        super().__init__()
+        self.postings = defaultdict(set)
+        self.documents = {}  # (label, pk) -> tokens, so a document can be removed or replaced
+        self.sorted_tokens = []
+        self.sorted_dirty = False
+
+    def add(self, label, pk, values):
+        key = (label, pk)
+        tokens = set()
+        for value in values:
+            tokens |= tokenize(value)
+        with self.lock:
+            self._remove(key)
+            self.documents[key] = tokens
+            for token in tokens:
+                postings = self.postings[token]
+                if not postings:
+                    self.sorted_dirty = True
+                postings.add(key)
+
+    def remove(self, label, pk):
+        with self.lock:
+            self._remove((label, pk))
+
+    def _remove(self, key):
+        for token in self.documents.pop(key, ()):
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.postings[token]
+                    self.sorted_dirty = True
+
+    def sort_tokens(self):
+        with self.lock:
+            if self.sorted_dirty:
+                self.sorted_tokens = sorted(self.postings)
+                self.sorted_dirty = False
+
+    def _prefix_matches(self, prefix):
+        self.sort_tokens()
+        matches = set()
+        start = bisect_left(self.sorted_tokens, prefix)
+        for token in self.sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self.postings[token]
+        return matches
+
+    def search(self, query):
+        """Documents matching every query token (each token matched as a prefix)"""
+        terms = sorted(TOKEN_RE.findall(query.lower()), key=len, reverse=True)
+        if not terms:
+            return set()
+        with self.lock:
+            result = None
+            for term in terms:
+                matches = self._prefix_matches(term)
+                result = matches if result is None else result & matches
+                if not result:
+                    break
+            # Registrations are stored without separators, so "CA 123 456" is also looked up as "ca123456"
+            if len(terms) > 1:
+                return (result or set()) | self._prefix_matches(''.join(TOKEN_RE.findall(query.lower())))
+            return result or set()
+
+    def load(self, label, queryset):
+        fields = INDEXED_FIELDS[label]
+        for row in queryset.values_list('pk', *fields).iterator(chunk_size=2000):
+            self.add(label, row[0], row[1:])
+
+    def load_all(self):
+        for label in INDEXED_FIELDS:
+            self.load(label, apps.get_model(label).objects.all())
+        self.sort_tokens()
+
+    def load_changed(self, since):
+        for label in INDEXED_FIELDS:
+            sync_field = SYNC_FIELDS.get(label, 'updated_at')
+            self.load(label, apps.get_model(label).objects.filter(**{f'{sync_field}__gte': since}))
+
+
+search_index = InvertedIndex()
+
+
+def index_instance(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not search_index.built:
+        return
+    label = instance._meta.label
+    # e.g. a status change from the board: nothing indexed changed (and the text fields may be deferred)
+    if update_fields is not None and update_fields.isdisjoint(INDEXED_FIELDS[label]):
+        return
+    search_index.add(label, instance.pk, [getattr(instance, field) for field in INDEXED_FIELDS[label]])
+
+
+def unindex_instance(sender, instance, **kwargs):
+    if search_index.built:
+        search_index.remove(instance._meta.label, instance.pk)
+
+
+def connect_signals():
+    # Archive tables are only written with bulk_create, which the delta sync picks up
+    for label in INDEXED_FIELDS.keys() - ARCHIVE_LABELS:
+        model = apps.get_model(label)
+        post_save.connect(index_instance, sender=model, dispatch_uid=f'search_index_{label}')
+        post_delete.connect(unindex_instance, sender=model, dispatch_uid=f'search_unindex_{label}')
+
+
+def search(query, limit=20, include_archived=False):
+    """
+    Return {model label: {'objects': [...], 'total': n}} for records matching ``query``.
+
+    At most ``limit`` records per model are loaded, newest first. The index hits are
+    filtered through the database, so rows deleted by another process since the last
+    sync are neither listed nor counted; ``total`` takes a COUNT only when there are
+    more than ``limit`` rows.
+    """
+    search_index.ensure_current()
+    hits = defaultdict(list)
+    for label, pk in search_index.search(query):
+        hits[label].append(pk)
+
+    results = {}
+    for label in INDEXED_FIELDS:
+        if label in ARCHIVE_LABELS and not include_archived:
+            continue
+        pks = sorted(hits.get(label, ()), reverse=True)
+        if not pks:
+            continue
+        matching = apps.get_model(label).objects.filter(pk__in=pks)
+        found = list(matching.order_by('-pk')[:limit])
+        # Rows deleted by another process are still in this worker's index until now
+        lowest = found[-1].pk if len(found) == limit else 0
+        for pk in {pk for pk in pks if pk > lowest} - {obj.pk for obj in found}:
+            search_index.remove(label, pk)
+        if found:
+            results[label] = {'objects': found, 'total': matching.count() if len(found) == limit else len(found)}
+    return results
+
+
+def recent_matches(label, query):
+    """
+    pks of ``label`` rows matching ``query`` among those changed since the last sync
+    (less ``SEARCH_SYNC_OVERLAP``), which this worker's index may not have yet
+    """
+    since = search_index.synced_at - timedelta(seconds=settings.SEARCH_SYNC_OVERLAP)
+    recent = InvertedIndex()
+    sync_field = SYNC_FIELDS.get(label, 'updated_at')
+    recent.load(label, apps.get_model(label).objects.filter(**{f'{sync_field}__gte': since}))
+    return [pk for _, pk in recent.search(query)]
@@ -0,0 +1,37 @@
+import time
+
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from . import index
+
+GROUP_TITLES = {
+    'jobs.Job': 'Vehicle Checkins',
+    'inventory.Radiator': 'Radiator Orders',
+    'bookings.Booking': 'Bookings',
+    'archive.ArchivedJob': 'Archived Vehicle Checkins',
+    'archive.ArchivedRadiator': 'Archived Radiator Orders',
+}
+
+
+@login_required
+def global_search(request):
+    """Search jobs, parts orders and bookings (including notes) and group the results by type"""
+    query = request.GET.get('q', '').strip()
+    include_archived = request.GET.get('archived') == '1'
+    groups = []
+    elapsed_ms = None
+    if query:
+        started = time.perf_counter()
+        results = index.search(query, include_archived=include_archived)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        groups = [
+            {'label': label, 'title': GROUP_TITLES[label], **results[label]}
+            for label in GROUP_TITLES if label in results
+        ]
+    return render(request, 'search/results.html', {
+        'query': query,
+        'include_archived': include_archived,
+        'groups': groups,
+        'elapsed_ms': elapsed_ms,
+    })
@@ -0,0 +1,237 @@
+// Month, week, day and list views of a JSON event feed, for the booking and absentee calendars.
+//
+// The feed is fetched with ?start=YYYY-MM-DD&end=YYYY-MM-DD for the visible range and returns
+// [{id, title, start, end, allDay, color}, ...] with ISO local datetimes. Events are built with
+// textContent only, so nothing from the feed is ever parsed as HTML.
+(function() {
+    const VIEWS = [
+        ['month', 'Month'],
+        ['week', 'Week'],
+        ['day', 'Day'],
+        ['list', 'List'],
+    ];
+    const WEEKDAYS = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+
+    function element(tag, className, text) {
+        const node = document.createElement(tag);
+        if (className) {
+            node.className = className;
+        }
+        if (text !== undefined) {
+            node.textContent = text;
+        }
+        return node;
+    }
+
+    function addDays(day, count) {
+        return new Date(day.getFullYear(), day.getMonth(), day.getDate() + count);
+    }
+
+    function startOfDay(day) {
+        return new Date(day.getFullYear(), day.getMonth(), day.getDate());
+    }
+
+    function isoDate(day) {
+        const month = String(day.getMonth() + 1).padStart(2, '0');
+        const date = String(day.getDate()).padStart(2, '0');
+        return day.getFullYear() + '-' + month + '-' + date;
+    }
+
+    function parse(value) {
+        // "2026-10-19T09:30:00" is local time; Date() would read a bare date as UTC
+        const parts = value.split(/[-T:.]/).map(Number);
+        return new Date(parts[0], parts[1] - 1, parts[2], parts[3] || 0, parts[4] || 0);
+    }
+
+    function formatTime(moment) {
+        return moment.toLocaleTimeString([], {hour: '2-digit', minute: '2-digit', hour12: true});
+    }
+
+    function formatDay(day, options) {
+        return day.toLocaleDateString([], options);
+    }
+
+    class WorkshopCalendar {
+        constructor(root, options) {
+            this.root = root;
+            this.feed = options.events;
+            this.eventClick = options.eventClick || null;
+            this.view = 'month';
+            this.date = startOfDay(new Date());
+            this.latest = 0;
+        }
+
+        // [first day shown, day after the last one shown)
+        range() {
+            if (this.view === 'month') {
+                const first = new Date(this.date.getFullYear(), this.date.getMonth(), 1);
+                const start = addDays(first, -first.getDay());
+                const last = new Date(this.date.getFullYear(), this.date.getMonth() + 1, 0);
+                return [start, addDays(last, 7 - last.getDay())];
+            }
+            if (this.view === 'day') {
+                return [this.date, addDays(this.date, 1)];
+            }
+            const start = addDays(this.date, -this.date.getDay());
+            return [start, addDays(start, 7)];
+        }
+
+        move(step) {
+            if (this.view === 'month') {
+                this.date = new Date(this.date.getFullYear(), this.date.getMonth() + step, 1);
+            } else {
+                this.date = addDays(this.date, step * (this.view === 'day' ? 1 : 7));
+            }
+            this.render();
+        }
+
+        title(start, end) {
+            if (this.view === 'month') {
+                return formatDay(this.date, {month: 'long', year: 'numeric'});
+            }
+            if (this.view === 'day') {
+                return formatDay(this.date, {weekday: 'long', month: 'long', day: 'numeric', year: 'numeric'});
+            }
+            const last = addDays(end, -1);
+            return formatDay(start, {month: 'short', day: 'numeric'}) + ' – ' +
+                formatDay(last, {month: 'short', day: 'numeric', year: 'numeric'});
+        }
+
+        toolbar(start, end) {
+            const bar = element('div', 'calendar-toolbar');
+            const navigation = element('div', 'calendar-buttons');
+            [['‹', -1, 'Previous'], ['›', 1, 'Next']].forEach(([label, step, name]) => {
+                const button = element('button', 'calendar-button', label);
+                button.type = 'button';
+                button.setAttribute('aria-label', name);
+                button.addEventListener('click', () => this.move(step));
+                navigation.appendChild(button);
+            });
+            const today = element('button', 'calendar-button', 'Today');
+            today.type = 'button';
+            today.addEventListener('click', () => {
+                this.date = startOfDay(new Date());
+                this.render();
+            });
+            navigation.appendChild(today);
+
+            const views = element('div', 'calendar-buttons');
+            VIEWS.forEach(([view, label]) => {
+                const button = element('button', 'calendar-button' + (view === this.view ? ' active' : ''), label);
+                button.type = 'button';
+                button.addEventListener('click', () => {
+                    this.view = view;
+                    this.render();
+                });
+                views.appendChild(button);
+            });
+
+            bar.append(navigation, element('h2', 'calendar-title', this.title(start, end)), views);
+            return bar;
+        }
+
+        eventNode(event, withTime) {
+            const node = element(this.eventClick ? 'a' : 'div', 'calendar-event');
+            node.style.backgroundColor = event.color || '#667eea';
+            if (this.eventClick) {
+                node.href = '#';
+                node.addEventListener('click', (click) => {
+                    click.preventDefault();
+                    this.eventClick(event);
+                });
+            }
+            if (withTime && !event.allDay) {
+                node.appendChild(element('span', 'calendar-event-time', formatTime(parse(event.start)) + ' '));
+            }
+            node.appendChild(document.createTextNode(event.title));
+            return node;
+        }
+
+        byDay(events) {
+            const days = {};
+            events.forEach((event) => {
+                const key = isoDate(parse(event.start));
+                (days[key] = days[key] || []).push(event);
+            });
+            Object.values(days).forEach((list) => list.sort((a, b) => {
+                // All-day events first, then by start time
+                return (b.allDay - a.allDay) || (parse(a.start) - parse(b.start));
+            }));
+            return days;
+        }
+
+        grid(start, end, days) {
+            const table = element('div', 'calendar-grid' + (this.view === 'month' ? ' calendar-month' : ''));
+            WEEKDAYS.forEach((name) => table.appendChild(element('div', 'calendar-weekday', name)));
+            const todayKey = isoDate(new Date());
+            for (let day = start; day < end; day = addDays(day, 1)) {
+                const key = isoDate(day);
+                const cell = element('div', 'calendar-day');
+                if (this.view === 'month' && day.getMonth() !== this.date.getMonth()) {
+                    cell.classList.add('calendar-other-month');
+                }
+                if (key === todayKey) {
+                    cell.classList.add('calendar-today');
+                }
+                cell.appendChild(element('div', 'calendar-day-number', String(day.getDate())));
+                (days[key] || []).forEach((event) => cell.appendChild(this.eventNode(event, true)));
+                table.appendChild(cell);
+            }
+            return table;
+        }
+
+        list(start, end, days) {
+            const list = element('div', 'calendar-list');
+            for (let day = start; day < end; day = addDays(day, 1)) {
+                const events = days[isoDate(day)];
+                if (!events) {
+                    continue;
+                }
+                list.appendChild(element('h3', 'calendar-list-day', formatDay(day, {weekday: 'long', month: 'long', day: 'numeric'})));
+                events.forEach((event) => {
+                    const row = element('div', 'calendar-list-row');
+                    row.appendChild(element('span', 'calendar-list-time', event.allDay ? 'All day' : formatTime(parse(event.start))));
+                    row.appendChild(this.eventNode(event, false));
+                    list.appendChild(row);
+                });
+            }
+            if (!list.children.length) {
+                list.appendChild(element('p', 'calendar-empty', 'Nothing scheduled.'));
+            }
+            return list;
+        }
+
+        render() {
+            const [start, end] = this.range();
+            const request = ++this.latest;
+            this.root.replaceChildren(this.toolbar(start, end), element('p', 'calendar-empty', 'Loading…'));
+            const url = this.feed + (this.feed.includes('?') ? '&' : '?') +
+                'start=' + isoDate(start) + '&end=' + isoDate(end);
+            fetch(url, {credentials: 'same-origin'})
+                .then((response) => {
+                    if (!response.ok) {
+                        throw new Error(response.status);
+                    }
+                    return response.json();
+                })
+                .then((events) => {
+                    // A later prev/next click has already been sent; its events win
+                    if (request !== this.latest) {
+                        return;
+                    }
+                    const days = this.byDay(events);
+                    const body = this.view === 'list' || this.view === 'day'
+                        ? this.list(start, end, days)
+                        : this.grid(start, end, days);
+                    this.root.replaceChildren(this.toolbar(start, end), body);
+                })
+                .catch(() => {
+                    if (request === this.latest) {
+                        this.root.replaceChildren(this.toolbar(start, end), element('p', 'calendar-empty', 'Could not load the calendar.'));
+                    }
+                });
+        }
+    }
+
+    window.WorkshopCalendar = WorkshopCalendar;
+})();
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class VehiclesConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'vehicles'
+
+    def ready(self):
+        from . import index
+        index.connect_signals()
@@ -0,0 +1,21 @@
+import re
+
+from django.db import models
+
+REGISTRATION_SEPARATORS_RE = re.compile(r'[\W_]+')
+
+
+def normalize_registration(value):
+    """Uppercase without spaces or separators, e.g. "ca 123-456" -> "CA123456"; None stays None"""
+    if value is None:
+        return None
+    return REGISTRATION_SEPARATORS_RE.sub('', str(value)).upper()
+
+
+class RegistrationField(models.CharField):
+    """A CharField holding a normalized vehicle registration. Normalized on every save, including bulk_create."""
+
+    def pre_save(self, model_instance, add):
+        value = normalize_registration(getattr(model_instance, self.attname))
+        setattr(model_instance, self.attname, value)
+        return value
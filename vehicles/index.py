@@ -0,0 +1,279 @@
+"""
+In-process prefix tries of the vehicle makes and models typed on jobs and bookings.
+
+Each distinct make (and each model, per make and overall) is one entry keyed by
+its casefolded text, so "toyota", "Toyota" and "TOYOTA " count as one make; the
+entry is shown in its most common spelling. Every trie node keeps its ``TOP_SIZE``
+most frequent entries, so a suggestion is a walk down the typed prefix and a slice:
+no scan of the subtree, whatever the number of values.
+
+A worker builds the tries from one GROUP BY per model on first use and keeps them
+current with post_save/post_delete: a save moves one count from the make/model it
+was loaded with (``workshop_manager.snapshots``) to the new one. Bulk writes
+(imports, archiving) and other processes' changes are picked up by a recount in a
+background thread at most every ``VEHICLE_INDEX_REFRESH`` seconds, so a keystroke
+never waits for the database. A save counted while a recount is running may or may
+not be in the recount's query, so the fresh tries are kept and another recount is
+due at the next lookup.
+"""
+
+import heapq
+import threading
+import time
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+
+from workshop_manager import snapshots
+
+# Models whose vehicle_make/vehicle_model are counted
+INDEXED_MODELS = ['jobs.Job', 'bookings.Booking']
+VEHICLE_FIELDS = ['vehicle_make', 'vehicle_model']
+
+# Most suggestions a trie node keeps (and so the most one lookup returns)
+TOP_SIZE = 10
+
+
+def vehicle_key(value):
+    """Casefolded text with whitespace collapsed, e.g. " Land  Rover" -> "land rover" """
+    return ' '.join(str(value or '').casefold().split())
+
+
+def _spelling(value):
+    return ' '.join(str(value or '').split())
+
+
+class _Entry:
+    __slots__ = ('key', 'count', 'spellings')
+
+    def __init__(self, key):
+        self.key = key
+        self.count = 0
+        self.spellings = Counter()
+
+    @property
+    def value(self):
+        return self.spellings.most_common(1)[0][0]
+
+
+def _rank(entry):
+    return (-entry.count, entry.key)
+
+
+class _Node:
+    __slots__ = ('children', 'entry', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.entry = None
+        self.top = []
+
+    def refresh_top(self):
+        """Rebuild this node's top entries from its own entry and its children's (already current) tops"""
+        candidates = [entry for child in self.children.values() for entry in child.top]
+        if self.entry is not None:
+            candidates.append(self.entry)
+        self.top = heapq.nsmallest(TOP_SIZE, candidates, key=_rank)
+
+
+class PrefixTrie:
+    """Distinct values with a count each; ``complete`` returns the most frequent under a prefix"""
+
+    def __init__(self):
+        self.root = _Node()
+        self.size = 0
+
+    def add(self, value, delta=1, refresh=True):
+        """Change ``value``'s count by ``delta``, dropping it at zero. ``refresh=False`` defers the node tops to ``refresh_all``"""
+        key = vehicle_key(value)
+        if not key:
+            return
+        path = [self.root]
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                if delta < 0:
+                    return
+                child = path[-1].children[char] = _Node()
+            path.append(child)
+
+        node = path[-1]
+        if node.entry is None:
+            if delta < 0:
+                return
+            node.entry = _Entry(key)
+            self.size += 1
+        entry = node.entry
+        spelling = _spelling(value)
+        entry.spellings[spelling] += delta
+        if entry.spellings[spelling] <= 0:
+            del entry.spellings[spelling]
+        entry.count += delta
+        if entry.count <= 0:
+            node.entry = None
+            self.size -= 1
+
+        if not refresh:
+            return
+        # Bottom-up, so each node merges children whose tops are already current; empty branches are pruned
+        for depth in range(len(key), -1, -1):
+            node = path[depth]
+            if depth and node.entry is None and not node.children:
+                del path[depth - 1].children[key[depth - 1]]
+                continue
+            node.refresh_top()
+
+    def refresh_all(self):
+        """Recompute every node's top entries after loading with ``refresh=False``"""
+        stack = [(self.root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                node.refresh_top()
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+
+    def complete(self, prefix, limit=TOP_SIZE):
+        """[(value, count), ...] for the most frequent values starting with ``prefix``"""
+        node = self.root
+        for char in vehicle_key(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(entry.value, entry.count) for entry in node.top[:limit]]
+
+
+class VehicleIndex:
+    """Tries of makes, of all models, and of the models of each make"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Held by the one thread building the tries
+        self.build_lock = threading.Lock()
+        self.built = False
+        self.refreshing = False
+        self.last_refresh = 0.0
+        # Bumped by every count from a save, to tell whether one came in during a recount
+        self.changes = 0
+        self._reset()
+
+    def _reset(self):
+        self.makes = PrefixTrie()
+        self.models = PrefixTrie()
+        self.models_by_make = {}  # make key -> PrefixTrie
+
+    def add(self, make, model, delta=1, refresh=True):
+        with self.lock:
+            self.changes += 1
+            if vehicle_key(make):
+                self.makes.add(make, delta, refresh)
+            if not vehicle_key(model):
+                return
+            self.models.add(model, delta, refresh)
+            make_key = vehicle_key(make)
+            if make_key:
+                trie = self.models_by_make.get(make_key)
+                if trie is None:
+                    if delta < 0:
+                        return
+                    trie = self.models_by_make[make_key] = PrefixTrie()
+                trie.add(model, delta, refresh)
+                if not trie.size:
+                    del self.models_by_make[make_key]
+
+    def load(self):
+        """Replace the tries with fresh counts, built aside so lookups keep answering meanwhile"""
+        changes = self.changes
+        counts = Counter()
+        for label in INDEXED_MODELS:
+            rows = (
+                apps.get_model(label).objects.order_by()
+                .values_list('vehicle_make', 'vehicle_model').annotate(count=Count('pk'))
+            )
+            for make, model, count in rows:
+                counts[_spelling(make), _spelling(model)] += count
+
+        fresh = VehicleIndex()
+        for (make, model), count in counts.items():
+            fresh.add(make, model, count, refresh=False)
+        for trie in [fresh.makes, fresh.models, *fresh.models_by_make.values()]:
+            trie.refresh_all()
+        with self.lock:
+            self.makes, self.models, self.models_by_make = fresh.makes, fresh.models, fresh.models_by_make
+            if self.changes != changes:
+                # Saves counted meanwhile may be missing from the recount; recount again on the next lookup
+                self.last_refresh = 0.0
+
+    def _refresh(self):
+        try:
+            self.load()
+        finally:
+            self.refreshing = False
+            connection.close()
+
+    def ensure_current(self):
+        """Build the tries on first use, then recount in the background at most every refresh interval"""
+        if not self.built:
+            # The GROUP BY runs outside self.lock, so only this build waits on it
+            with self.build_lock:
+                if not self.built:
+                    self.last_refresh = time.monotonic()
+                    self.load()
+                    self.built = True
+            return
+        now = time.monotonic()
+        with self.lock:
+            if not self.refreshing and now - self.last_refresh >= settings.VEHICLE_INDEX_REFRESH:
+                self.refreshing = True
+                self.last_refresh = now
+                threading.Thread(target=self._refresh, daemon=True).start()
+
+    def suggest_makes(self, prefix, limit=TOP_SIZE):
+        with self.lock:
+            return self.makes.complete(prefix, limit)
+
+    def suggest_models(self, prefix, make='', limit=TOP_SIZE):
+        """Models of ``make`` when it has any recorded, else models of every make"""
+        with self.lock:
+            trie = self.models_by_make.get(vehicle_key(make), self.models)
+            return trie.complete(prefix, limit)
+
+
+vehicle_index = VehicleIndex()
+
+
+def _loaded_vehicle(instance):
+    values = snapshots.loaded(instance, 'vehicle')
+    return tuple(values.get(field) for field in VEHICLE_FIELDS)
+
+
+def count_vehicle(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw or not vehicle_index.built:
+        return
+    if update_fields is not None and update_fields.isdisjoint(VEHICLE_FIELDS):
+        return
+    old = None if created else _loaded_vehicle(instance)
+    new = (instance.vehicle_make, instance.vehicle_model)
+    if old != new:
+        if old is not None:
+            vehicle_index.add(*old, delta=-1)
+        vehicle_index.add(*new)
+    snapshots.remember(instance, 'vehicle')
+
+
+def uncount_vehicle(sender, instance, **kwargs):
+    if vehicle_index.built:
+        vehicle_index.add(*_loaded_vehicle(instance), delta=-1)
+
+
+def connect_signals():
+    for label in INDEXED_MODELS:
+        model = apps.get_model(label)
+        snapshots.track(model, 'vehicle', VEHICLE_FIELDS)
+        post_save.connect(count_vehicle, sender=model, dispatch_uid=f'vehicle_count_{label}')
+        post_delete.connect(uncount_vehicle, sender=model, dispatch_uid=f'vehicle_uncount_{label}')
@@ -0,0 +1,90 @@
+"""
+A vehicle's history and open jobs, looked up by normalized registration.
+
+Jobs (live and archived) and bookings are each indexed on (vehicle_registration,
+date), so a page of history is one UNION ALL of three index range scans, paged by
+a (date, kind, id) keyset instead of an OFFSET. Open jobs have their own partial
+index, which only holds jobs that are not completed: checking a registration for
+an open job reads a handful of entries however many jobs the table has.
+"""
+
+from datetime import date
+
+from django.db.models import CharField, F, Q, Value
+from django.db.models.functions import Concat
+
+from .fields import normalize_registration
+
+PAGE_SIZE = 50
+
+
+def open_job(registration, exclude_pk=None):
+    """The most recent job for ``registration`` that is not completed, or None"""
+    from jobs.models import Job
+
+    registration = normalize_registration(registration)
+    if not registration:
+        return None
+    jobs = Job.objects.filter(vehicle_registration=registration).exclude(status='Completed')
+    if exclude_pk is not None:
+        jobs = jobs.exclude(pk=exclude_pk)
+    return jobs.order_by('-date_received', '-pk').only('pk', 'status', 'date_received', 'customer_name').first()
+
+
+def _after(queryset, kind, day_field, cursor):
+    """Rows of ``kind`` that sort after ``cursor`` in (date descending, kind, id descending) order"""
+    if cursor is None:
+        return queryset
+    day, cursor_kind, cursor_pk = cursor
+    later = Q(**{f'{day_field}__lt': day})
+    if kind > cursor_kind:
+        later |= Q(**{day_field: day})
+    elif kind == cursor_kind:
+        later |= Q(**{day_field: day, 'pk__lt': cursor_pk})
+    return queryset.filter(later)
+
+
+def parse_cursor(cursor):
+    """Split a "<iso date>|<kind>|<id>" cursor, returning None if it is malformed"""
+    try:
+        day, kind, pk = cursor.split('|')
+        return date.fromisoformat(day), kind, int(pk)
+    except (ValueError, AttributeError):
+        return None
+
+
+def vehicle_history(registration, cursor=None, limit=PAGE_SIZE):
+    """
+    (rows, next cursor) for the jobs, archived jobs and bookings of ``registration``,
+    newest first. Each row is a dict with kind, id, date, title, detail and status.
+    """
+    from archive.models import ArchivedJob
+    from bookings.models import Booking
+    from jobs.models import Job
+
+    registration = normalize_registration(registration)
+    text = CharField()
+    columns = ['kind', 'pk', 'day', 'title', 'detail', 'status']
+    vehicle = Concat('vehicle_make', Value(' '), 'vehicle_model', output_field=text)
+    querysets = [
+        _after(model.objects.filter(vehicle_registration=registration), kind, day_field, cursor).annotate(
+            kind=Value(kind, text), day=F(day_field), title=F('customer_name'), detail=vehicle,
+        ).order_by().values_list(*columns)
+        for kind, model, day_field in [
+            ('job', Job, 'date_received'),
+            ('archived', ArchivedJob, 'date_received'),
+            ('booking', Booking, 'booking_date'),
+        ]
+    ]
+    rows = querysets[0].union(*querysets[1:], all=True).order_by('-day', 'kind', '-pk')[:limit + 1]
+
+    page = [
+        {'kind': kind, 'id': pk, 'date': day, 'title': title, 'detail': detail, 'status': status}
+        for kind, pk, day, title, detail, status in rows
+    ]
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last = page[-1]
+        next_cursor = f"{last['date'].isoformat()}|{last['kind']}|{last['id']}"
+    return page, next_cursor
@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+app_name = 'vehicles'
+
+urlpatterns = [
+    path('suggest/', views.vehicle_suggest, name='vehicle_suggest'),
+    path('<str:registration>/', views.vehicle_history, name='vehicle_history'),
+]
@@ -0,0 +1,50 @@
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
+from django.shortcuts import redirect, render
+
+from .fields import normalize_registration
+from .index import vehicle_index
+from . import services
+
+SUGGESTIONS = 8
+
+
+@login_required
+def vehicle_suggest(request):
+    """Autocomplete: the most common makes, or models (of the make given, if any), starting with what has been typed"""
+    field = request.GET.get('field')
+    prefix = request.GET.get('q', '')
+    if field not in ('make', 'model'):
+        return JsonResponse({'error': 'Pass ?field=make or ?field=model'}, status=400)
+    vehicle_index.ensure_current()
+    if field == 'make':
+        suggestions = vehicle_index.suggest_makes(prefix, SUGGESTIONS)
+    else:
+        suggestions = vehicle_index.suggest_models(prefix, request.GET.get('make', ''), SUGGESTIONS)
+    return JsonResponse({'results': [{'value': value, 'count': count} for value, count in suggestions]})
+
+
+# Page a history row links to (archived jobs have none)
+HISTORY_URLS = {
+    'job': 'jobs:job_detail',
+    'booking': 'bookings:booking_detail',
+}
+
+
+@login_required
+def vehicle_history(request, registration):
+    """Every job and booking for one registration, newest first, paged by (date, kind, id) keyset"""
+    normalized = normalize_registration(registration)
+    if not normalized:
+        # Nothing but separators (e.g. "---"), which no vehicle is registered under
+        raise Http404
+    if normalized != registration:
+        return redirect('vehicles:vehicle_history', registration=normalized)
+    rows, next_cursor = services.vehicle_history(registration, services.parse_cursor(request.GET.get('before')))
+    for row in rows:
+        row['url_name'] = HISTORY_URLS.get(row['kind'])
+    return render(request, 'vehicles/vehicle_history.html', {
+        'registration': registration,
+        'rows': rows,
+        'next_cursor': next_cursor,
+    })
@@ -0,0 +1,122 @@
+"""
+Filtered, sorted and keyset-paged record lists.
+
+A list page and its rows fragment share one context built from the query string:
+each filter is a choice field matched exactly, each sort is a Django-style
+ordering ending in ``id``, and a page is the first ``PAGE_SIZE`` rows after the
+``after`` cursor (the sort values of the previous page's last row). Paging by
+keyset instead of OFFSET keeps every page an index range scan, and the rows
+fragment lets the list page swap in a new filter, sort or page without
+re-rendering the layout around it.
+"""
+
+from datetime import date, datetime, time
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+
+PAGE_SIZE = 50
+
+
+def _ordering(model, ordering):
+    """[(field, descending), ...] for Django-style ``ordering`` such as ['-date_received', '-id']"""
+    return [(model._meta.get_field(name.lstrip('-')), name.startswith('-')) for name in ordering]
+
+
+def _order_by(ordering):
+    # NULL sorts as the lowest value either way, on every backend, so the cursor filter below matches the order
+    expressions = []
+    for field, descending in ordering:
+        if not field.null:
+            expressions.append(F(field.name).desc() if descending else F(field.name).asc())
+        elif descending:
+            expressions.append(F(field.name).desc(nulls_last=True))
+        else:
+            expressions.append(F(field.name).asc(nulls_first=True))
+    return expressions
+
+
+def _encode(value):
+    if value is None:
+        return ''
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def parse_cursor(model, ordering, cursor):
+    """The sort values in an ``after`` cursor, or None if it is missing or malformed"""
+    ordering = _ordering(model, ordering)
+    parts = cursor.split('|') if cursor else []
+    if len(parts) != len(ordering):
+        return None
+    values = []
+    try:
+        for (field, descending), text in zip(ordering, parts):
+            if not text and not field.null:
+                return None
+            values.append(field.to_python(text) if text else None)
+    except (ValidationError, ValueError):
+        return None
+    return values
+
+
+def _after(ordering, values):
+    """Q for rows that sort after ``values`` in ``ordering``"""
+    condition = None
+    equal = Q()
+    for (field, descending), value in zip(ordering, values):
+        name = field.name
+        if value is None:
+            later = None if descending else Q(**{f'{name}__isnull': False})
+            same = Q(**{f'{name}__isnull': True})
+        else:
+            later = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+            if descending and field.null:
+                later |= Q(**{f'{name}__isnull': True})
+            same = Q(**{name: value})
+        if later is not None:
+            condition = equal & later if condition is None else condition | (equal & later)
+        equal &= same
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor=None, limit=PAGE_SIZE):
+    """(rows, next cursor) for the page of ``queryset`` in ``ordering`` that follows ``cursor``"""
+    fields = _ordering(queryset.model, ordering)
+    values = parse_cursor(queryset.model, ordering, cursor)
+    if values is not None:
+        queryset = queryset.filter(_after(fields, values))
+    rows = list(queryset.order_by(*_order_by(fields))[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, '|'.join(_encode(getattr(rows[-1], field.attname)) for field, descending in fields)
+
+
+def record_list(request, queryset, filters, sorts):
+    """
+    Context for one page of a record list: ``rows``, ``next_cursor``, the chosen
+    ``sort``, the ``sorts`` to offer and the ``query`` string (filters and sort)
+    that the next page's link carries.
+
+    ``filters`` maps a choice field to its choices; ``sorts`` maps a sort key to
+    (label, ordering), the first being the default.
+    """
+    for field, choices in filters.items():
+        value = request.GET.get(field)
+        if value in {choice for choice, label in choices}:
+            queryset = queryset.filter(**{field: value})
+    sort = request.GET.get('sort')
+    if sort not in sorts:
+        sort = next(iter(sorts))
+    rows, next_cursor = keyset_page(queryset, sorts[sort][1], request.GET.get('after'))
+    params = request.GET.copy()
+    params.pop('after', None)
+    return {
+        'rows': rows,
+        'next_cursor': next_cursor,
+        'sort': sort,
+        'sorts': [(key, label) for key, (label, ordering) in sorts.items()],
+        'query': params.urlencode(),
+    }
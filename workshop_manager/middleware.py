@@ -0,0 +1,103 @@
+import uuid
+from functools import partial
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import get_user_model
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+USER_CACHE_PREFIX = 'auth:user:'
+USER_GENERATION_PREFIX = 'auth:user-gen:'
+
+
+def _user_cache_key(session_key):
+    return f'{USER_CACHE_PREFIX}{session_key}'
+
+
+def _generation_key(user_id):
+    return f'{USER_GENERATION_PREFIX}{user_id}'
+
+
+def get_cached_user(request):
+    """
+    Return the user for this request, reading it from the cache when possible.
+
+    Cached users are keyed by session and stamped with a per-user generation
+    token, so saving or deleting the user (or logging out) invalidates every
+    cached copy. A missing token is replaced with a fresh one rather than
+    treated as a value, so copies stamped before it was evicted never match. The session auth hash is still verified on each hit, so a password
+    change logs other sessions out exactly like ``auth.get_user`` does.
+    """
+    if hasattr(request, '_cached_user'):
+        return request._cached_user
+
+    session = request.session
+    session_key = session.session_key
+    user_id = session.get(auth.SESSION_KEY)
+
+    if session_key and user_id is not None:
+        cache_key = _user_cache_key(session_key)
+        generation_key = _generation_key(user_id)
+        cached = cache.get_many([cache_key, generation_key])
+        entry = cached.get(cache_key)
+        generation = cached.get(generation_key)
+        if generation is None:
+            # cache.add keeps the token another request may have just started
+            token = uuid.uuid4().hex
+            generation = token if cache.add(generation_key, token, None) else cache.get(generation_key)
+        if entry is not None:
+            cached_generation, user = entry
+            session_hash = session.get(auth.HASH_SESSION_KEY)
+            if (
+                cached_generation == generation
+                and str(user.pk) == str(user_id)
+                and session_hash
+                and constant_time_compare(session_hash, user.get_session_auth_hash())
+            ):
+                request._cached_user = user
+                return user
+
+        user = auth.get_user(request)
+        if user.is_authenticated and generation is not None:
+            cache.set(cache_key, (generation, user), settings.AUTH_USER_CACHE_TIMEOUT)
+        request._cached_user = user
+        return user
+
+    request._cached_user = auth.get_user(request)
+    return request._cached_user
+
+
+async def aget_cached_user(request):
+    """Async counterpart of get_cached_user, used by ``request.auser()`` in async views"""
+    return await sync_to_async(get_cached_user)(request)
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware that resolves ``request.user`` through the cache"""
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
+        request.auser = partial(aget_cached_user, request)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Bump the user's generation so every cached copy becomes stale"""
+    cache.set(_generation_key(instance.pk), uuid.uuid4().hex, None)
+
+
+@receiver(user_logged_out)
+def forget_cached_user(sender, request, user, **kwargs):
+    """Drop the cached user for the session that is logging out"""
+    if request is not None and request.session.session_key:
+        cache.delete(_user_cache_key(request.session.session_key))
@@ -0,0 +1,131 @@
+"""
+Read-replica routing.
+
+Views decorated with ``use_replica`` read from the ``replica`` database alias; every
+write, and every read outside those views, goes to ``default``. After a request
+writes, the browser gets a short-lived cookie that pins its reads to the primary,
+so the page it is redirected to shows the change even if the replica lags behind.
+Without a ``replica`` alias in DATABASES everything reads from ``default``.
+"""
+
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+PIN_COOKIE = 'db_pin'
+
+# Session rows are saved on most requests and do not make the shop's data stale
+UNTRACKED_APPS = {'sessions'}
+
+_use_replica = ContextVar('use_replica', default=False)
+_request_state = ContextVar('replica_request_state', default=None)
+
+
+class _RequestState:
+    __slots__ = ('pinned', 'wrote')
+
+    def __init__(self, pinned):
+        self.pinned = pinned
+        self.wrote = False
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+def use_replica(view):
+    """Let a read-only view (sync or async) read from the replica"""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(*args, **kwargs):
+            token = _use_replica.set(True)
+            try:
+                return await view(*args, **kwargs)
+            finally:
+                _use_replica.reset(token)
+    else:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            token = _use_replica.set(True)
+            try:
+                return view(*args, **kwargs)
+            finally:
+                _use_replica.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+    """Send reads from ``use_replica`` views to the replica unless the client recently wrote"""
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or not replica_configured():
+            return None
+        state = _request_state.get()
+        if state is not None and (state.pinned or state.wrote):
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None and model._meta.app_label not in UNTRACKED_APPS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives its schema from the primary
+        return db != REPLICA_DB_ALIAS
+
+
+class ReplicaPinMiddleware:
+    """Track writes per request and pin the client to the primary for a few seconds after one"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state, token = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self.finish(state, response)
+
+    async def __acall__(self, request):
+        state, token = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        return self.finish(state, response)
+
+    def start(self, request):
+        state = _RequestState(pinned=PIN_COOKIE in request.COOKIES)
+        return state, _request_state.set(state)
+
+    def finish(self, state, response):
+        if state.wrote and replica_configured():
+            response.set_cookie(
+                PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+                secure=settings.SESSION_COOKIE_SECURE,
+            )
+        return response
@@ -45,6 +45,15 @@ INSTALLED_APPS = [
     'bookings',
     'reports',
     'absentees',
+    'audit',
+    'search',
+    'archive',
+    'backup',
+    'board',
+    'importer',
+    'customers',
+    'vehicles',
+    'assignments',
 ]
 
 MIDDLEWARE = [
@@ -53,8 +62,10 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'workshop_manager.routers.ReplicaPinMiddleware',  # Read-your-writes for replica reads
+    'django.contrib.auth.middleware.AuthenticationMiddleware',  # Swapped for the cached lookup when REDIS_URL is set
     'django.contrib.messages.middleware.MessageMiddleware',
+    'audit.middleware.AuditMiddleware',  # Batches audit entries per request
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -84,12 +95,32 @@ WSGI_APPLICATION = 'workshop_manager.wsgi.application'
 # Use DATABASE_URL if available (Railway/Heroku style), otherwise use SQLite for local development
 DATABASE_URL = config('DATABASE_URL', default=None)
 if DATABASE_URL:
-    db_config = dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+    # Pooled connections are handed back to the pool after each request, so they must not also be persistent
+    DB_POOL = config('DB_POOL', default=True, cast=bool)
+    db_config = dj_database_url.parse(
+        DATABASE_URL,
+        conn_max_age=0 if DB_POOL else config('CONN_MAX_AGE', default=600, cast=int),
+        conn_health_checks=True,
+    )
     # Add SSL requirement for Supabase PostgreSQL connections
     if db_config.get('ENGINE') == 'django.db.backends.postgresql':
         db_config['OPTIONS'] = {
             'sslmode': 'require',
         }
+        # psycopg3 connection pool: min_size connections are opened in the background and kept warm,
+        # so the TLS handshake to Supabase happens off the request path; connections are checked
+        # before being handed out so a database restart does not surface as a failed request
+        if DB_POOL:
+            from psycopg_pool import ConnectionPool
+
+            db_config['OPTIONS']['pool'] = {
+                'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+                'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+                'max_idle': config('DB_POOL_MAX_IDLE', default=300, cast=float),
+                'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=1800, cast=float),
+                'check': ConnectionPool.check_connection,
+            }
     DATABASES = {
         'default': db_config
     }
@@ -97,9 +128,121 @@ else:
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            'NAME': config('SQLITE_PATH', default=str(BASE_DIR / 'db.sqlite3')),
         }
     }
+    # SQLite production profile: WAL lets readers run alongside a writer, busy_timeout makes
+    # concurrent workers wait for the write lock instead of failing with "database is locked",
+    # and IMMEDIATE transactions take that lock up front rather than upgrading mid-transaction
+    if config('SQLITE_PRODUCTION', default=not DEBUG, cast=bool):
+        DATABASES['default']['OPTIONS'] = {
+            'init_command': ';'.join([
+                'PRAGMA journal_mode=WAL',
+                'PRAGMA synchronous=NORMAL',
+                'PRAGMA busy_timeout=%d' % config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+                'PRAGMA mmap_size=%d' % config('SQLITE_MMAP_SIZE', default=134217728, cast=int),
+                'PRAGMA cache_size=%d' % config('SQLITE_CACHE_SIZE', default=-20000, cast=int),
+                'PRAGMA temp_store=MEMORY',
+            ]),
+            'transaction_mode': 'IMMEDIATE',
+        }
+
+# Optional read replica (e.g. a Supabase read replica). Reports, the dashboard and the calendar feeds
+# read from it, see workshop_manager/routers.py. It shares the primary's options (SSL, pool, pragmas)
+# when it uses the same engine; a second SQLite file works as a local stand-in
+# (`manage.py sync_sqlite_replica` copies the primary into it)
+DATABASE_REPLICA_URL = config('DATABASE_REPLICA_URL', default=None)
+if DATABASE_REPLICA_URL:
+    replica_config = dj_database_url.parse(
+        DATABASE_REPLICA_URL,
+        conn_max_age=DATABASES['default'].get('CONN_MAX_AGE', 0),
+        conn_health_checks=True,
+    )
+    if replica_config.get('ENGINE') == DATABASES['default']['ENGINE']:
+        replica_config['OPTIONS'] = dict(DATABASES['default'].get('OPTIONS', {}))
+    # Tests run against the primary only; the replica alias points at the same test database
+    replica_config['TEST'] = {'MIRROR': 'default'}
+    DATABASES['replica'] = replica_config
+
+DATABASE_ROUTERS = ['workshop_manager.routers.ReplicaRouter']
+
+# Seconds a client keeps reading from the primary after it writes, so it sees its own changes
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=int)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Use REDIS_URL if available so every worker shares one cache, otherwise a per-process memory cache
+REDIS_URL = config('REDIS_URL', default=None)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/
+
+# 'db' is Django's default, 'cached_db' reads sessions from the cache and only falls back to the database
+# on a miss (only with REDIS_URL, as a per-process cache keeps serving sessions other workers have ended),
+# 'signed_cookies' keeps the session in the cookie itself
+SESSION_BACKEND = config('SESSION_BACKEND', default='db')
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_BACKEND}'
+
+# Cache the logged-in user per session only when every worker shares the cache, since saving a user or
+# logging out invalidates the cached copies with a cache write that a per-process cache keeps to itself
+if REDIS_URL:
+    MIDDLEWARE[MIDDLEWARE.index('django.contrib.auth.middleware.AuthenticationMiddleware')] = (
+        'workshop_manager.middleware.CachedAuthenticationMiddleware'
+    )
+
+# How long (seconds) an authenticated user is cached per session before it is re-read from the database
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=300, cast=int)
+
+
+# Global search
+# Seconds between checks for records changed by other worker processes
+SEARCH_SYNC_INTERVAL = config('SEARCH_SYNC_INTERVAL', default=5, cast=float)
+# Seconds each sync re-reads before the last one, for rows whose transaction committed after it ran
+SEARCH_SYNC_OVERLAP = config('SEARCH_SYNC_OVERLAP', default=60, cast=float)
+
+# Customers
+# Country calling code given to phone numbers typed the local way (e.g. 082 555 0100 -> +27825550100)
+PHONE_COUNTRY_CODE = config('PHONE_COUNTRY_CODE', default='27')
+# Lowest fuzzy match score (0-1) at which a new booking is linked to an existing customer
+CUSTOMER_MATCH_THRESHOLD = config('CUSTOMER_MATCH_THRESHOLD', default=0.6, cast=float)
+
+# Vehicle make/model suggestions
+# Seconds between background recounts that pick up bulk imports and other worker processes' saves
+VEHICLE_INDEX_REFRESH = config('VEHICLE_INDEX_REFRESH', default=300, cast=float)
+
+# Technician assignment
+# Vehicles the workshop can work on in one day (each job or vehicle booking holds a bay for its day)
+WORKSHOP_BAYS = config('WORKSHOP_BAYS', default=4, cast=int)
+# Jobs and bookings one technician takes on in a day
+TECHNICIAN_DAILY_JOBS = config('TECHNICIAN_DAILY_JOBS', default=3, cast=int)
+# Days of the week the workshop is open, 0 = Monday
+WORKSHOP_WEEKDAYS = [int(day) for day in config('WORKSHOP_WEEKDAYS', default='0,1,2,3,4,5').split(',') if day.strip()]
+
+# Month comparison report
+# Seconds a closed month's figures stay cached; saves, imports and archiving also start a fresh cache,
+# but only in the worker that made them unless REDIS_URL is set
+COMPARISON_CACHE_TIMEOUT = config('COMPARISON_CACHE_TIMEOUT', default=3600, cast=int)
+
+
+# Archiving
+# Completed jobs and parts orders older than this many days are moved out by `manage.py archive_completed`
+ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=365, cast=int)
 
 
 # Password validation
@@ -141,7 +284,20 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
 # WhiteNoise settings for static file serving
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# collectstatic writes content-hashed copies plus gzip and brotli variants; WhiteNoise serves the
+# hashed names with a far-future "immutable" Cache-Control header
+# (DEBUG runs and the test suite use the plain storage, since nothing has been collected there)
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
 
 # Authentication settings
 LOGIN_URL = '/login/'
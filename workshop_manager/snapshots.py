@@ -0,0 +1,46 @@
+"""
+The field values a model instance was loaded with, for save and delete handlers
+that need to know what changed without querying for the old row.
+
+Each feature tracks the fields it compares under its own name (the audit log, the
+customer link, the rollups, ...). One post_init receiver per model stores every
+tracked set from ``instance.__dict__``, so deferred fields are left out instead of
+being loaded just to be remembered. A feature reads its set with ``loaded`` and,
+after handling a save, stores the saved values with ``remember``; the sets are kept
+apart so one feature's ``remember`` never hides a change from another.
+"""
+
+from collections import defaultdict
+
+from django.db.models.signals import post_init
+
+# model -> {name: [attname, ...]}
+_tracked = defaultdict(dict)
+
+
+def track(model, name, fields):
+    """Snapshot ``fields`` (attnames) of every ``model`` instance under ``name``"""
+    _tracked[model][name] = list(fields)
+    post_init.connect(_take, sender=model, dispatch_uid=f'snapshots_{model._meta.label}')
+
+
+def current(instance, name):
+    """{attname: value} of the tracked fields as they are now, leaving out deferred ones"""
+    values = instance.__dict__
+    return {attname: values[attname] for attname in _tracked[type(instance)][name] if attname in values}
+
+
+def loaded(instance, name):
+    """The tracked fields' values when the instance was loaded or last remembered"""
+    return getattr(instance, '_snapshots', {}).get(name, {})
+
+
+def remember(instance, name, values=None):
+    """Store ``values`` (by default the current ones) as the instance's snapshot for ``name``"""
+    if not hasattr(instance, '_snapshots'):
+        instance._snapshots = {}
+    instance._snapshots[name] = current(instance, name) if values is None else values
+
+
+def _take(sender, instance, **kwargs):
+    instance._snapshots = {name: current(instance, name) for name in _tracked[sender]}
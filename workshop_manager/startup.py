@@ -0,0 +1,51 @@
+"""
+Boot-time helpers used by gunicorn.conf.py.
+
+Checking for unapplied migrations only reads the migration files and the
+``django_migrations`` table, so a normal restart skips ``migrate`` (and its
+post-migrate content type and permission queries) entirely.
+"""
+
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+
+def pending_migrations(database=DEFAULT_DB_ALIAS):
+    """Return the list of (migration, backwards) steps that still need to run"""
+    executor = MigrationExecutor(connections[database])
+    targets = executor.loader.graph.leaf_nodes()
+    return executor.migration_plan(targets)
+
+
+def migrate_if_needed(database=DEFAULT_DB_ALIAS):
+    """Run migrate only when there are unapplied migrations. Returns True if it ran."""
+    if not pending_migrations(database):
+        return False
+    call_command('migrate', database=database, interactive=False)
+    return True
+
+
+def warm_up():
+    """Build the lazily-created caches every worker would otherwise build on its first request"""
+    from django.template.loader import get_template
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    for name in ('base.html', 'dashboard.html', 'registration/login.html'):
+        get_template(name)
+
+
+def close_connections():
+    """Close database connections (and pools) so they are not shared across forked workers"""
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+
+
+def open_connections():
+    """Open the default connection so the pool starts filling before the first request"""
+    connection = connections[DEFAULT_DB_ALIAS]
+    connection.ensure_connection()
+    connection.close()
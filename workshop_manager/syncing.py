@@ -0,0 +1,73 @@
+"""
+In-process indexes that each worker builds from the database and keeps current.
+
+A worker builds its index on first use and applies its own saves with signals.
+Changes made by *other* processes are picked up by a delta query for rows changed
+since the last sync, run at most once every ``SEARCH_SYNC_INTERVAL`` seconds, so
+most lookups never touch the database.
+
+A row's ``updated_at`` is set when it is saved but only becomes visible when its
+transaction commits, which may be after a sync that started later has run. Each
+sync therefore re-reads the ``SEARCH_SYNC_OVERLAP`` seconds before the previous
+one; rows read twice replace their own entry, as the index is keyed by pk.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+class DeltaSyncedIndex(ABC):
+    """
+    Base for an index with ``load_all()`` (the first build) and ``load_changed(since)``
+    (rows changed at or after ``since``, usually by ``updated_at``). Both replace a
+    row's entry by its pk, so a row loaded again is never counted twice. Subclasses
+    hold ``self.lock`` while changing the index; the queries run outside it, so
+    lookups carry on during a sync.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Held by the one thread building or syncing the index
+        self.sync_lock = threading.Lock()
+        self.built = False
+        self.synced_at = None
+        self.last_sync_check = 0.0
+
+    @abstractmethod
+    def load_all(self):
+        """Add every row to the (empty) index"""
+
+    @abstractmethod
+    def load_changed(self, since):
+        """Add or replace the rows changed at or after ``since``"""
+
+    def ensure_current(self):
+        """Build the index on first use, then apply other processes' changes at most every sync interval"""
+        if self.built:
+            if time.monotonic() - self.last_sync_check < settings.SEARCH_SYNC_INTERVAL:
+                return
+            # Another thread is already syncing; answer from the index as it is
+            if not self.sync_lock.acquire(blocking=False):
+                return
+        else:
+            # Nothing to answer from yet, so wait for the build
+            self.sync_lock.acquire()
+        try:
+            now = time.monotonic()
+            started = timezone.now()
+            if not self.built:
+                self.load_all()
+                self.built = True
+            elif now - self.last_sync_check >= settings.SEARCH_SYNC_INTERVAL:
+                self.load_changed(self.synced_at - timedelta(seconds=settings.SEARCH_SYNC_OVERLAP))
+            else:
+                return
+            self.synced_at = started
+            self.last_sync_check = now
+        finally:
+            self.sync_lock.release()
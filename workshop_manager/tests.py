@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+MANAGE_PY = Path(settings.BASE_DIR) / 'manage.py'
+
+REPLICA_SCRIPT = """
+from django.contrib.auth.models import User
+from django.test import Client
+from django.test.utils import setup_test_environment
+
+setup_test_environment()
+client = Client()
+client.force_login(User.objects.get(username='reader'))
+
+# The replica was copied before this job existed, so it only shows up when reading the primary
+response = client.post('/jobs/create/', {
+    'customer_name': 'Replica Customer',
+    'contact_number': '0820000000',
+    'vehicle_registration': 'REP001',
+    'vehicle_make': 'Toyota',
+    'vehicle_model': 'Corolla',
+    'work_type': 'repair',
+    'status': 'Pending',
+})
+assert response.status_code == 302, response.status_code
+print('pinned', 'db_pin' in response.cookies)
+print('after write', client.get('/').context['total_jobs'])
+del client.cookies['db_pin']
+print('replica', client.get('/').context['total_jobs'])
+"""
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    """Read from a second SQLite file standing in for the replica"""
+
+    def run_manage(self, env, *args):
+        process = subprocess.run(
+            [sys.executable, str(MANAGE_PY), *args],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(process.returncode, 0, process.stderr)
+        return process.stdout
+
+    def test_reads_follow_replica_until_client_writes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                'DATABASE_URL': '',
+                'SQLITE_PATH': os.path.join(tmp, 'primary.sqlite3'),
+                'DATABASE_REPLICA_URL': 'sqlite:///' + os.path.join(tmp, 'replica.sqlite3'),
+                'ALLOWED_HOSTS': 'testserver',
+            }
+            self.run_manage(env, 'migrate', '--noinput')
+            self.run_manage(env, 'shell', '-c', "from django.contrib.auth.models import User; User.objects.create_user('reader')")
+            self.run_manage(env, 'sync_sqlite_replica')
+            output = self.run_manage(env, 'shell', '--no-imports', '-c', REPLICA_SCRIPT).splitlines()
+
+        self.assertEqual(output, ['pinned True', 'after write 1', 'replica 0'])
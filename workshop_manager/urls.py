@@ -29,4 +29,11 @@ urlpatterns = [
     path('bookings/', include('bookings.urls')),
     path('absentees/', include('absentees.urls')),
     path('reports/', include('reports.urls')),
+    path('audit/', include('audit.urls')),
+    path('search/', include('search.urls')),
+    path('board/', include('board.urls')),
+    path('import/', include('importer.urls')),
+    path('customers/', include('customers.urls')),
+    path('vehicles/', include('vehicles.urls')),
+    path('assignments/', include('assignments.urls')),
 ]
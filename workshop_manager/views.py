@@ -2,9 +2,46 @@ from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from jobs.models import Job
 from inventory.models import Radiator
+from reports.rollups import daily_series
+from .routers import use_replica
+
+# Days shown in the dashboard chart
+CHART_DAYS = 90
+CHART_WIDTH = 900
+CHART_HEIGHT = 200
+# rollup column -> (legend label, line colour)
+CHART_SERIES = {
+    'jobs_received': ('Vehicle checkins received', '#4A90E2'),
+    'jobs_completed': ('Vehicle checkins completed', '#1F4E79'),
+    'radiators_received': ('Radiator checkins received', '#50C878'),
+    'radiators_completed': ('Radiator checkins completed', '#2E7D32'),
+}
+
+
+def _daily_chart(days):
+    """SVG polyline points for each rollup series over the last ``days`` days, scaled to the busiest day"""
+    series = daily_series(days)
+    peak = max([row[column] for row in series for column in CHART_SERIES] + [1])
+    step = CHART_WIDTH / max(days - 1, 1)
+    lines = []
+    for column, (label, colour) in CHART_SERIES.items():
+        points = ' '.join(
+            f'{i * step:.1f},{CHART_HEIGHT - row[column] / peak * CHART_HEIGHT:.1f}' for i, row in enumerate(series)
+        )
+        lines.append({'label': label, 'colour': colour, 'points': points, 'total': sum(row[column] for row in series)})
+    return {
+        'lines': lines,
+        'peak': peak,
+        'start': series[0]['day'],
+        'end': series[-1]['day'],
+        'width': CHART_WIDTH,
+        'height': CHART_HEIGHT,
+        'days': days,
+    }
 
 
 @login_required
+@use_replica
 def dashboard(request):
     """Dashboard view with quick stats and recent jobs"""
     total_jobs = Job.objects.count()
@@ -21,6 +58,8 @@ def dashboard(request):
         'completed_jobs': completed_jobs,
         'recent_jobs': recent_jobs,
         'recent_parts_orders': recent_parts_orders,
+        # Read from the daily rollups, never the job and parts order tables
+        'chart': _daily_chart(CHART_DAYS),
     }
     return render(request, 'dashboard.html', context)
 